@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import List, Optional
+from config import settings
+from domain.entities.activity_event import ActivityEvent
+from infrastructure.logging.activity_logger import ActivityLogger
+
+
+class AuditService:
+    """
+    Servicio de consulta del registro de actividad para administradores.
+    Filtra por usuario, tipo de evento y rango de fechas, y pagina por clave.
+    """
+
+    def __init__(self, logger: ActivityLogger) -> None:
+        """
+        Inicializa el servicio con sus dependencias.
+
+        Args:
+            logger (ActivityLogger): Sistema de registro de actividades.
+        """
+        self.logger = logger
+
+    def get_events_page(
+        self,
+        user_id: Optional[int] = None,
+        evento: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        antes_de: Optional[ActivityEvent] = None,
+        limit: Optional[int] = None,
+    ) -> List[ActivityEvent]:
+        """
+        Obtiene una página de eventos, del más reciente al más antiguo.
+
+        Args:
+            user_id (Optional[int]): Solo eventos de este usuario; None todos.
+            evento (Optional[str]): Solo eventos de este tipo; None o vacío todos.
+            desde (Optional[datetime]): Inicio del rango (incluido); None sin límite.
+            hasta (Optional[datetime]): Fin del rango (excluido); None sin límite.
+            antes_de (Optional[ActivityEvent]): Último evento de la página anterior.
+            limit (Optional[int]): Tamaño de la página; por defecto `AUDIT_PAGE_SIZE`.
+
+        Returns:
+            List[ActivityEvent]: Eventos de la página (vacía al llegar al final).
+
+        Raises:
+            ValueError: Si el rango de fechas está invertido.
+        """
+        if desde is not None and hasta is not None and desde >= hasta:
+            raise ValueError("La fecha inicial debe ser anterior a la final.")
+        return self.logger.query_page(
+            user_id,
+            evento or None,
+            desde,
+            hasta,
+            limit=limit or settings.AUDIT_PAGE_SIZE,
+            antes_de=antes_de,
+        )
@@ -1,50 +1,43 @@
 from __future__ import annotations
+import sqlite3
 from typing import Optional
-from infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
 from domain.entities.user import User
-
-
-def _hash_password(password: str) -> str:
-    """Hash de password con bcrypt. Import lazy para no romper imports cuando bcrypt no esté instalado."""
-    try:
-        import bcrypt
-    except ImportError as e:
-        raise RuntimeError(
-            "bcrypt no está instalado. Instala dependencias con `pip install -r requirements.txt`"
-        ) from e
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-    return hashed.decode("utf-8")
-
-
-def _verify_password(password: str, hashed: str) -> bool:
-    try:
-        import bcrypt
-    except ImportError as e:
-        raise RuntimeError(
-            "bcrypt no está instalado. Instala dependencias con `pip install -r requirements.txt`"
-        ) from e
-    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+from infrastructure.auth.auth_service import AuthService as LoginService
+from infrastructure.database.repositories.user_repository import UserRepository
 
 
 class AuthService:
-    def __init__(self, user_repo: SQLiteUserRepository):
+    """
+    Alta de usuarios y autenticación sobre `UserRepository`.
+    La verificación, el costo de bcrypt y el rehash al iniciar sesión son los de
+    `infrastructure.auth.auth_service.AuthService`, en el que delega.
+    """
+
+    def __init__(self, user_repo: UserRepository) -> None:
+        """
+        Args:
+            user_repo (UserRepository): Repositorio de usuarios (o una subclase,
+                como `SQLiteUserRepository`).
+        """
         self.user_repo = user_repo
+        self._login = LoginService(user_repo)
 
     def create_user(
         self, name: str, username: str, password: str, role: str = "usuario"
     ) -> User:
-        """Crear usuario con password hasheada."""
-        password_hash = _hash_password(password)
-        return self.user_repo.add_user(
-            name=name, username=username, password_hash=password_hash, role=role
-        )
-
-    def authenticate(
-        self, username: str, password: str
-    ) -> Optional[User]:  # ← Corregido typo: "authenticat e"
-        user = self.user_repo.get_by_username(username)
-        if not user:
-            return None
-        if _verify_password(password, user.password_hash):
-            return user
-        return None
+        """
+        Crea un usuario activo con la contraseña hasheada.
+
+        Raises:
+            ValueError: Si el username ya existe.
+        """
+        user = User(None, name, username, self._login.hash_password(password), role, True, None)
+        try:
+            user_id = self.user_repo.create(user)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Username ya existe: {username}") from e
+        return self.user_repo.get_by_id(user_id)
+
+    def authenticate(self, username: str, password: str) -> Optional[User]:
+        """Usuario activo con esas credenciales, o None."""
+        return self._login.login(username, password)
@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from config import settings
+
+_AUSENTE = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Contadores de la caché de lecturas."""
+    aciertos: int
+    fallos: int
+    invalidaciones: int
+    usuarios: int
+
+    @property
+    def consultas(self) -> int:
+        return self.aciertos + self.fallos
+
+
+class ReadingCache:
+    """
+    Caché read-through por usuario para las consultas de `ReadingService`.
+    Los usuarios se desalojan por LRU al superar `max_usuarios` y cada entrada
+    caduca a los `ttl` segundos. Es thread-safe: la carga se hace fuera del
+    candado y solo se guarda si el usuario no fue invalidado mientras tanto.
+    """
+
+    def __init__(
+        self,
+        max_usuarios: Optional[int] = None,
+        ttl: Optional[float] = None,
+        reloj: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_usuarios (Optional[int]): Usuarios en caché; por defecto `READING_CACHE_MAX_USERS`.
+            ttl (Optional[float]): Segundos de vida de cada entrada; por defecto `READING_CACHE_TTL_S`.
+            reloj (Callable[[], float]): Fuente de tiempo (inyectable en tests).
+        """
+        self.max_usuarios = max_usuarios if max_usuarios is not None else settings.READING_CACHE_MAX_USERS
+        self.ttl = ttl if ttl is not None else settings.READING_CACHE_TTL_S
+        self._reloj = reloj
+        self._lock = threading.Lock()
+        # user_id -> {clave: (caduca_en, valor)}, en orden de uso
+        self._usuarios: "OrderedDict[int, Dict[Hashable, Tuple[float, Any]]]" = OrderedDict()
+        # Generación global y versión por usuario: una carga concurrente con una
+        # invalidación no se guarda
+        self._generacion = 0
+        self._versiones: Dict[int, int] = {}
+        self._aciertos = 0
+        self._fallos = 0
+        self._invalidaciones = 0
+
+    def get(self, user_id: int, clave: Hashable, cargar: Callable[[], Any]) -> Any:
+        """
+        Devuelve el valor en caché o lo carga con `cargar()` y lo guarda.
+
+        Args:
+            user_id (int): Usuario al que pertenece el dato.
+            clave (Hashable): Identifica la consulta dentro del usuario.
+            cargar (Callable[[], Any]): Consulta a ejecutar en caso de fallo.
+        """
+        ahora = self._reloj()
+        with self._lock:
+            entradas = self._usuarios.get(user_id)
+            if entradas is not None:
+                caduca_en, valor = entradas.get(clave, (0.0, _AUSENTE))
+                if valor is not _AUSENTE and caduca_en > ahora:
+                    self._usuarios.move_to_end(user_id)
+                    self._aciertos += 1
+                    return valor
+            self._fallos += 1
+            version = (self._generacion, self._versiones.get(user_id, 0))
+
+        valor = cargar()
+        with self._lock:
+            if (self._generacion, self._versiones.get(user_id, 0)) == version:
+                self._guardar(user_id, clave, valor, self._reloj())
+        return valor
+
+    def put(self, user_id: int, clave: Hashable, valor: Any) -> None:
+        """Guarda (o reemplaza) un valor sin pasar por la carga."""
+        with self._lock:
+            self._guardar(user_id, clave, valor, self._reloj())
+
+    def peek(self, user_id: int, clave: Hashable, default: Any = None) -> Any:
+        """Valor vigente en caché o `default`, sin contar acierto ni fallo."""
+        with self._lock:
+            caduca_en, valor = self._usuarios.get(user_id, {}).get(clave, (0.0, default))
+            return valor if caduca_en > self._reloj() else default
+
+    def invalidate(self, user_id: int) -> None:
+        """Descarta todas las entradas de un usuario."""
+        with self._lock:
+            self._versiones[user_id] = self._versiones.get(user_id, 0) + 1
+            if self._usuarios.pop(user_id, None) is not None:
+                self._invalidaciones += 1
+
+    def clear(self) -> None:
+        """Descarta todas las entradas."""
+        with self._lock:
+            self._generacion += 1
+            self._invalidaciones += len(self._usuarios)
+            self._usuarios.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._aciertos, self._fallos, self._invalidaciones, len(self._usuarios))
+
+    def _guardar(self, user_id: int, clave: Hashable, valor: Any, ahora: float) -> None:
+        entradas = self._usuarios.setdefault(user_id, {})
+        entradas[clave] = (ahora + self.ttl, valor)
+        self._usuarios.move_to_end(user_id)
+        while len(self._usuarios) > self.max_usuarios:
+            self._usuarios.popitem(last=False)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+from domain.entities.reading import Reading
+
+# Tipos de cambio que emite ReadingService
+LECTURA_AGREGADA = "agregada"
+LECTURA_ELIMINADA = "eliminada"
+LECTURAS_RECARGADAS = "recargadas"  # cambios en lote: importación o re-tarificación
+
+
+@dataclass(frozen=True)
+class ReadingChange:
+    """
+    Cambio en las lecturas de un usuario.
+
+    Attributes:
+        tipo (str): LECTURA_AGREGADA, LECTURA_ELIMINADA o LECTURAS_RECARGADAS.
+        user_id (Optional[int]): Usuario afectado; None si afecta a todos.
+        reading (Optional[Reading]): Lectura agregada o eliminada (None en las recargas).
+    """
+    tipo: str
+    user_id: Optional[int]
+    reading: Optional[Reading] = None
+
+    def afecta(self, user_id: int) -> bool:
+        return self.user_id is None or self.user_id == user_id
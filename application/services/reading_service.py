@@ -1,15 +1,85 @@
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from domain.entities.monthly_summary import MonthlySummary
 from domain.entities.reading import Reading
-from infrastructure.database.repositories.reading_repository import ReadingRepository
+from infrastructure.database.repositories.reading_repository import PAGE_SIZE, ReadingRepository
+from infrastructure.database.repositories.tariff_repository import TariffRepository
+from infrastructure.database.repositories.user_repository import UserRepository
 from infrastructure.logging.activity_logger import ActivityLogger
-from application.services.tariff_calculator import TariffCalculator
+from application.services.reading_cache import CacheStats, ReadingCache
+from application.services.reading_events import (
+    LECTURA_AGREGADA,
+    LECTURA_ELIMINADA,
+    LECTURAS_RECARGADAS,
+    ReadingChange,
+)
+from application.services.tariff_calculator import DesgloseTramo
+from application.services.tariff_schedule_service import TariffScheduleService
+
+IMPORT_CHUNK_SIZE = 5000
+MAX_IMPORT_ERRORS = 100
+# Precisión del consumo en kWh: la misma al registrar, importar y re-tarificar en lote
+KWH_DECIMALES = 3
+_NO_CACHEADA = object()
+
+
+@dataclass
+class ImportResult:
+    """Estadísticas de una importación masiva de lecturas."""
+    leidas: int = 0
+    importadas: int = 0
+    rechazadas: int = 0
+    segundos: float = 0.0
+    motivos: Dict[str, int] = field(default_factory=dict)
+    errores: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.leidas / self.segundos if self.segundos > 0 else 0.0
+
+    def rechazar(self, fila: int, motivo: str, detalle: str) -> None:
+        """Cuenta una fila rechazada; solo se conservan los primeros mensajes."""
+        self.rechazadas += 1
+        self.motivos[motivo] = self.motivos.get(motivo, 0) + 1
+        if len(self.errores) < MAX_IMPORT_ERRORS:
+            self.errores.append((fila, detalle))
 
 
 class ReadingService:
-    def __init__(self, db_connection, logger: ActivityLogger) -> None:
+    def __init__(
+        self, db_connection, logger: ActivityLogger, cache: Optional[ReadingCache] = None
+    ) -> None:
         self.repository = ReadingRepository(db_connection)
+        self.user_repository = UserRepository(db_connection)
+        self.tariffs = TariffScheduleService(TariffRepository(db_connection))
         self.logger = logger
+        # Las vistas piden los mismos datos del usuario tras cada interacción
+        self.cache = cache if cache is not None else ReadingCache()
+        self._subscribers: List[Callable[[ReadingChange], None]] = []
+
+    def subscribe(self, callback: Callable[[ReadingChange], None]) -> None:
+        """
+        Registra un observador que recibe un `ReadingChange` tras cada escritura.
+        Se invoca en el hilo que hizo la escritura.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ReadingChange], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify(self, change: ReadingChange) -> None:
+        """Entrega el cambio a cada observador; el fallo de uno no afecta la escritura."""
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                print(f"[ERROR EVENTO] {change.tipo}: {e}", file=sys.stderr, flush=True)
 
     def register_reading(self, user_id: int, lectura_actual_str: str, lectura_anterior_str: str) -> Reading:
         """
@@ -24,19 +94,24 @@ class ReadingService:
             Reading: Entidad guardada.
 
         Raises:
-            ValueError: Si los valores no son numéricos o el consumo no es positivo.
+            ValueError: Si los valores no son numéricos, el consumo no es positivo
+                o tiene más de `KWH_DECIMALES` decimales.
         """
         try:
             lectura_actual = Decimal(lectura_actual_str.strip())
             lectura_anterior = Decimal(lectura_anterior_str.strip())
         except InvalidOperation as e:
             raise ValueError(f"Valores no numéricos: {e}")
+        if not lectura_actual.is_finite() or not lectura_anterior.is_finite():
+            raise ValueError("Las lecturas deben ser números finitos.")
 
         if lectura_actual <= lectura_anterior:
             raise ValueError("La lectura actual debe ser mayor que la anterior.")
 
         consumo = lectura_actual - lectura_anterior
-        costo = TariffCalculator.calcular_costo(consumo)
+        if _decimales(consumo) > KWH_DECIMALES:
+            raise ValueError(f"El consumo admite como máximo {KWH_DECIMALES} decimales de kWh.")
+        costo = self.tariffs.calcular_costo(consumo)
 
         reading = Reading(
             id=0,
@@ -49,21 +124,282 @@ class ReadingService:
         )
 
         saved = self.repository.save(reading)
+        self._cache_saved_reading(saved)
         self.logger.log_event(user_id, "registro_lectura", f"consumo: {consumo} kWh, costo: {costo} CUP")
+        self._notify(ReadingChange(LECTURA_AGREGADA, user_id, saved))
         return saved
 
-    def get_all_readings_by_user(self, user_id: int) -> List[Reading]:
-        return self.repository.get_by_user_id(user_id)
+    def import_readings(
+        self, rows: Iterable[Mapping[str, Any]], chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> ImportResult:
+        """
+        Importa lecturas en streaming: valida cada fila, tarifica por bloques en lote
+        e inserta cada bloque con `executemany` dentro de una sola transacción.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Filas con `usuario_id`, `lectura_anterior`,
+                `lectura_actual` y, opcionalmente, `fecha` (ISO 8601).
+            chunk_size (int): Filas válidas por bloque/transacción.
+
+        Returns:
+            ImportResult: Filas leídas, importadas, rechazadas (con motivos) y rendimiento.
+        """
+        inicio = time.perf_counter()
+        result = ImportResult()
+        por_usuario: Counter = Counter()
+        bloque: List[Tuple[int, Reading]] = []
+
+        for fila, row in enumerate(rows, start=1):
+            result.leidas += 1
+            reading = self._parse_import_row(fila, row, result)
+            if reading is not None:
+                bloque.append((fila, reading))
+            if len(bloque) >= chunk_size:
+                self._import_chunk(bloque, result, por_usuario)
+                bloque = []
+        if bloque:
+            self._import_chunk(bloque, result, por_usuario)
+
+        result.segundos = time.perf_counter() - inicio
+        for user_id, cantidad in por_usuario.items():
+            self.cache.invalidate(user_id)
+            self.logger.log_event(user_id, "importacion_lecturas", f"{cantidad} lecturas importadas")
+            self._notify(ReadingChange(LECTURAS_RECARGADAS, user_id))
+        return result
+
+    def _parse_import_row(
+        self, fila: int, row: Mapping[str, Any], result: ImportResult
+    ) -> Optional[Reading]:
+        """Valida una fila de importación; las inválidas se registran en `result`."""
+        try:
+            user_id = int(str(row.get("usuario_id", "")).strip())
+            lectura_actual = Decimal(str(row.get("lectura_actual", "")).strip())
+            lectura_anterior = Decimal(str(row.get("lectura_anterior", "")).strip())
+        except (ValueError, InvalidOperation):
+            result.rechazar(fila, "valor_no_numerico", f"Fila {fila}: valores no numéricos.")
+            return None
+
+        if user_id <= 0:
+            result.rechazar(fila, "usuario_invalido", f"Fila {fila}: usuario {user_id} inválido.")
+            return None
+        if not lectura_actual.is_finite() or not lectura_anterior.is_finite() or lectura_anterior < 0:
+            result.rechazar(fila, "valor_no_numerico", f"Fila {fila}: lecturas fuera de rango.")
+            return None
+        if lectura_actual <= lectura_anterior:
+            result.rechazar(
+                fila, "lectura_no_creciente",
+                f"Fila {fila}: la lectura actual debe ser mayor que la anterior.",
+            )
+            return None
+        consumo = lectura_actual - lectura_anterior
+        if _decimales(consumo) > KWH_DECIMALES:
+            result.rechazar(
+                fila, "demasiados_decimales", f"Fila {fila}: más de {KWH_DECIMALES} decimales de kWh."
+            )
+            return None
+
+        fecha = None
+        fecha_str = str(row.get("fecha") or "").strip()
+        if fecha_str:
+            try:
+                fecha = datetime.fromisoformat(fecha_str)
+                if fecha.tzinfo is not None:
+                    fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+            except ValueError:
+                result.rechazar(fila, "fecha_invalida", f"Fila {fila}: fecha '{fecha_str}' inválida.")
+                return None
+
+        return Reading(
+            id=None,
+            user_id=user_id,
+            lectura_actual=lectura_actual,
+            lectura_anterior=lectura_anterior,
+            consumo=consumo,
+            costo=Decimal("0.00"),
+            fecha=fecha,
+        )
+
+    def _import_chunk(
+        self, bloque: List[Tuple[int, Reading]], result: ImportResult, por_usuario: Counter
+    ) -> None:
+        """Descarta usuarios inexistentes, tarifica el bloque en lote y lo inserta."""
+        activos = self.user_repository.get_active_ids(r.user_id for _, r in bloque)
+        readings: List[Reading] = []
+        for fila, reading in bloque:
+            if reading.user_id in activos:
+                readings.append(reading)
+            else:
+                result.rechazar(
+                    fila, "usuario_invalido",
+                    f"Fila {fila}: el usuario {reading.user_id} no existe o está inactivo.",
+                )
+        if not readings:
+            return
+
+        ahora = datetime.now(timezone.utc).replace(tzinfo=None)
+        costos = self.tariffs.calcular_costos(
+            [r.consumo for r in readings], [r.fecha or ahora for r in readings]
+        )
+        for reading, centavos in zip(readings, costos):
+            reading.costo = Decimal(int(centavos)).scaleb(-2)
+
+        result.importadas += self.repository.save_many(readings)
+        por_usuario.update(r.user_id for r in readings)
+
+    def _cache_saved_reading(self, saved: Reading) -> None:
+        """
+        Invalida la caché del usuario tras guardar una lectura, conservando
+        como última lectura la recién guardada si sigue siendo la más reciente.
+        """
+        last = self.cache.peek(saved.user_id, "ultima", _NO_CACHEADA)
+        self.cache.invalidate(saved.user_id)
+        if last is _NO_CACHEADA:
+            return
+        if last is None or (saved.fecha, saved.id) >= (last.fecha, last.id):
+            self.cache.put(saved.user_id, "ultima", saved)
+
+    def cache_stats(self) -> CacheStats:
+        """Aciertos, fallos e invalidaciones de la caché de lecturas."""
+        return self.cache.stats()
+
+    def get_all_readings_by_user(
+        self, user_id: int, columns: Optional[Sequence[str]] = None
+    ) -> List[Reading]:
+        clave = ("lecturas", tuple(columns) if columns is not None else None)
+        readings = self.cache.get(
+            user_id, clave, lambda: self.repository.get_by_user_id(user_id, columns)
+        )
+        # Copia: quien llama puede reordenar la lista sin alterar la caché
+        return list(readings)
+
+    def get_readings_page(
+        self,
+        user_id: int,
+        before_fecha: Optional[datetime] = None,
+        limit: int = PAGE_SIZE,
+        before_id: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Reading]:
+        return self.repository.get_page(user_id, before_fecha, limit, before_id, columns)
+
+    def iter_readings_by_user(
+        self, user_id: int, batch_size: int = PAGE_SIZE, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Reading]:
+        return self.repository.iter_by_user(user_id, batch_size, columns)
+
+    def get_monthly_summary(
+        self, user_id: int, desde: Optional[datetime] = None, hasta: Optional[datetime] = None
+    ) -> List[MonthlySummary]:
+        summary = self.cache.get(
+            user_id, ("resumen", desde, hasta),
+            lambda: self.repository.monthly_summary(user_id, desde, hasta),
+        )
+        return list(summary)
+
+    def get_reading_date_range(self, user_id: int) -> Optional[Tuple[datetime, datetime]]:
+        return self.cache.get(user_id, "rango_fechas", lambda: self.repository.date_range(user_id))
+
+    def get_consumption_series(
+        self, user_id: int, desde: datetime, hasta: datetime, max_puntos: int
+    ) -> List[Tuple[datetime, float]]:
+        # Sin caché: cada zoom o desplazamiento pide un rango distinto y la consulta ya está acotada
+        return self.repository.consumption_series(user_id, desde, hasta, max_puntos)
 
     def get_last_reading_by_user(self, user_id: int) -> Optional[Reading]:
-        return self.repository.get_last_by_user(user_id)
+        return self.cache.get(user_id, "ultima", lambda: self.repository.get_last_by_user(user_id))
+
+    def get_cost_breakdown(self, reading: Reading) -> Tuple[DesgloseTramo, ...]:
+        """Desglose por tramos del costo de una lectura, con la tarifa vigente en su fecha."""
+        return self.tariffs.desglose(reading.consumo, reading.fecha)
+
+    def get_cached_cost_breakdown(self, reading: Reading) -> Optional[Tuple[DesgloseTramo, ...]]:
+        """
+        Como `get_cost_breakdown`, pero sin consultar la base: None si las
+        tarifas aún no están compiladas (ver `preload_tariffs`).
+        """
+        if not self.tariffs.compiladas:
+            return None
+        return self.tariffs.desglose(reading.consumo, reading.fecha)
+
+    def preload_tariffs(self) -> None:
+        """Carga y compila las tarifas, para llamarlo fuera del hilo de la interfaz."""
+        self.tariffs.precargar()
+
+    def reprice_readings(self, user_id: Optional[int] = None) -> int:
+        """
+        Re-tarifica en lote las lecturas guardadas con la tarifa vigente en su fecha.
+
+        Args:
+            user_id (Optional[int]): Limita a un usuario; None re-tarifica todas.
+
+        Returns:
+            int: Cantidad de lecturas cuyo costo cambió.
+        """
+        rows = self.repository.get_pricing_rows(user_id)
+        if not rows:
+            return 0
+        ids, consumos, fechas, costos = zip(*rows)
+        nuevos = self._reprice(consumos, fechas)
+        updates = [
+            (Decimal(int(centavos)).scaleb(-2), reading_id)
+            for reading_id, costo, centavos in zip(ids, costos, nuevos)
+            if Decimal(str(costo)).quantize(Decimal("0.01")) != Decimal(int(centavos)).scaleb(-2)
+        ]
+        self.repository.update_costs(updates)
+        if updates:
+            self.cache.clear()
+            self._notify(ReadingChange(LECTURAS_RECARGADAS, user_id))
+        return len(updates)
+
+    def _reprice(self, consumos: Sequence, fechas: Sequence) -> List[int]:
+        """
+        Costos en centavos, en lote. Las lecturas guardadas antes de limitar la
+        precisión pueden tener más de `KWH_DECIMALES` decimales: esas se tarifican
+        por la ruta escalar en Decimal en lugar de hacer fallar todo el lote.
+        """
+        try:
+            return [int(c) for c in self.tariffs.calcular_costos(consumos, fechas, KWH_DECIMALES)]
+        except ValueError:
+            pass
+        exactos = [Decimal(str(c)) for c in consumos]
+        en_lote = [i for i, c in enumerate(exactos) if _decimales(c) <= KWH_DECIMALES]
+        nuevos = [
+            int(self.tariffs.calcular_costo(consumo, fecha).scaleb(2))
+            if _decimales(consumo) > KWH_DECIMALES else 0
+            for consumo, fecha in zip(exactos, fechas)
+        ]
+        if en_lote:
+            costos = self.tariffs.calcular_costos(
+                [consumos[i] for i in en_lote], [fechas[i] for i in en_lote], KWH_DECIMALES
+            )
+            for i, centavos in zip(en_lote, costos):
+                nuevos[i] = int(centavos)
+        return nuevos
+
+    def readings_deleted_for_user(self, user_id: int) -> None:
+        """
+        Avisa que las lecturas del usuario se borraron por fuera del servicio
+        (p. ej. al eliminar el usuario): invalida su caché y notifica la recarga.
+        """
+        self.cache.invalidate(user_id)
+        self._notify(ReadingChange(LECTURAS_RECARGADAS, user_id))
 
     def delete_reading(self, reading_id: int) -> None:
         reading = self.repository.get_by_id(reading_id)
         if reading:
             self.repository.delete(reading_id)
+            self.cache.invalidate(reading.user_id)
             self.logger.log_event(
                 reading.user_id,
                 "eliminacion_lectura",
                 f"Lectura ID {reading_id} eliminada"
-            )
\ No newline at end of file
+            )
+            self._notify(ReadingChange(LECTURA_ELIMINADA, reading.user_id, reading))
+
+
+def _decimales(valor: Decimal) -> int:
+    """Decimales significativos de `valor` (`Decimal("1.500")` -> 1)."""
+    if not valor.is_finite():
+        # El exponente de Infinity y NaN es una letra, no un número
+        raise ValueError(f"Valor no finito: {valor}.")
+    return max(0, -valor.normalize().as_tuple().exponent)
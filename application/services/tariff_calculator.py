@@ -1,5 +1,210 @@
+from bisect import bisect_right
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CENTAVO = Decimal('0.01')
+INFINITO = Decimal('Infinity')
+DESGLOSE_CACHE_SIZE = 4096
+
+
+def _importar_numpy():
+    """Import lazy de numpy: solo lo necesita el cálculo en lote."""
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise RuntimeError(
+            "numpy no está instalado. Instala dependencias con `pip install -r requirements.txt`"
+        ) from e
+    return np
+
+
+def _unidades_exactas(consumos: Sequence, decimales: int) -> List[int]:
+    """
+    Consumos en unidades de 10**-decimales kWh, escalados en Decimal (sin pasar
+    por float64, que pierde dígitos en consumos grandes).
+
+    Raises:
+        ValueError: Si algún consumo no es finito o tiene más decimales de los admitidos.
+    """
+    escala = Decimal(10) ** decimales
+    unidades = []
+    for consumo in consumos:
+        valor = consumo if isinstance(consumo, Decimal) else Decimal(str(consumo))
+        if not valor.is_finite():
+            raise ValueError(f"Consumo no finito: {consumo}.")
+        escalado = valor * escala
+        if escalado != escalado.to_integral_value():
+            raise ValueError(f"Los consumos admiten como máximo {decimales} decimales.")
+        unidades.append(int(escalado))
+    return unidades
+
+
+@dataclass(frozen=True)
+class DesgloseTramo:
+    """Consumo y costo facturados dentro de un tramo."""
+    tramo_min: Decimal
+    tramo_max: Decimal
+    tarifa: Decimal
+    consumo: Decimal
+    costo: Decimal
+
+
+class TablaTarifaria:
+    """
+    Definición de tramos compilada a una tabla acumulada.
+    Guarda, para cada tramo, el consumo y el costo acumulados al llegar a su
+    límite inferior, de modo que calcular un costo no recorre los tramos.
+    """
+
+    def __init__(self, tramos: Sequence[Tuple[Decimal, Decimal, Decimal]]) -> None:
+        """
+        Compila la tabla a partir de los tramos (mínimo, máximo, tarifa).
+
+        Args:
+            tramos (Sequence): Tramos ordenados; el último puede tener máximo infinito.
+        """
+        self.tramos: Tuple[Tuple[Decimal, Decimal, Decimal], ...] = tuple(tramos)
+        self.limites: List[Decimal] = []
+        self.acumulados: List[Decimal] = []
+        self.tarifas: List[Decimal] = []
+        self.anchos: List[Optional[Decimal]] = []
+        self._tablas_lote: Dict[int, tuple] = {}
+        # Las lecturas se concentran en kWh enteros: memoizar el desglose rinde mucho
+        self._desglose_cacheado = lru_cache(maxsize=DESGLOSE_CACHE_SIZE)(self._desglose)
+
+        limite = Decimal('0')
+        acumulado = Decimal('0.00')
+        for tramo_min, tramo_max, tarifa in self.tramos:
+            ancho = None if tramo_max == INFINITO else tramo_max - tramo_min + 1
+            self.limites.append(limite)
+            self.acumulados.append(acumulado)
+            self.tarifas.append(tarifa)
+            self.anchos.append(ancho)
+            if ancho is not None:
+                limite += ancho
+                acumulado += ancho * tarifa
+
+    def indice_tramo(self, consumo_kwh: Decimal) -> int:
+        """Índice del tramo en el que cae el último kWh de `consumo_kwh` (> 0)."""
+        return bisect_right(self.limites, consumo_kwh) - 1
+
+    def calcular_costo(self, consumo_kwh: Decimal) -> Decimal:
+        """
+        Calcula el costo total con un bisect y una multiplicación-suma.
+
+        Args:
+            consumo_kwh (Decimal): Consumo total en kWh.
+
+        Returns:
+            Decimal: Costo total en CUP, redondeado a 2 decimales.
+        """
+        if consumo_kwh <= 0:
+            return Decimal('0.00')
+        i = self.indice_tramo(consumo_kwh)
+        costo = self.acumulados[i] + (consumo_kwh - self.limites[i]) * self.tarifas[i]
+        return costo.quantize(CENTAVO)
+
+    def desglose(self, consumo_kwh: Decimal) -> Tuple[DesgloseTramo, ...]:
+        """
+        Desglose por tramos del consumo, memoizado en una caché LRU acotada.
+
+        Args:
+            consumo_kwh (Decimal): Consumo total en kWh.
+
+        Returns:
+            Tuple[DesgloseTramo, ...]: Un elemento por tramo con consumo; vacío si
+            el consumo no es positivo. Los costos no están redondeados: su suma
+            redondeada a centavos es `calcular_costo(consumo_kwh)`.
+        """
+        return self._desglose_cacheado(consumo_kwh)
+
+    def desglose_cache_info(self):
+        """Estadísticas (hits, misses, tamaño) de la caché de desgloses."""
+        return self._desglose_cacheado.cache_info()
+
+    def _desglose(self, consumo_kwh: Decimal) -> Tuple[DesgloseTramo, ...]:
+        if consumo_kwh <= 0:
+            return ()
+        ultimo = self.indice_tramo(consumo_kwh)
+        resultado = []
+        for i in range(ultimo + 1):
+            tramo_min, tramo_max, tarifa = self.tramos[i]
+            if i < ultimo:
+                consumo = self.anchos[i]
+                costo = self.acumulados[i + 1] - self.acumulados[i]
+            else:
+                consumo = consumo_kwh - self.limites[i]
+                costo = consumo * tarifa
+            resultado.append(DesgloseTramo(tramo_min, tramo_max, tarifa, consumo, costo))
+        return tuple(resultado)
+
+    def calcular_costos(self, consumos: Sequence, decimales: int = 3):
+        """
+        Calcula en lote el costo de muchos consumos (re-facturación masiva).
+
+        Trabaja en aritmética entera sobre la tabla acumulada, con una búsqueda
+        `searchsorted` por consumo. El redondeo a centavos es el mismo (mitad al
+        par) que usa `calcular_costo`, por lo que el resultado coincide centavo
+        a centavo con la ruta escalar.
+
+        Args:
+            consumos (Sequence): Consumos en kWh (Decimal, int, float o str).
+            decimales (int): Decimales de kWh admitidos en la entrada.
+
+        Returns:
+            np.ndarray: Costos en centavos de CUP (int64), uno por consumo.
+
+        Raises:
+            ValueError: Si algún consumo no es finito, tiene más decimales de los
+                admitidos o desborda la aritmética en int64.
+        """
+        np = _importar_numpy()
+        limites, acumulados, tarifas, divisor = self._tabla_lote(decimales)
+
+        exactas = _unidades_exactas(consumos, decimales)
+        if exactas and max(exactas) * int(tarifas.max()) + int(acumulados[-1]) >= 2 ** 63:
+            raise ValueError("Consumo demasiado grande para el cálculo en lote.")
+        unidades = np.maximum(np.array(exactas, dtype=np.int64), 0)
+
+        idx = np.searchsorted(limites, unidades, side="right") - 1
+        costo = acumulados[idx] + (unidades - limites[idx]) * tarifas[idx]
+
+        # Redondeo mitad al par, igual que Decimal.quantize con el contexto por defecto
+        cociente, resto = np.divmod(costo, divisor)
+        doble = resto * 2
+        sube = (doble > divisor) | ((doble == divisor) & (cociente % 2 == 1))
+        return cociente + sube
+
+    def _tabla_lote(self, decimales: int) -> tuple:
+        """
+        Versión entera de la tabla (una sola vez por `decimales`) para el cálculo en lote.
+
+        Returns:
+            tuple: (límites inferiores, costo acumulado en cada límite, tarifa
+            por unidad, divisor a centavos), los tres primeros como np.ndarray.
+        """
+        tabla = self._tablas_lote.get(decimales)
+        if tabla is not None:
+            return tabla
+
+        np = _importar_numpy()
+        escala_kwh = 10 ** decimales
+        decimales_tarifa = max(2, max(-t.as_tuple().exponent for t in self.tarifas))
+        escala_tarifa = 10 ** decimales_tarifa
+
+        tabla = (
+            np.array([int(limite * escala_kwh) for limite in self.limites], dtype=np.int64),
+            np.array(
+                [int(a * escala_kwh * escala_tarifa) for a in self.acumulados],
+                dtype=np.int64,
+            ),
+            np.array([int(t * escala_tarifa) for t in self.tarifas], dtype=np.int64),
+            10 ** (decimales + decimales_tarifa - 2),
+        )
+        self._tablas_lote[decimales] = tabla
+        return tabla
 
 
 class TariffCalculator:
@@ -21,6 +226,20 @@ class TariffCalculator:
         (Decimal('501'), Decimal('Infinity'), Decimal('25.00')),
     ]
 
+    _tabla_compilada: Optional[TablaTarifaria] = None
+    _tramos_compilados: Optional[list] = None
+
+    @classmethod
+    def tabla(cls) -> TablaTarifaria:
+        """
+        Tabla acumulada de `TRAMOS`, compilada una sola vez.
+        Se recompila si `TRAMOS` se reemplaza por otra lista.
+        """
+        if cls._tramos_compilados is not cls.TRAMOS:
+            TariffCalculator._tabla_compilada = TablaTarifaria(cls.TRAMOS)
+            TariffCalculator._tramos_compilados = cls.TRAMOS
+        return cls._tabla_compilada
+
     @staticmethod
     def calcular_costo(consumo_kwh: Decimal) -> Decimal:
         """
@@ -32,23 +251,31 @@ class TariffCalculator:
         Returns:
             Decimal: Costo total en CUP, redondeado a 2 decimales.
         """
-        if consumo_kwh <= 0:
-            return Decimal('0.00')
+        return TariffCalculator.tabla().calcular_costo(consumo_kwh)
+
+    @staticmethod
+    def calcular_costos(consumos: Sequence, decimales: int = 3):
+        """
+        Calcula en lote el costo de muchos consumos. Ver `TablaTarifaria.calcular_costos`.
 
-        costo_total = Decimal('0.00')
-        consumo_restante = consumo_kwh
+        Args:
+            consumos (Sequence): Consumos en kWh (Decimal, int, float o str).
+            decimales (int): Decimales de kWh admitidos en la entrada.
 
-        for tramo_min, tramo_max, tarifa in TariffCalculator.TRAMOS:
-            if consumo_restante <= 0:
-                break
+        Returns:
+            np.ndarray: Costos en centavos de CUP (int64), uno por consumo.
+        """
+        return TariffCalculator.tabla().calcular_costos(consumos, decimales)
 
-            if tramo_max == Decimal('Infinity'):
-                consumo_en_tramo = consumo_restante
-            else:
-                max_en_tramo = tramo_max - tramo_min + 1
-                consumo_en_tramo = min(consumo_restante, max_en_tramo)
+    @staticmethod
+    def desglose(consumo_kwh: Decimal) -> Tuple[DesgloseTramo, ...]:
+        """
+        Desglose por tramos (kWh y CUP de cada tramo), memoizado por consumo.
 
-            costo_total += consumo_en_tramo * tarifa
-            consumo_restante -= consumo_en_tramo
+        Args:
+            consumo_kwh (Decimal): Consumo total en kWh.
 
-        return costo_total.quantize(Decimal('0.01'))
\ No newline at end of file
+        Returns:
+            Tuple[DesgloseTramo, ...]: Un elemento por tramo con consumo.
+        """
+        return TariffCalculator.tabla().desglose(consumo_kwh)
@@ -0,0 +1,191 @@
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+from domain.entities.tariff_schedule import TariffSchedule
+from infrastructure.database.repositories.tariff_repository import TariffRepository
+from application.services.tariff_calculator import (
+    DesgloseTramo,
+    TablaTarifaria,
+    TariffCalculator,
+    _importar_numpy,
+)
+
+
+def _como_fecha(fecha: date | datetime | None) -> date:
+    """Normaliza a `date`; None es hoy (UTC, como CURRENT_TIMESTAMP de SQLite)."""
+    if fecha is None:
+        return datetime.now(timezone.utc).date()
+    if isinstance(fecha, datetime):
+        return fecha.date()
+    return fecha
+
+
+class TariffScheduleService:
+    """
+    Servicio de tarifas versionadas por fecha de vigencia.
+    Cada tarifa se compila una sola vez a una `TablaTarifaria` que se mantiene
+    en memoria; la tarifa aplicable a una fecha se localiza por búsqueda binaria
+    sobre las fechas de vigencia. Antes de la primera vigencia, o si no hay
+    tarifas guardadas, se aplica `TariffCalculator.TRAMOS`.
+    """
+
+    def __init__(self, repository: TariffRepository) -> None:
+        """
+        Inicializa el servicio con su repositorio.
+
+        Args:
+            repository (TariffRepository): Repositorio de tarifas.
+        """
+        self.repository = repository
+        self._lock = threading.Lock()
+        self._schedules: Optional[List[TariffSchedule]] = None
+        self._vigencias: List[date] = []
+        self._tablas: List[TablaTarifaria] = []
+        self._vigencias_np = None
+
+    def get_schedules(self) -> List[TariffSchedule]:
+        """
+        Obtiene las tarifas guardadas, de la más antigua a la más reciente.
+
+        Returns:
+            List[TariffSchedule]: Tarifas versionadas.
+        """
+        self._compilar()
+        return list(self._schedules)
+
+    def add_schedule(
+        self, nombre: str, vigente_desde: date, tramos: Sequence[Tuple[Decimal, Decimal, Decimal]]
+    ) -> TariffSchedule:
+        """
+        Guarda una nueva tarifa y descarta las tablas compiladas.
+
+        Args:
+            nombre (str): Nombre descriptivo de la tarifa.
+            vigente_desde (date): Primer día en que aplica.
+            tramos (Sequence): Tramos (mínimo, máximo, tarifa); el último sin límite.
+
+        Returns:
+            TariffSchedule: Tarifa guardada.
+
+        Raises:
+            ValueError: Si los tramos son inválidos o la vigencia ya existe.
+        """
+        tramos = list(tramos)
+        if not tramos:
+            raise ValueError("La tarifa debe tener al menos un tramo.")
+        for tramo_min, tramo_max, tarifa in tramos:
+            if tramo_max < tramo_min or tarifa < 0:
+                raise ValueError(f"Tramo inválido: {tramo_min}-{tramo_max} a {tarifa}.")
+        if not tramos[-1][1].is_infinite():
+            raise ValueError("El último tramo debe ser ilimitado.")
+
+        saved = self.repository.save(
+            TariffSchedule(id=None, nombre=nombre, vigente_desde=vigente_desde, tramos=tramos)
+        )
+        self.reload()
+        return saved
+
+    @property
+    def compiladas(self) -> bool:
+        """True si las tarifas ya están en memoria: `desglose` no consultará la base."""
+        return self._schedules is not None
+
+    def precargar(self) -> None:
+        """Compila las tarifas ahora (p. ej. desde un hilo de fondo) si aún no lo están."""
+        self._compilar()
+
+    def reload(self) -> None:
+        """Descarta las tablas compiladas; se recompilan en el próximo uso."""
+        with self._lock:
+            self._schedules = None
+
+    def tabla_para(self, fecha: date | datetime | None = None) -> TablaTarifaria:
+        """
+        Tabla compilada de la tarifa vigente en `fecha`.
+
+        Args:
+            fecha (date | datetime | None): Fecha de la lectura; None es hoy.
+
+        Returns:
+            TablaTarifaria: Tabla de la tarifa aplicable.
+        """
+        self._compilar()
+        i = bisect_right(self._vigencias, _como_fecha(fecha)) - 1
+        return self._tablas[i] if i >= 0 else TariffCalculator.tabla()
+
+    def calcular_costo(self, consumo_kwh: Decimal, fecha: date | datetime | None = None) -> Decimal:
+        """
+        Costo de un consumo con la tarifa vigente en `fecha`.
+
+        Args:
+            consumo_kwh (Decimal): Consumo en kWh.
+            fecha (date | datetime | None): Fecha de la lectura; None es hoy.
+
+        Returns:
+            Decimal: Costo total en CUP, redondeado a 2 decimales.
+        """
+        return self.tabla_para(fecha).calcular_costo(consumo_kwh)
+
+    def desglose(
+        self, consumo_kwh: Decimal, fecha: date | datetime | None = None
+    ) -> Tuple[DesgloseTramo, ...]:
+        """Desglose por tramos con la tarifa vigente en `fecha`."""
+        return self.tabla_para(fecha).desglose(consumo_kwh)
+
+    def calcular_costos(self, consumos: Sequence, fechas: Sequence, decimales: int = 3):
+        """
+        Re-tarifica en lote: cada consumo con la tarifa vigente en su fecha.
+
+        La tarifa de cada lectura se localiza con `searchsorted` sobre las
+        vigencias y cada grupo se calcula con `TablaTarifaria.calcular_costos`.
+
+        Args:
+            consumos (Sequence): Consumos en kWh.
+            fechas (Sequence): Fecha (date o datetime) de cada consumo.
+            decimales (int): Decimales de kWh admitidos en la entrada.
+
+        Returns:
+            np.ndarray: Costos en centavos de CUP (int64), uno por consumo.
+
+        Raises:
+            ValueError: Si `consumos` y `fechas` no tienen la misma longitud.
+        """
+        np = _importar_numpy()
+        if len(consumos) != len(fechas):
+            raise ValueError("consumos y fechas deben tener la misma longitud.")
+        self._compilar()
+
+        # dtype=object conserva los Decimal: la tabla los escala sin pasar por float64
+        consumos_np = np.asarray(consumos, dtype=object)
+        if not self._tablas:
+            return TariffCalculator.tabla().calcular_costos(consumos_np, decimales)
+
+        dias = np.array(fechas, dtype="datetime64[us]").astype("datetime64[D]")
+        indices = np.searchsorted(self._vigencias_np, dias, side="right") - 1
+        costos = np.zeros(len(consumos_np), dtype=np.int64)
+        for i in np.unique(indices):
+            grupo = indices == i
+            tabla = self._tablas[i] if i >= 0 else TariffCalculator.tabla()
+            costos[grupo] = tabla.calcular_costos(consumos_np[grupo], decimales)
+        return costos
+
+    def _compilar(self) -> None:
+        """Carga y compila las tarifas la primera vez que se necesitan."""
+        if self._schedules is not None:
+            return
+        with self._lock:
+            if self._schedules is not None:
+                return
+            schedules = self.repository.get_all()
+            self._vigencias = [s.vigente_desde for s in schedules]
+            self._tablas = [TablaTarifaria(s.tramos) for s in schedules]
+            self._vigencias_np = None
+            if schedules:
+                try:
+                    np = _importar_numpy()
+                    self._vigencias_np = np.array(self._vigencias, dtype="datetime64[D]")
+                except RuntimeError:
+                    pass  # Solo el cálculo en lote necesita numpy
+            self._schedules = schedules
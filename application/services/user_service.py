@@ -1,8 +1,14 @@
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 from domain.entities.user import User
 from infrastructure.database.repositories.user_repository import UserRepository
 from infrastructure.logging.activity_logger import ActivityLogger
 
+if TYPE_CHECKING:
+    from application.services.reading_service import ReadingService
+
+# Columnas de los listados: no hace falta cargar `password_hash`
+USER_LIST_COLUMNS = ("id", "nombre", "username", "rol", "activo", "fecha_creacion")
+
 
 class UserService:
     """
@@ -11,25 +17,33 @@ class UserService:
     delegando persistencia al repositorio y registrando eventos.
     """
 
-    def __init__(self, user_repository: UserRepository, logger: ActivityLogger) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        logger: ActivityLogger,
+        reading_service: Optional["ReadingService"] = None,
+    ) -> None:
         """
         Inicializa el servicio con sus dependencias.
 
         Args:
             user_repository (UserRepository): Repositorio para operaciones CRUD.
             logger (ActivityLogger): Sistema de registro de actividades.
+            reading_service (Optional[ReadingService]): Servicio de lecturas cuya
+                caché y observadores se avisan al borrar las lecturas de un usuario.
         """
         self.user_repository = user_repository
         self.logger = logger
+        self.reading_service = reading_service
 
     def get_all_users(self) -> List[User]:
         """
         Obtiene todos los usuarios activos.
 
         Returns:
-            List[User]: Lista de usuarios activos.
+            List[User]: Lista de usuarios activos (sin `password_hash`).
         """
-        users = self.user_repository.get_all_active()
+        users = self.user_repository.get_all_active(columns=USER_LIST_COLUMNS)
         return users
 
     def delete_user(self, user_id: int) -> None:
@@ -50,7 +64,10 @@ class UserService:
         if not user:
             raise ValueError("Usuario no encontrado.")
 
+        # Usuario y lecturas se borran en una sola transacción; luego se avisa al servicio de lecturas
         self.user_repository.delete(user_id)
+        if self.reading_service is not None:
+            self.reading_service.readings_deleted_for_user(user_id)
         self.logger.log_event(
             user_id=user_id,
             event="eliminacion_usuario",
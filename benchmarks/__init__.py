@@ -0,0 +1 @@
+"""Benchmarks de rendimiento (scripts ejecutables, no forman parte de los tests)."""
@@ -0,0 +1,79 @@
+"""
+Consultas de auditoría sobre el registro de actividad: almacén CSV rotado
+(lee todos los segmentos del usuario) frente a la tabla `eventos` indexada.
+
+Uso:
+    python -m benchmarks.bench_audit_queries [--eventos 500000] [--usuarios 200]
+
+Mide la primera página de un usuario, la de un tipo de evento y el recorrido
+de todas las páginas de un usuario en cada almacén.
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from infrastructure.database.connection import init_db
+from infrastructure.database.pool import ConnectionPool
+from infrastructure.logging.activity_logger import ActivityLogger
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+
+EVENTOS = ("login", "registro_lectura", "importacion_lecturas", "eliminacion_usuario")
+
+
+def _llenar(logger: ActivityLogger, eventos: int, usuarios: int) -> None:
+    inicio = datetime(2024, 1, 1)
+    for i in range(eventos):
+        logger._cola.put((
+            (inicio + timedelta(seconds=30 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+            1 + i % usuarios, EVENTOS[i % 7 % len(EVENTOS)], f"detalle {i}",
+        ))
+        if i % 10000 == 0:
+            logger.flush()
+    logger.flush()
+
+
+def _medir(nombre: str, consulta, repeticiones: int = 5) -> None:
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        consulta()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    print(f"{nombre:<40} {mejor * 1000:10.2f} ms")
+
+
+def _todas_las_paginas(logger: ActivityLogger) -> None:
+    pagina = logger.query_page(7)
+    while pagina:
+        pagina = logger.query_page(7, antes_de=pagina[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--eventos", type=int, default=500_000, help="Eventos en el registro.")
+    parser.add_argument("--usuarios", type=int, default=200, help="Usuarios distintos.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        init_db(str(Path(tmp) / "bench.db"))
+        pool = ConnectionPool(str(Path(tmp) / "bench.db"))
+        almacenes = {
+            "CSV": ActivityLogger(str(Path(tmp) / "logs.csv"), max_cola=10 ** 7, lote=5000),
+            "SQLite": ActivityLogger(max_cola=10 ** 7, lote=5000, backend=SqliteLogBackend(pool)),
+        }
+        for nombre, logger in almacenes.items():
+            inicio = time.perf_counter()
+            _llenar(logger, args.eventos, args.usuarios)
+            print(f"{nombre}: {args.eventos} eventos escritos en {time.perf_counter() - inicio:.1f} s")
+
+        for nombre, logger in almacenes.items():
+            _medir(f"{nombre}: página de un usuario", lambda: logger.query_page(7))
+            _medir(f"{nombre}: página de un evento", lambda: logger.query_page(evento="eliminacion_usuario"))
+            _medir(f"{nombre}: todas las páginas de un usuario", lambda: _todas_las_paginas(logger), repeticiones=1)
+            logger.close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Latencia por lectura guardada: INSERT + commit + SELECT de la fecha (antes)
+frente a INSERT ... RETURNING + commit, con la misma conversión de parámetros,
+y el costo completo de `ReadingRepository.save` (lock del escritor y entidad).
+
+Uso:
+    python -m benchmarks.bench_reading_insert [--n 2000] [--rondas 5] [--sin-fsync]
+
+Con --sin-fsync (PRAGMA synchronous = OFF) se aísla el costo de las consultas
+del tiempo de sincronización a disco, que domina en discos lentos. Las variantes
+se alternan en cada ronda y se informa la mejor, para no medir el ruido del equipo.
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from domain.entities.reading import Reading
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.repositories.reading_repository import ReadingRepository
+from infrastructure.database.statements import sql
+
+
+def _params(reading: Reading) -> tuple:
+    return (reading.user_id, float(reading.lectura_actual), float(reading.lectura_anterior),
+            float(reading.consumo), float(reading.costo))
+
+
+def _insert_and_select(conn, reading: Reading) -> datetime:
+    """Ruta anterior: el INSERT, el commit y una segunda consulta para la fecha."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo) "
+        "VALUES (?, ?, ?, ?, ?)",
+        _params(reading),
+    )
+    reading_id = cursor.lastrowid
+    conn.commit()
+    cursor.execute("SELECT fecha FROM lecturas WHERE id = ?", (reading_id,))
+    return datetime.fromisoformat(cursor.fetchone()[0])
+
+
+def _insert_returning(conn, reading: Reading) -> datetime:
+    """La sentencia de `ReadingRepository.save`, sin el repositorio alrededor."""
+    row = conn.execute(sql("lecturas.insertar"), _params(reading)).fetchone()
+    conn.commit()
+    return datetime.fromisoformat(row[1])
+
+
+def _preparar(tmp: str, sin_fsync: bool):
+    db_path = str(Path(tmp) / "bench.db")
+    init_db(db_path)
+    conn = get_db_connection(db_path)
+    if sin_fsync:
+        conn.execute("PRAGMA synchronous = OFF;")
+    conn.execute(
+        "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('B', 'bench', 'x', 'usuario')"
+    )
+    conn.commit()
+    return conn
+
+
+def _medir(n: int, guardar) -> float:
+    inicio = time.perf_counter()
+    for _ in range(n):
+        guardar()
+    return (time.perf_counter() - inicio) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=2000, help="Lecturas a guardar por variante.")
+    parser.add_argument("--sin-fsync", action="store_true", help="Desactiva la sincronización a disco.")
+    parser.add_argument("--rondas", type=int, default=5, help="Rondas alternando las variantes.")
+    args = parser.parse_args()
+
+    reading = Reading(
+        id=None, user_id=1, lectura_actual=Decimal("150"), lectura_anterior=Decimal("100"),
+        consumo=Decimal("50"), costo=Decimal("20.00"),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = _preparar(tmp, args.sin_fsync)
+        # El repositorio se construye una vez: solo se mide el guardado
+        repo = ReadingRepository(conn)
+        variantes = {
+            "INSERT + SELECT (antes)": lambda: _insert_and_select(conn, reading),
+            "INSERT ... RETURNING": lambda: _insert_returning(conn, reading),
+            "ReadingRepository.save": lambda: repo.save(reading),
+        }
+        mejores = dict.fromkeys(variantes, float("inf"))
+        for _ in range(args.rondas):
+            for nombre, guardar in variantes.items():
+                mejores[nombre] = min(mejores[nombre], _medir(args.n, guardar))
+        conn.close()
+    for nombre, segundos in mejores.items():
+        print(f"{nombre:<28} {segundos * 1e6:10.1f} µs/lectura")
+
+
+if __name__ == "__main__":
+    main()
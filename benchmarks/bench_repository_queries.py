@@ -0,0 +1,110 @@
+"""
+Costo por consulta de `ReadingRepository.get_by_user_id`: mapeo fila a fila
+original frente a la sentencia con nombre + row factory, con y sin proyección;
+resumen mensual agregando `lecturas` frente al rollup `lecturas_mensuales`; y
+serie temporal completa en bruto frente a la decimación min/max en SQL.
+
+Uso:
+    python -m benchmarks.bench_repository_queries [--lecturas 5000] [--repeticiones 50]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from domain.entities.reading import Reading
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.repositories.reading_repository import ReadingRepository
+from infrastructure.database.statements import sql
+
+
+def _get_by_user_id_original(conn, user_id: int):
+    """Implementación previa: SQL en línea y construcción de Reading por keywords."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT id, usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha
+        FROM lecturas
+        WHERE usuario_id = ?
+        ORDER BY fecha DESC
+        """,
+        (user_id,),
+    )
+    return [
+        Reading(
+            id=row[0],
+            user_id=row[1],
+            lectura_actual=Decimal(str(row[2])),
+            lectura_anterior=Decimal(str(row[3])),
+            consumo=Decimal(str(row[4])),
+            costo=Decimal(str(row[5])),
+            fecha=datetime.fromisoformat(row[6]),
+        )
+        for row in cursor.fetchall()
+    ]
+
+
+def _medir(nombre: str, repeticiones: int, consulta) -> None:
+    consulta()  # calentamiento: prepara la sentencia
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        consulta()
+    total = time.perf_counter() - inicio
+    print(f"{nombre:<40} {total / repeticiones * 1e3:8.2f} ms/consulta")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lecturas", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        init_db(db_path)
+        conn = get_db_connection(db_path)
+        conn.execute(
+            "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('B', 'bench', 'x', 'usuario')"
+        )
+        inicio = datetime(2015, 1, 1)
+        conn.executemany(
+            "INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha) "
+            "VALUES (1, ?, ?, ?, ?, ?)",
+            [
+                (i * 100.5 + 100.5, i * 100.5, 100.5, 42.7,
+                 (inicio + timedelta(hours=12 * i)).strftime("%Y-%m-%d %H:%M:%S"))
+                for i in range(args.lecturas)
+            ],
+        )
+        conn.commit()
+        repo = ReadingRepository(conn)
+
+        print(f"{args.lecturas} lecturas por usuario")
+        _medir("original", args.repeticiones, lambda: _get_by_user_id_original(conn, 1))
+        _medir("sentencia con nombre + factory", args.repeticiones, lambda: repo.get_by_user_id(1))
+        _medir(
+            "proyección (id, consumo, costo, fecha)", args.repeticiones,
+            lambda: repo.get_by_user_id(1, ("id", "consumo", "costo", "fecha")),
+        )
+        limites = (1, "0000-01-01 00:00:00", "9999-12-31 23:59:59")
+        _medir(
+            "resumen mensual: GROUP BY sobre lecturas", args.repeticiones,
+            lambda: conn.execute(sql("lecturas.resumen_mensual"), limites).fetchall(),
+        )
+        _medir("resumen mensual: rollup", args.repeticiones, lambda: repo.monthly_summary(1))
+        fin = inicio + timedelta(hours=12 * args.lecturas)
+        _medir(
+            "serie: todas las lecturas", args.repeticiones,
+            lambda: repo.get_by_user_id(1, ("fecha", "consumo")),
+        )
+        _medir(
+            "serie: min/max en SQL (1600 puntos)", args.repeticiones,
+            lambda: repo.consumption_series(1, inicio, fin, 1600),
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
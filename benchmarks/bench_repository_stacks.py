@@ -0,0 +1,110 @@
+"""
+Costo por llamada de los dos caminos de acceso a datos que convivían:
+`SQLiteUserRepository`/`SQLiteReadingRepository` sin conexión inyectada
+(abrían una conexión por llamada y no la cerraban) frente al repositorio
+unificado sobre `ConnectionPool` (las mismas clases, hoy subclases de
+`UserRepository`/`ReadingRepository`) y frente a los repositorios canónicos.
+
+Uso:
+    python -m benchmarks.bench_repository_stacks [--llamadas 2000] [--lecturas 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from domain.entities.reading import Reading
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.pool import ConnectionPool
+from infrastructure.database.repositories.reading_repository import ReadingRepository
+from infrastructure.database.repositories.user_repository import UserRepository
+from infrastructure.repositories.sqlite_reading_repository import SQLiteReadingRepository
+from infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+
+
+def _user_por_llamada(db_path: str, username: str):
+    """Camino anterior: conexión nueva por llamada, que quedaba abierta."""
+    conn = get_db_connection(db_path)
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT id, nombre, username, password_hash, rol, activo, fecha_creacion FROM usuarios WHERE username = ?",
+        (username,),
+    )
+    return conn, cur.fetchone()
+
+
+def _lecturas_por_llamada(db_path: str, user_id: int):
+    conn = get_db_connection(db_path)
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT id, usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha FROM lecturas "
+        "WHERE usuario_id = ? ORDER BY fecha DESC",
+        (user_id,),
+    )
+    filas = [
+        Reading(r[0], r[1], Decimal(str(r[2])), Decimal(str(r[3])), Decimal(str(r[4])),
+                Decimal(str(r[5])), datetime.fromisoformat(r[6]) if r[6] else None)
+        for r in cur.fetchall()
+    ]
+    return conn, filas
+
+
+def _descriptores() -> int:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return -1  # sin /proc (p. ej. Windows o macOS)
+
+
+def _medir(nombre: str, llamadas: int, consulta) -> None:
+    fds = _descriptores()
+    abiertas = []
+    inicio = time.perf_counter()
+    for _ in range(llamadas):
+        resultado = consulta()
+        if isinstance(resultado, tuple):
+            abiertas.append(resultado[0])  # el camino anterior no cerraba la conexión
+    total = time.perf_counter() - inicio
+    extra = _descriptores() - fds
+    for conn in abiertas:
+        conn.close()
+    print(f"{nombre:<46} {total / llamadas * 1e6:9.1f} µs/llamada  {extra:+6d} descriptores")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--llamadas", type=int, default=2000)
+    parser.add_argument("--lecturas", type=int, default=200, help="Lecturas del usuario consultado.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        init_db(db_path)
+        legacy_users = SQLiteUserRepository(db_path)
+        legacy_readings = SQLiteReadingRepository(db_path)
+        user = legacy_users.add_user("Bench", "bench", "x")
+        for i in range(args.lecturas):
+            legacy_readings.add_reading(user.id, Decimal(i + 1), Decimal(i), Decimal(1), Decimal("0.33"))
+        pool = ConnectionPool(db_path)
+        users, readings = UserRepository(pool), ReadingRepository(pool)
+
+        print("Usuario por username")
+        _medir("  conexión por llamada (antes)", args.llamadas, lambda: _user_por_llamada(db_path, "bench"))
+        _medir("  SQLiteUserRepository (pool)", args.llamadas, lambda: legacy_users.get_by_username("bench"))
+        _medir("  UserRepository (pool)", args.llamadas, lambda: users.get_by_username("bench"))
+        print(f"Lecturas de un usuario ({args.lecturas})")
+        llamadas = max(1, args.llamadas // 10)
+        _medir("  conexión por llamada (antes)", llamadas, lambda: _lecturas_por_llamada(db_path, user.id))
+        _medir("  SQLiteReadingRepository (pool)", llamadas, lambda: legacy_readings.get_by_user(user.id))
+        _medir("  ReadingRepository (pool)", llamadas, lambda: readings.get_by_user_id(user.id))
+
+        legacy_users.close()
+        legacy_readings.close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
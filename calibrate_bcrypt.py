@@ -0,0 +1,31 @@
+"""
+Script para medir el costo de bcrypt adecuado a este equipo.
+Muestra el costo que elige la calibración para el tiempo objetivo; para fijarlo,
+copiarlo en BCRYPT_ROUNDS (config/settings.py). Las contraseñas guardadas con
+un costo menor se regeneran en el siguiente inicio de sesión correcto.
+"""
+
+import argparse
+import time
+from config import settings
+from infrastructure.auth.auth_service import calibrate_bcrypt_cost, hash_password
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibra el costo de bcrypt.")
+    parser.add_argument(
+        "--objetivo-ms", type=float, default=settings.BCRYPT_TARGET_MS,
+        help="Tiempo de verificación buscado (por defecto %(default)s ms).",
+    )
+    args = parser.parse_args()
+
+    costo = calibrate_bcrypt_cost(args.objetivo_ms)
+    inicio = time.perf_counter()
+    hash_password("calibracion", costo)
+    print(f"Costo {costo}: {(time.perf_counter() - inicio) * 1000:.0f} ms por verificación "
+          f"(objetivo {args.objetivo_ms:.0f} ms).")
+    print(f"Para fijarlo: BCRYPT_ROUNDS = {costo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,3 +6,44 @@ BASE_DIR = (
 DATA_DIR = BASE_DIR / "data"
 DB_PATH = str(DATA_DIR / "app.db")
 LOGS_DIR = BASE_DIR / "logs"
+
+# Ajustes de SQLite (ver infrastructure/database/connection.py)
+DB_JOURNAL_MODE = "WAL"
+DB_SYNCHRONOUS = "NORMAL"
+DB_CACHE_SIZE_KB = 16 * 1024  # caché de páginas por conexión
+DB_MMAP_SIZE = 64 * 1024 * 1024  # bytes mapeados en memoria; 0 lo desactiva
+DB_BUSY_TIMEOUT_MS = 5000
+DB_POOL_MAX_READERS = 8  # conexiones de lectura (una por hilo) antes de reciclar
+
+# Caché de lecturas por usuario en ReadingService
+READING_CACHE_MAX_USERS = 64
+READING_CACHE_TTL_S = 300.0
+
+# Costo de bcrypt para contraseñas nuevas y rehash al iniciar sesión. None lo calibra
+# en cada equipo para que verificar tarde cerca de BCRYPT_TARGET_MS (ver calibrate_bcrypt.py)
+BCRYPT_ROUNDS = None
+BCRYPT_TARGET_MS = 250
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+# Hilos de fondo para consultas y escrituras desde la interfaz (<= DB_POOL_MAX_READERS)
+UI_WORKER_THREADS = 4
+
+# Meses más recientes que dibuja la gráfica; 0 dibuja todos
+GRAPH_MAX_MONTHS = 24
+# Espera tras un zoom, desplazamiento o cambio de tamaño antes de pedir la serie temporal
+SERIES_REFETCH_DELAY_MS = 150
+
+# Logger de actividad: cola acotada y escritura por lotes en un hilo de fondo
+LOG_QUEUE_MAX = 10000  # eventos en espera; los que no caben se descartan y se cuentan
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL_S = 1.0
+LOG_QUERY_FLUSH_TIMEOUT_S = 2.0  # espera máxima de las consultas por lo aún encolado
+LOG_EXIT_TIMEOUT_S = 5.0  # espera máxima al salir del intérprete para escribir lo pendiente
+# Rotación: el archivo activo pasa a un segmento .csv.gz al superar este tamaño o al cambiar el día
+LOG_ROTATE_MAX_BYTES = 5 * 1024 * 1024
+LOG_ROTATE_DAILY = True
+# Almacén del log: "csv" (archivos rotados en logs/) o "sqlite" (tabla eventos, consultas
+# indexadas). Antes de pasar a "sqlite", `python migrate_activity_log.py` copia el historial CSV
+LOG_BACKEND = "csv"
+AUDIT_PAGE_SIZE = 100
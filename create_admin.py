@@ -5,7 +5,7 @@ Ejecutar solo una vez al desplegar la app.
 
 import sys
 import getpass
-import bcrypt
+from infrastructure.auth.auth_service import hash_password
 from infrastructure.database.connection import get_db_connection, init_db
 from infrastructure.database.repositories.user_repository import UserRepository
 
@@ -15,8 +15,13 @@ def create_admin_user() -> None:
     # Inicializar base de datos
     init_db()
     conn = get_db_connection()
-    repo = UserRepository(conn)
+    try:
+        _create_admin(UserRepository(conn))
+    finally:
+        conn.close()
 
+
+def _create_admin(repo: UserRepository) -> None:
     # Verificar si ya existe un admin
     admins = [u for u in repo.get_all_active() if u.rol == "admin"]
     if admins:
@@ -45,9 +50,8 @@ def create_admin_user() -> None:
         print("❌ La contraseña debe tener al menos 6 caracteres.")
         sys.exit(1)
 
-    # Hashear contraseña
-    salt = bcrypt.gensalt()
-    password_hash = bcrypt.hashpw(password1.encode("utf-8"), salt).decode("utf-8")
+    # Hashear contraseña con el costo configurado o calibrado en este equipo
+    password_hash = hash_password(password1)
 
     from domain.entities.user import User
     from datetime import datetime
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass(frozen=True)
+class ActivityEvent:
+    timestamp: datetime
+    user_id: int
+    evento: str
+    detalles: str
+    id: Optional[int] = None
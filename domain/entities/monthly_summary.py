@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+@dataclass(frozen=True)
+class MonthlySummary:
+    mes: str  # "YYYY-MM"
+    consumo: Decimal
+    costo: Decimal
+    lecturas: int
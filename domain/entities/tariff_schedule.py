@@ -0,0 +1,12 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+@dataclass
+class TariffSchedule:
+    id: Optional[int]
+    nombre: str
+    vigente_desde: date
+    tramos: List[Tuple[Decimal, Decimal, Decimal]] = field(default_factory=list)
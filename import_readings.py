@@ -0,0 +1,64 @@
+"""
+Script para importar lecturas en lote desde un archivo CSV.
+Columnas: usuario_id, lectura_anterior, lectura_actual y, opcionalmente, fecha (ISO 8601).
+"""
+
+import argparse
+import csv
+import sys
+from config import settings
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.pool import as_pool
+from infrastructure.logging.activity_logger import ActivityLogger
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+from application.services.reading_service import IMPORT_CHUNK_SIZE, ReadingService
+
+
+def import_readings_from_csv(csv_path: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> int:
+    """
+    Importa las lecturas del CSV y muestra las estadísticas de la importación.
+
+    Returns:
+        int: Código de salida (0 si no hubo filas rechazadas).
+    """
+    init_db()
+    # Servicio y logger comparten la conexión y su lock de escritura
+    db = as_pool(get_db_connection())
+    if settings.LOG_BACKEND == "sqlite":
+        logger = ActivityLogger(backend=SqliteLogBackend(db))
+    else:
+        logger = ActivityLogger(str(settings.LOGS_DIR / "logs_actividad.csv"))
+    service = ReadingService(db, logger)
+
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            print(f"📥 Importando lecturas desde '{csv_path}'...")
+            result = service.import_readings(csv.DictReader(f), chunk_size=chunk_size)
+    except FileNotFoundError:
+        print(f"❌ No existe el archivo '{csv_path}'.")
+        return 1
+    finally:
+        logger.close()
+        db.close()
+
+    print(f"✅ {result.importadas} de {result.leidas} filas importadas "
+          f"en {result.segundos:.2f} s ({result.filas_por_segundo:,.0f} filas/s).")
+    if result.rechazadas:
+        print(f"⚠️  {result.rechazadas} filas rechazadas:")
+        for motivo, cantidad in sorted(result.motivos.items()):
+            print(f"   - {motivo}: {cantidad}")
+        for _, detalle in result.errores:
+            print(f"     {detalle}")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa lecturas desde un CSV.")
+    parser.add_argument("csv_path", help="Ruta del archivo CSV a importar.")
+    parser.add_argument(
+        "--chunk-size", type=int, default=IMPORT_CHUNK_SIZE,
+        help="Filas por transacción (por defecto %(default)s).",
+    )
+    args = parser.parse_args()
+    sys.exit(import_readings_from_csv(args.csv_path, args.chunk_size))
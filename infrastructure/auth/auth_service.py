@@ -1,17 +1,127 @@
-from typing import Optional
-import bcrypt
+import math
+import sqlite3
+import time
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, Optional
+from config import settings
 from domain.entities.user import User
 from infrastructure.database.repositories.user_repository import UserRepository
 
+# Costo con el que se mide el equipo: rápido, pero lo bastante largo para medirlo bien
+_COSTO_SONDA = 8
+
+
+def _importar_bcrypt():
+    """Import lazy de bcrypt: solo se necesita al verificar la contraseña, no para mostrar el login."""
+    try:
+        import bcrypt
+    except ImportError as e:
+        raise RuntimeError(
+            "bcrypt no está instalado. Instala dependencias con `pip install -r requirements.txt`"
+        ) from e
+    return bcrypt
+
+
+def bcrypt_cost(password_hash: str) -> Optional[int]:
+    """Costo con el que se generó un hash bcrypt (`$2b$12$...` -> 12); None si no es bcrypt."""
+    partes = password_hash.split("$")
+    if len(partes) < 4 or not partes[2].isdigit():
+        return None
+    return int(partes[2])
+
+
+@lru_cache(maxsize=None)
+def calibrate_bcrypt_cost(
+    objetivo_ms: Optional[float] = None,
+    minimo: Optional[int] = None,
+    maximo: Optional[int] = None,
+    reloj: Callable[[], float] = time.perf_counter,
+) -> int:
+    """
+    Elige el costo de bcrypt para que verificar una contraseña tarde cerca de
+    `objetivo_ms` en este equipo, sin pasarse.
+
+    Mide un hash con costo `_COSTO_SONDA` (el mejor de tres) y extrapola: cada
+    punto de costo duplica el tiempo. El resultado se guarda por proceso.
+
+    Args:
+        objetivo_ms (Optional[float]): Tiempo buscado; por defecto `BCRYPT_TARGET_MS`.
+        minimo (Optional[int]): Costo mínimo aceptable; por defecto `BCRYPT_MIN_ROUNDS`.
+        maximo (Optional[int]): Costo máximo; por defecto `BCRYPT_MAX_ROUNDS`.
+        reloj (Callable[[], float]): Reloj en segundos (inyectable en tests).
+
+    Returns:
+        int: Costo entre `minimo` y `maximo`.
+    """
+    objetivo_ms = objetivo_ms if objetivo_ms is not None else settings.BCRYPT_TARGET_MS
+    minimo = minimo if minimo is not None else settings.BCRYPT_MIN_ROUNDS
+    maximo = maximo if maximo is not None else settings.BCRYPT_MAX_ROUNDS
+    bcrypt = _importar_bcrypt()
+    sal = bcrypt.gensalt(rounds=_COSTO_SONDA)
+    medido_ms = float("inf")
+    for _ in range(3):
+        inicio = reloj()
+        bcrypt.hashpw(b"calibracion", sal)
+        medido_ms = min(medido_ms, (reloj() - inicio) * 1000)
+    costo = _COSTO_SONDA + math.floor(math.log2(objetivo_ms / max(medido_ms, 1e-3)))
+    return max(minimo, min(maximo, costo))
+
+
+def default_rounds() -> int:
+    """Costo para los hashes nuevos: `BCRYPT_ROUNDS` o, si es None, el calibrado en este equipo."""
+    if settings.BCRYPT_ROUNDS is not None:
+        return settings.BCRYPT_ROUNDS
+    return calibrate_bcrypt_cost()
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """
+    Hash bcrypt de una contraseña.
+
+    Args:
+        password (str): Contraseña en texto plano.
+        rounds (Optional[int]): Costo; por defecto `default_rounds()`.
+
+    Returns:
+        str: Hash en texto (`$2b$<costo>$...`).
+    """
+    bcrypt = _importar_bcrypt()
+    salt = bcrypt.gensalt(rounds=rounds if rounds is not None else default_rounds())
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
 
 class AuthService:
     """
     Servicio de autenticación.
     Maneja login, hashing y validación de credenciales.
+
+    bcrypt tarda a propósito: `login` debe llamarse fuera del hilo de la
+    interfaz (ver `LoginView`). Tras un login correcto, si el hash guardado
+    tiene un costo menor que el configurado, se regenera con la contraseña
+    recién verificada. Nunca se baja: la calibración se repite en cada proceso
+    y puede variar un punto según la carga del equipo.
     """
 
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(self, user_repository: UserRepository, rounds: Optional[int] = None) -> None:
+        """
+        Args:
+            user_repository (UserRepository): Repositorio de usuarios.
+            rounds (Optional[int]): Costo de bcrypt; por defecto `default_rounds()`,
+                que se calcula la primera vez que se necesita.
+        """
         self.user_repository = user_repository
+        self._rounds = rounds
+
+    @property
+    def rounds(self) -> int:
+        if self._rounds is None:
+            self._rounds = default_rounds()
+        return self._rounds
+
+    def hash_password(self, password: str) -> str:
+        """Hash bcrypt de `password` con el costo del servicio."""
+        return hash_password(password, self.rounds)
 
     def login(self, username: str, password: str) -> Optional[User]:
         """
@@ -32,6 +142,18 @@ class AuthService:
             return None
 
         # Verificar hash
-        if bcrypt.checkpw(password.encode('utf-8'), user.password_hash.encode('utf-8')):
+        bcrypt = _importar_bcrypt()
+        if not bcrypt.checkpw(password.encode('utf-8'), user.password_hash.encode('utf-8')):
+            return None
+        if (bcrypt_cost(user.password_hash) or 0) < self.rounds:
+            user = self._rehash(user, password)
+        return user
+
+    def _rehash(self, user: User, password: str) -> User:
+        """Regenera el hash con el costo actual; si no se puede guardar, el login sigue siendo válido."""
+        password_hash = self.hash_password(password)
+        try:
+            self.user_repository.update_password_hash(user.id, password_hash)
+        except sqlite3.Error:
             return user
-        return None
\ No newline at end of file
+        return replace(user, password_hash=password_hash)
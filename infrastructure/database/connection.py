@@ -4,7 +4,9 @@ from __future__ import annotations
 import sqlite3
 import os
 from pathlib import Path
+from typing import List
 from config import settings
+from infrastructure.database.statements import STATEMENT_CACHE_SIZE, STATEMENTS
 
 
 SCHEMA_SQL = """
@@ -21,7 +23,7 @@ CREATE TABLE IF NOT EXISTS usuarios (
 );
 
 CREATE INDEX IF NOT EXISTS idx_usuarios_username ON usuarios(username);
-CREATE INDEX IF NOT EXISTS idx_usuarios_activo ON usuarios(activo);
+CREATE INDEX IF NOT EXISTS idx_usuarios_activo_nombre ON usuarios(activo, nombre);
 
 CREATE TABLE IF NOT EXISTS lecturas (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -34,27 +36,150 @@ CREATE TABLE IF NOT EXISTS lecturas (
     FOREIGN KEY (usuario_id) REFERENCES usuarios (id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_lecturas_usuario_id ON lecturas(usuario_id);
+-- Cubre las consultas por usuario ordenadas por (fecha, id) y las proyecciones de consumo/costo
+CREATE INDEX IF NOT EXISTS idx_lecturas_usuario_fecha
+    ON lecturas(usuario_id, fecha DESC, id DESC, consumo, costo);
 CREATE INDEX IF NOT EXISTS idx_lecturas_fecha ON lecturas(fecha);
+
+-- Rollup mensual por usuario; los triggers lo mantienen al insertar, modificar o borrar lecturas
+CREATE TABLE IF NOT EXISTS lecturas_mensuales (
+    usuario_id INTEGER NOT NULL,
+    mes TEXT NOT NULL,  -- 'YYYY-MM'
+    consumo REAL NOT NULL,
+    costo REAL NOT NULL,
+    lecturas INTEGER NOT NULL,
+    PRIMARY KEY (usuario_id, mes),
+    FOREIGN KEY (usuario_id) REFERENCES usuarios (id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_lecturas_mensuales_insert AFTER INSERT ON lecturas
+BEGIN
+    INSERT INTO lecturas_mensuales (usuario_id, mes, consumo, costo, lecturas)
+    VALUES (NEW.usuario_id, strftime('%Y-%m', NEW.fecha), NEW.consumo, NEW.costo, 1)
+    ON CONFLICT (usuario_id, mes) DO UPDATE SET
+        consumo = consumo + excluded.consumo,
+        costo = costo + excluded.costo,
+        lecturas = lecturas + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_lecturas_mensuales_delete AFTER DELETE ON lecturas
+BEGIN
+    UPDATE lecturas_mensuales
+    SET consumo = consumo - OLD.consumo, costo = costo - OLD.costo, lecturas = lecturas - 1
+    WHERE usuario_id = OLD.usuario_id AND mes = strftime('%Y-%m', OLD.fecha);
+    DELETE FROM lecturas_mensuales
+    WHERE usuario_id = OLD.usuario_id AND mes = strftime('%Y-%m', OLD.fecha) AND lecturas <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_lecturas_mensuales_update
+AFTER UPDATE OF usuario_id, consumo, costo, fecha ON lecturas
+BEGIN
+    UPDATE lecturas_mensuales
+    SET consumo = consumo - OLD.consumo, costo = costo - OLD.costo, lecturas = lecturas - 1
+    WHERE usuario_id = OLD.usuario_id AND mes = strftime('%Y-%m', OLD.fecha);
+    DELETE FROM lecturas_mensuales
+    WHERE usuario_id = OLD.usuario_id AND mes = strftime('%Y-%m', OLD.fecha) AND lecturas <= 0;
+    INSERT INTO lecturas_mensuales (usuario_id, mes, consumo, costo, lecturas)
+    VALUES (NEW.usuario_id, strftime('%Y-%m', NEW.fecha), NEW.consumo, NEW.costo, 1)
+    ON CONFLICT (usuario_id, mes) DO UPDATE SET
+        consumo = consumo + excluded.consumo,
+        costo = costo + excluded.costo,
+        lecturas = lecturas + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS tarifas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nombre TEXT NOT NULL,
+    vigente_desde DATE UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tramos_tarifa (
+    tarifa_id INTEGER NOT NULL,
+    orden INTEGER NOT NULL,
+    tramo_min TEXT NOT NULL,
+    tramo_max TEXT,  -- NULL: tramo sin límite superior
+    precio TEXT NOT NULL,
+    PRIMARY KEY (tarifa_id, orden),
+    FOREIGN KEY (tarifa_id) REFERENCES tarifas (id) ON DELETE CASCADE
+);
+
+-- Registro de actividad (ActivityLogger con SqliteLogBackend); sin clave foránea:
+-- el registro no debe fallar ni perderse por el estado del usuario
+CREATE TABLE IF NOT EXISTS eventos (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    usuario_id INTEGER NOT NULL,
+    evento TEXT NOT NULL,
+    detalles TEXT NOT NULL DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_eventos_usuario_timestamp ON eventos(usuario_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_eventos_evento_timestamp ON eventos(evento, timestamp);
+CREATE INDEX IF NOT EXISTS idx_eventos_timestamp ON eventos(timestamp);
 """
 
+# Migraciones para bases creadas con versiones anteriores de SCHEMA_SQL.
+# SCHEMA_SQL describe siempre el esquema actual; PRAGMA user_version guarda
+# cuántas migraciones se aplicaron ya.
+MIGRATIONS: List[str] = [
+    # 1: índices compuestos sustituyen a los de una sola columna
+    """
+    DROP INDEX IF EXISTS idx_lecturas_usuario_id;
+    DROP INDEX IF EXISTS idx_usuarios_activo;
+    """,
+    # 2: rollup mensual; SCHEMA_SQL crea la tabla y los triggers, aquí se llena con el histórico
+    f"""
+    {STATEMENTS["lecturas_mensuales.vaciar"]};
+    {STATEMENTS["lecturas_mensuales.reconstruir"]};
+    """,
+]
+
+
+def configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+    """
+    Aplica los PRAGMAs de rendimiento configurados en `config.settings`.
 
-def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
-    """Retorna una conexión SQLite. Crea directorio si hace falta."""
+    Args:
+        conn (sqlite3.Connection): Conexión a configurar.
+        read_only (bool): Si es True, la conexión rechaza escrituras (`query_only`).
+    """
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute(f"PRAGMA busy_timeout = {int(settings.DB_BUSY_TIMEOUT_MS)};")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON;")
+    else:
+        # El modo de journal es persistente en el archivo: basta con que lo fije el escritor
+        conn.execute(f"PRAGMA journal_mode = {settings.DB_JOURNAL_MODE};")
+    conn.execute(f"PRAGMA synchronous = {settings.DB_SYNCHRONOUS};")
+    conn.execute(f"PRAGMA cache_size = -{int(settings.DB_CACHE_SIZE_KB)};")
+    conn.execute(f"PRAGMA mmap_size = {int(settings.DB_MMAP_SIZE)};")
+
+
+def get_db_connection(db_path: str | None = None, read_only: bool = False) -> sqlite3.Connection:
+    """Retorna una conexión SQLite configurada. Crea directorio si hace falta."""
     db_path = db_path or settings.DB_PATH
     db_file = Path(db_path)
     db_file.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_file), check_same_thread=False)
-    conn.execute("PRAGMA foreign_keys = ON;")
+    conn = sqlite3.connect(
+        str(db_file), check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+    )
+    configure_connection(conn, read_only=read_only)
     return conn
 
 
+def apply_schema(conn: sqlite3.Connection) -> None:
+    """Crea el esquema actual y aplica las migraciones pendientes."""
+    conn.executescript(SCHEMA_SQL)
+    version = conn.execute("PRAGMA user_version;").fetchone()[0]
+    for numero, script in enumerate(MIGRATIONS[version:], start=version + 1):
+        conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {numero};\nCOMMIT;")
+
+
 def init_db(db_path: str | None = None) -> None:
     """Inicializa la base de datos creando las tablas necesarias."""
     conn = get_db_connection(db_path)
     try:
-        cursor = conn.cursor()
-        cursor.executescript(SCHEMA_SQL)
+        apply_schema(conn)
         conn.commit()
     finally:
         conn.close()
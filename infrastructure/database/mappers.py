@@ -0,0 +1,105 @@
+"""
+Row factories compartidas: convierten filas SQLite en entidades del dominio.
+Se asignan a `cursor.row_factory`, de modo que `fetchall()` ya devuelve entidades.
+"""
+
+from __future__ import annotations
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+from domain.entities.activity_event import ActivityEvent
+from domain.entities.reading import Reading
+from domain.entities.user import User
+from infrastructure.database.statements import READING_COLUMNS, USER_COLUMNS
+
+RowFactory = Callable[[sqlite3.Cursor, tuple], Any]
+
+
+def _decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def _fecha(value: Any) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _bool(value: Any) -> bool:
+    return bool(value)
+
+
+# Columna -> (campo de la entidad, conversión)
+_READING_FIELDS: Dict[str, Tuple[str, Callable | None]] = {
+    "id": ("id", None),
+    "usuario_id": ("user_id", None),
+    "lectura_actual": ("lectura_actual", _decimal),
+    "lectura_anterior": ("lectura_anterior", _decimal),
+    "consumo": ("consumo", _decimal),
+    "costo": ("costo", _decimal),
+    "fecha": ("fecha", _fecha),
+}
+_USER_FIELDS: Dict[str, Tuple[str, Callable | None]] = {
+    "id": ("id", None),
+    "nombre": ("nombre", None),
+    "username": ("username", None),
+    "password_hash": ("password_hash", None),
+    "rol": ("rol", None),
+    "activo": ("activo", _bool),
+    "fecha_creacion": ("fecha_creacion", None),
+}
+
+
+def reading_row(cursor: sqlite3.Cursor, row: tuple) -> Reading:
+    """Row factory de `Reading` para la proyección completa (`READING_COLUMNS`)."""
+    return Reading(
+        row[0],
+        row[1],
+        Decimal(str(row[2])),
+        Decimal(str(row[3])),
+        Decimal(str(row[4])),
+        Decimal(str(row[5])),
+        datetime.fromisoformat(row[6]) if row[6] else None,
+    )
+
+
+def user_row(cursor: sqlite3.Cursor, row: tuple) -> User:
+    """Row factory de `User` para la proyección completa (`USER_COLUMNS`)."""
+    return User(row[0], row[1], row[2], row[3], row[4], bool(row[5]), row[6])
+
+
+def event_row(cursor: sqlite3.Cursor, row: tuple) -> ActivityEvent:
+    """Row factory de `ActivityEvent` para (id, timestamp, usuario_id, evento, detalles)."""
+    return ActivityEvent(datetime.fromisoformat(row[1]), row[2], row[3], row[4], id=row[0])
+
+
+def _projected(entity: type, fields: Dict[str, Tuple[str, Callable | None]],
+               columns: Tuple[str, ...]) -> RowFactory:
+    """Row factory para una proyección: los campos no seleccionados quedan en None."""
+    plan = [(fields[c][0], fields[c][1], i) for i, c in enumerate(columns)]
+    missing = {fields[c][0]: None for c in fields if c not in columns}
+
+    def factory(cursor: sqlite3.Cursor, row: tuple) -> Any:
+        values = dict(missing)
+        for name, convert, i in plan:
+            value = row[i]
+            values[name] = convert(value) if convert is not None and value is not None else value
+        return entity(**values)
+
+    return factory
+
+
+@lru_cache(maxsize=None)
+def reading_factory(columns: Tuple[str, ...] = READING_COLUMNS) -> RowFactory:
+    """Row factory de `Reading` para las columnas dadas (en el orden del SELECT)."""
+    if columns == READING_COLUMNS:
+        return reading_row
+    return _projected(Reading, _READING_FIELDS, columns)
+
+
+@lru_cache(maxsize=None)
+def user_factory(columns: Tuple[str, ...] = USER_COLUMNS) -> RowFactory:
+    """Row factory de `User` para las columnas dadas (en el orden del SELECT)."""
+    if columns == USER_COLUMNS:
+        return user_row
+    return _projected(User, _USER_FIELDS, columns)
@@ -0,0 +1,115 @@
+"""Pool de conexiones SQLite con separación lector/escritor."""
+
+from __future__ import annotations
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+from config import settings
+from infrastructure.database.connection import get_db_connection
+
+
+class ConnectionPool:
+    """
+    Reparte conexiones SQLite entre hilos.
+    Hay una única conexión de escritura, serializada con un lock, y una conexión
+    de lectura (`query_only`) por hilo. Con el journal en modo WAL los lectores
+    no se bloquean mientras el escritor tiene una transacción abierta, por lo que
+    las consultas pueden ejecutarse en hilos de trabajo sin congelar la GUI.
+    """
+
+    def __init__(self, db_path: str | None = None, max_readers: int | None = None) -> None:
+        """
+        Inicializa el pool; las conexiones se abren bajo demanda.
+
+        Args:
+            db_path (str | None): Ruta de la base de datos; por defecto `settings.DB_PATH`.
+            max_readers (int | None): Conexiones de lectura antes de reciclar las de
+                hilos terminados; por defecto `settings.DB_POOL_MAX_READERS`.
+        """
+        self.db_path = db_path or settings.DB_PATH
+        self.max_readers = max_readers or settings.DB_POOL_MAX_READERS
+        self._writer_lock = threading.RLock()
+        self._readers_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._readers: Dict[int, sqlite3.Connection] = {}
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Conexión de solo lectura del hilo actual (se crea la primera vez).
+
+        Returns:
+            sqlite3.Connection: Conexión exclusiva del hilo que llama.
+        """
+        ident = threading.get_ident()
+        conn = self._readers.get(ident)
+        if conn is not None:
+            return conn
+        with self._readers_lock:
+            if len(self._readers) >= self.max_readers:
+                self._close_dead_readers()
+            conn = get_db_connection(self.db_path, read_only=True)
+            self._readers[ident] = conn
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Conexión de escritura en exclusiva durante el bloque `with`.
+        Confirma la transacción al salir o la revierte si hay una excepción.
+
+        Yields:
+            sqlite3.Connection: Conexión de escritura compartida.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = get_db_connection(self.db_path)
+            with self._writer:
+                yield self._writer
+
+    def close(self) -> None:
+        """Cierra todas las conexiones abiertas por el pool."""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            for conn in self._readers.values():
+                conn.close()
+            self._readers.clear()
+
+    def _close_dead_readers(self) -> None:
+        """Cierra las conexiones de lectura de hilos que ya terminaron."""
+        vivos = {t.ident for t in threading.enumerate()}
+        for ident in [i for i in self._readers if i not in vivos]:
+            self._readers.pop(ident).close()
+
+
+class SingleConnection:
+    """
+    Adapta una conexión suelta a la interfaz de `ConnectionPool`.
+    Lectura y escritura usan la misma conexión (útil con `:memory:` en tests y scripts).
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self._lock = threading.RLock()
+
+    def reader(self) -> sqlite3.Connection:
+        return self.conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            with self.conn:
+                yield self.conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def as_pool(conn) -> ConnectionPool | SingleConnection:
+    """Acepta un pool o una conexión SQLite y devuelve siempre la interfaz del pool."""
+    if isinstance(conn, (ConnectionPool, SingleConnection)):
+        return conn
+    return SingleConnection(conn)
@@ -0,0 +1,115 @@
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
+
+from domain.entities.activity_event import ActivityEvent
+from infrastructure.database.mappers import event_row
+from infrastructure.database.pool import as_pool
+from infrastructure.database.statements import sql
+
+PAGE_SIZE = 100
+# Límites abiertos para el rango y la clave de paginación (timestamp se guarda como texto)
+_TS_MIN = "0000-01-01 00:00:00"
+_TS_MAX = "9999-12-31 23:59:59"
+_ID_MAX = 2 ** 63 - 1
+
+
+def _ts_sql(fecha: datetime) -> str:
+    return fecha.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class EventRepository:
+    """
+    Repositorio del registro de actividad (tabla `eventos`).
+    Las consultas filtran por usuario, por tipo de evento o por ambos, cada una
+    apoyada en su índice, y paginan por keyset (timestamp, id).
+    """
+
+    def __init__(self, conn) -> None:
+        """
+        Inicializa el repositorio con una conexión activa a la base de datos.
+
+        Args:
+            conn: Conexión SQLite3 activa o `ConnectionPool`.
+        """
+        self.db = as_pool(conn)
+
+    def save_many(self, rows: Sequence[tuple]) -> int:
+        """
+        Inserta un lote de eventos con `executemany` en una única transacción.
+
+        Args:
+            rows (Sequence[tuple]): Filas (timestamp, usuario_id, evento, detalles),
+                con el timestamp como texto 'YYYY-MM-DD HH:MM:SS'.
+
+        Returns:
+            int: Cantidad de eventos insertados.
+        """
+        if not rows:
+            return 0
+        with self.db.writer() as conn:
+            conn.executemany(sql("eventos.insertar"), rows)
+        return len(rows)
+
+    def import_rows(self, rows: Iterable[tuple], lote: int = 5000) -> int:
+        """
+        Inserta un historial completo por lotes dentro de una sola transacción:
+        si algo falla, la tabla queda como estaba.
+
+        Args:
+            rows (Iterable[tuple]): Filas como en `save_many`, en orden cronológico.
+            lote (int): Filas por `executemany`.
+
+        Returns:
+            int: Cantidad de eventos insertados.
+        """
+        total = 0
+        rows = iter(rows)
+        with self.db.writer() as conn:
+            while True:
+                bloque = list(islice(rows, lote))
+                if not bloque:
+                    return total
+                conn.executemany(sql("eventos.insertar"), bloque)
+                total += len(bloque)
+
+    def get_page(
+        self,
+        user_id: Optional[int] = None,
+        evento: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        limit: Optional[int] = PAGE_SIZE,
+        antes_de: Optional[ActivityEvent] = None,
+    ) -> List[ActivityEvent]:
+        """
+        Obtiene una página de eventos, del más reciente al más antiguo.
+
+        Args:
+            user_id (Optional[int]): Solo eventos de este usuario; None todos.
+            evento (Optional[str]): Solo eventos de este tipo; None todos.
+            desde (Optional[datetime]): Inicio del rango (incluido); None sin límite.
+            hasta (Optional[datetime]): Fin del rango (excluido); None sin límite.
+            limit (Optional[int]): Máximo de eventos; None sin límite.
+            antes_de (Optional[ActivityEvent]): Último evento de la página previa.
+
+        Returns:
+            List[ActivityEvent]: Eventos de la página (vacía al llegar al final).
+        """
+        # (timestamp, id) < (hasta, 0) equivale a timestamp < hasta: los id empiezan en 1
+        clave = (_ts_sql(hasta), 0) if hasta is not None else (_TS_MAX, _ID_MAX)
+        if antes_de is not None:
+            clave = min(clave, (_ts_sql(antes_de.timestamp), antes_de.id))
+        rango = (_ts_sql(desde) if desde is not None else _TS_MIN, *clave, -1 if limit is None else limit)
+
+        if user_id is not None and evento is not None:
+            name, params = "eventos.pagina_usuario_evento", (user_id, evento, *rango)
+        elif user_id is not None:
+            name, params = "eventos.pagina_usuario", (user_id, *rango)
+        elif evento is not None:
+            name, params = "eventos.pagina_evento", (evento, *rango)
+        else:
+            name, params = "eventos.pagina", rango
+        cursor = self.db.reader().cursor()
+        cursor.row_factory = event_row
+        return cursor.execute(sql(name), params).fetchall()
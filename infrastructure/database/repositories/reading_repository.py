@@ -1,7 +1,28 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from decimal import Decimal
 from datetime import datetime
+from domain.entities.monthly_summary import MonthlySummary
 from domain.entities.reading import Reading
+from infrastructure.database.mappers import reading_factory
+from infrastructure.database.pool import as_pool
+from infrastructure.database.statements import READING_COLUMNS, sql
+
+PAGE_SIZE = 200
+# Límites de fecha abiertos para los filtros por rango (fecha se guarda como texto ISO)
+_FECHA_MIN = "0000-01-01 00:00:00"
+_FECHA_MAX = "9999-12-31 23:59:59"
+_MES_MIN = "0000-00"
+_MES_MAX = "9999-99"
+
+
+def _fecha_sql(fecha: datetime) -> str:
+    """Fecha en el formato de texto con el que SQLite guarda CURRENT_TIMESTAMP."""
+    return fecha.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _inicio_de_mes(fecha: Optional[datetime]) -> bool:
+    """True si `fecha` es None o cae exactamente al inicio de un mes."""
+    return fecha is None or fecha == fecha.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
 class ReadingRepository:
@@ -15,9 +36,16 @@ class ReadingRepository:
         Inicializa el repositorio con una conexión activa a la base de datos.
 
         Args:
-            conn: Conexión SQLite3 activa.
+            conn: Conexión SQLite3 activa o `ConnectionPool`.
         """
-        self.conn = conn
+        self.db = as_pool(conn)
+
+    def _query(self, name: str, params: tuple, columns: Optional[Sequence[str]] = None):
+        """Ejecuta una consulta con nombre y devuelve un cursor que produce `Reading`."""
+        columns = tuple(columns) if columns is not None else READING_COLUMNS
+        cursor = self.db.reader().cursor()
+        cursor.row_factory = reading_factory(columns)
+        return cursor.execute(sql(name, columns), params)
 
     def save(self, reading: Reading) -> Reading:
         """
@@ -29,30 +57,23 @@ class ReadingRepository:
         Returns:
             Reading: Entidad guardada con ID y fecha asignados por la BD.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO lecturas (
-                usuario_id, lectura_actual, lectura_anterior, consumo, costo
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                reading.user_id,
-                float(reading.lectura_actual),
-                float(reading.lectura_anterior),
-                float(reading.consumo),
-                float(reading.costo),
-            ),
-        )
-        reading_id = cursor.lastrowid
-        self.conn.commit()
-
-        # Recuperar la fecha asignada por la base de datos
-        cursor.execute("SELECT fecha FROM lecturas WHERE id = ?", (reading_id,))
-        row = cursor.fetchone()
+        with self.db.writer() as conn:
+            # RETURNING entrega el ID y la fecha asignada por la BD sin una segunda consulta
+            cursor = conn.execute(
+                sql("lecturas.insertar"),
+                (
+                    reading.user_id,
+                    float(reading.lectura_actual),
+                    float(reading.lectura_anterior),
+                    float(reading.consumo),
+                    float(reading.costo),
+                ),
+            )
+            row = cursor.fetchone()
         if row is None:
             raise RuntimeError("No se pudo recuperar la lectura guardada.")
-        fecha = datetime.fromisoformat(row[0])
+        reading_id = row[0]
+        fecha = datetime.fromisoformat(row[1])
 
         return Reading(
             id=reading_id,
@@ -64,40 +85,241 @@ class ReadingRepository:
             fecha=fecha,
         )
 
-    def get_by_user_id(self, user_id: int) -> List[Reading]:
+    def save_many(self, readings: Sequence[Reading]) -> int:
+        """
+        Inserta varias lecturas con `executemany` en una única transacción.
+        Las lecturas sin fecha reciben la fecha actual de la base de datos.
+
+        Args:
+            readings (Sequence[Reading]): Lecturas ya validadas y tarificadas.
+
+        Returns:
+            int: Cantidad de lecturas insertadas.
+        """
+        if not readings:
+            return 0
+        with self.db.writer() as conn:
+            conn.executemany(
+                sql("lecturas.insertar_lote"),
+                [
+                    (
+                        r.user_id,
+                        float(r.lectura_actual),
+                        float(r.lectura_anterior),
+                        float(r.consumo),
+                        float(r.costo),
+                        _fecha_sql(r.fecha) if r.fecha else None,
+                    )
+                    for r in readings
+                ],
+            )
+        return len(readings)
+
+    def get_by_user_id(self, user_id: int, columns: Optional[Sequence[str]] = None) -> List[Reading]:
         """
         Obtiene todas las lecturas de un usuario, ordenadas por fecha descendente.
 
         Args:
             user_id (int): ID del usuario.
+            columns (Optional[Sequence[str]]): Columnas a cargar; las demás quedan en None.
 
         Returns:
             List[Reading]: Lista de lecturas del usuario.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha
-            FROM lecturas
-            WHERE usuario_id = ?
-            ORDER BY fecha DESC
-            """,
-            (user_id,),
-        )
-        rows = cursor.fetchall()
+        return self._query("lecturas.por_usuario", (user_id,), columns).fetchall()
+
+    def get_page(
+        self,
+        user_id: int,
+        before_fecha: Optional[datetime] = None,
+        limit: int = PAGE_SIZE,
+        before_id: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Reading]:
+        """
+        Obtiene una página de lecturas de un usuario, de la más reciente a la más antigua.
+        Pagina por keyset (fecha, id): el costo no depende de cuántas páginas se hayan leído.
+
+        Args:
+            user_id (int): ID del usuario.
+            before_fecha (Optional[datetime]): Solo lecturas anteriores a esta fecha;
+                None empieza por la más reciente.
+            limit (int): Máximo de lecturas de la página.
+            before_id (Optional[int]): ID de la última lectura de la página previa;
+                junto con `before_fecha` desempata lecturas con la misma fecha.
+            columns (Optional[Sequence[str]]): Columnas a cargar; las demás quedan en None.
+
+        Returns:
+            List[Reading]: Lecturas de la página (vacía al llegar al final).
+        """
+        if before_fecha is None:
+            return self._query("lecturas.pagina_usuario", (user_id, limit), columns).fetchall()
+        if before_id is None:
+            return self._query(
+                "lecturas.pagina_usuario_antes_de", (user_id, _fecha_sql(before_fecha), limit), columns
+            ).fetchall()
+        return self._query(
+            "lecturas.pagina_usuario_tras_clave",
+            (user_id, _fecha_sql(before_fecha), before_id, limit),
+            columns,
+        ).fetchall()
+
+    def iter_by_user(
+        self, user_id: int, batch_size: int = PAGE_SIZE, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Reading]:
+        """
+        Recorre las lecturas de un usuario (de la más reciente a la más antigua)
+        en páginas de `batch_size`, sin mantener abierto un cursor entre páginas.
+
+        Args:
+            user_id (int): ID del usuario.
+            batch_size (int): Lecturas por consulta.
+            columns (Optional[Sequence[str]]): Columnas a cargar; se añaden `id` y
+                `fecha` si faltan, porque forman la clave de paginación.
+
+        Yields:
+            Reading: Lecturas del usuario.
+        """
+        if columns is not None:
+            columns = tuple(columns) + tuple(c for c in ("id", "fecha") if c not in columns)
+        page = self.get_page(user_id, limit=batch_size, columns=columns)
+        while page:
+            yield from page
+            if len(page) < batch_size:
+                return
+            last = page[-1]
+            page = self.get_page(
+                user_id, last.fecha, batch_size, before_id=last.id, columns=columns
+            )
+
+    def monthly_summary(
+        self,
+        user_id: int,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[MonthlySummary]:
+        """
+        Agrega en SQLite el consumo, el costo y la cantidad de lecturas por mes.
+        Los rangos de meses completos (o sin límites) se leen del rollup
+        `lecturas_mensuales`; los límites a mitad de mes agregan sobre `lecturas`.
+
+        Args:
+            user_id (int): ID del usuario.
+            desde (Optional[datetime]): Inicio del rango (incluido); None sin límite.
+            hasta (Optional[datetime]): Fin del rango (excluido); None sin límite.
+
+        Returns:
+            List[MonthlySummary]: Un resumen por mes con lecturas, del más antiguo al más reciente.
+        """
+        cursor = self.db.reader().cursor()
+        if _inicio_de_mes(desde) and _inicio_de_mes(hasta):
+            # Meses completos: filas precalculadas del rollup, O(meses)
+            cursor.execute(
+                sql("lecturas_mensuales.por_usuario"),
+                (
+                    user_id,
+                    desde.strftime("%Y-%m") if desde else _MES_MIN,
+                    hasta.strftime("%Y-%m") if hasta else _MES_MAX,
+                ),
+            )
+        else:
+            cursor.execute(
+                sql("lecturas.resumen_mensual"),
+                (
+                    user_id,
+                    _fecha_sql(desde) if desde else _FECHA_MIN,
+                    _fecha_sql(hasta) if hasta else _FECHA_MAX,
+                ),
+            )
         return [
-            Reading(
-                id=row[0],
-                user_id=row[1],
-                lectura_actual=Decimal(str(row[2])),
-                lectura_anterior=Decimal(str(row[3])),
-                consumo=Decimal(str(row[4])),
-                costo=Decimal(str(row[5])),
-                fecha=datetime.fromisoformat(row[6]),
+            MonthlySummary(
+                mes=mes,
+                consumo=Decimal(str(consumo)).quantize(Decimal("0.001")),
+                costo=Decimal(str(costo)).quantize(Decimal("0.01")),
+                lecturas=lecturas,
             )
-            for row in rows
+            for mes, consumo, costo, lecturas in cursor.fetchall()
         ]
 
+    def rebuild_monthly_rollup(self) -> int:
+        """
+        Recalcula por completo `lecturas_mensuales` a partir de `lecturas`.
+
+        Returns:
+            int: Cantidad de filas (usuario, mes) del rollup reconstruido.
+        """
+        with self.db.writer() as conn:
+            conn.execute(sql("lecturas_mensuales.vaciar"))
+            return conn.execute(sql("lecturas_mensuales.reconstruir")).rowcount
+
+    def check_monthly_rollup(self) -> List[Tuple[int, str, float, float, int]]:
+        """
+        Compara `lecturas_mensuales` con la agregación de `lecturas`.
+
+        Returns:
+            List[Tuple[int, str, float, float, int]]: (usuario_id, mes, diferencia de
+            consumo, diferencia de costo, diferencia de lecturas) por cada mes
+            inconsistente; vacía si el rollup está al día.
+        """
+        cursor = self.db.reader().cursor()
+        return cursor.execute(sql("lecturas_mensuales.diferencias")).fetchall()
+
+    def date_range(self, user_id: int) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Fechas de la primera y la última lectura de un usuario.
+
+        Args:
+            user_id (int): ID del usuario.
+
+        Returns:
+            Optional[Tuple[datetime, datetime]]: (primera, última) o None si no tiene lecturas.
+        """
+        cursor = self.db.reader().cursor()
+        primera, ultima = cursor.execute(sql("lecturas.rango_fechas"), (user_id,)).fetchone()
+        if primera is None:
+            return None
+        return datetime.fromisoformat(primera), datetime.fromisoformat(ultima)
+
+    def consumption_series(
+        self, user_id: int, desde: datetime, hasta: datetime, max_puntos: int
+    ) -> List[Tuple[datetime, float]]:
+        """
+        Consumo por lectura entre `desde` (incluido) y `hasta` (excluido), con a lo
+        sumo `max_puntos` puntos. Si el rango tiene más lecturas, SQLite las agrupa
+        en `max_puntos // 2` cubetas de igual duración y cada cubeta aporta su
+        mínimo y su máximo (decimación min/max): los picos se conservan y el costo
+        de dibujar no depende de cuántas lecturas haya.
+
+        Args:
+            user_id (int): ID del usuario.
+            desde (datetime): Inicio del rango.
+            hasta (datetime): Fin del rango.
+            max_puntos (int): Puntos como máximo (p. ej. dos por píxel de ancho).
+
+        Returns:
+            List[Tuple[datetime, float]]: (fecha, consumo) en orden cronológico.
+        """
+        desde_sql, hasta_sql = _fecha_sql(desde), _fecha_sql(hasta)
+        cursor = self.db.reader().cursor()
+        # Con pocas lecturas en el rango basta la serie en bruto (máx. max_puntos + 1 filas)
+        filas = cursor.execute(
+            sql("lecturas.serie_detalle"), (user_id, desde_sql, hasta_sql, max_puntos + 1)
+        ).fetchall()
+        if len(filas) <= max_puntos:
+            return [(datetime.fromisoformat(fecha), consumo) for fecha, consumo in filas]
+
+        cubetas = max(1, max_puntos // 2)
+        dias = max((hasta - desde).total_seconds() / 86400, 1e-6)
+        puntos: List[Tuple[datetime, float]] = []
+        for _, inicio, fin, minimo, maximo, lecturas in cursor.execute(
+            sql("lecturas.serie_cubetas"), (desde_sql, cubetas / dias, user_id, desde_sql, hasta_sql)
+        ):
+            puntos.append((datetime.fromisoformat(inicio), minimo))
+            if lecturas > 1 and maximo != minimo:
+                # Envolvente de la cubeta: dentro de un píxel el orden no es visible
+                puntos.append((datetime.fromisoformat(fin), maximo))
+        return puntos
+
     def get_last_by_user(self, user_id: int) -> Optional[Reading]:
         """
         Obtiene la última lectura registrada por un usuario.
@@ -108,29 +330,7 @@ class ReadingRepository:
         Returns:
             Optional[Reading]: Última lectura o None si no existe.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha
-            FROM lecturas
-            WHERE usuario_id = ?
-            ORDER BY fecha DESC
-            LIMIT 1
-            """,
-            (user_id,),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        return Reading(
-            id=row[0],
-            user_id=row[1],
-            lectura_actual=Decimal(str(row[2])),
-            lectura_anterior=Decimal(str(row[3])),
-            consumo=Decimal(str(row[4])),
-            costo=Decimal(str(row[5])),
-            fecha=datetime.fromisoformat(row[6]),
-        )
+        return self._query("lecturas.ultima_por_usuario", (user_id,)).fetchone()
 
     def get_by_id(self, reading_id: int) -> Optional[Reading]:
         """
@@ -142,27 +342,42 @@ class ReadingRepository:
         Returns:
             Optional[Reading]: Lectura encontrada o None.
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha
-            FROM lecturas
-            WHERE id = ?
-            """,
-            (reading_id,),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        return Reading(
-            id=row[0],
-            user_id=row[1],
-            lectura_actual=Decimal(str(row[2])),
-            lectura_anterior=Decimal(str(row[3])),
-            consumo=Decimal(str(row[4])),
-            costo=Decimal(str(row[5])),
-            fecha=datetime.fromisoformat(row[6]),
-        )
+        return self._query("lecturas.por_id", (reading_id,)).fetchone()
+
+    def get_pricing_rows(self, user_id: Optional[int] = None) -> List[Tuple[int, float, datetime, float]]:
+        """
+        Obtiene los datos necesarios para re-tarificar lecturas.
+
+        Args:
+            user_id (Optional[int]): Limita a un usuario; None devuelve todas.
+
+        Returns:
+            List[Tuple[int, float, datetime, float]]: (id, consumo, fecha, costo) por lectura.
+        """
+        cursor = self.db.reader().cursor()
+        if user_id is None:
+            cursor.execute(sql("lecturas.tarificacion"))
+        else:
+            cursor.execute(sql("lecturas.tarificacion_usuario"), (user_id,))
+        return [
+            (row[0], row[1], datetime.fromisoformat(row[2]), row[3])
+            for row in cursor.fetchall()
+        ]
+
+    def update_costs(self, updates: Sequence[Tuple[Decimal, int]]) -> None:
+        """
+        Actualiza el costo de varias lecturas en una sola transacción.
+
+        Args:
+            updates (Sequence[Tuple[Decimal, int]]): Pares (nuevo costo, ID de lectura).
+        """
+        if not updates:
+            return
+        with self.db.writer() as conn:
+            conn.executemany(
+                sql("lecturas.actualizar_costo"),
+                [(float(costo), reading_id) for costo, reading_id in updates],
+            )
 
     def delete(self, reading_id: int) -> None:
         """
@@ -173,6 +388,5 @@ class ReadingRepository:
         """
         if reading_id <= 0:
             raise ValueError("ID de lectura inválido.")
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM lecturas WHERE id = ?", (reading_id,))
-        self.conn.commit()
\ No newline at end of file
+        with self.db.writer() as conn:
+            conn.execute(sql("lecturas.eliminar"), (reading_id,))
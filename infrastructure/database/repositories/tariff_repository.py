@@ -0,0 +1,97 @@
+import sqlite3
+from typing import List
+from decimal import Decimal
+from datetime import date
+from domain.entities.tariff_schedule import TariffSchedule
+from infrastructure.database.pool import as_pool
+from infrastructure.database.statements import sql
+
+
+class TariffRepository:
+    """
+    Repositorio de tarifas versionadas (tablas `tarifas` y `tramos_tarifa`).
+    Los importes se guardan como texto para conservar la precisión de Decimal.
+    """
+
+    def __init__(self, conn) -> None:
+        """
+        Inicializa el repositorio con una conexión activa a la base de datos.
+
+        Args:
+            conn: Conexión SQLite3 activa o `ConnectionPool`.
+        """
+        self.db = as_pool(conn)
+
+    def get_all(self) -> List[TariffSchedule]:
+        """
+        Obtiene todas las tarifas con sus tramos, ordenadas por fecha de vigencia.
+
+        Returns:
+            List[TariffSchedule]: Tarifas de la más antigua a la más reciente.
+        """
+        cursor = self.db.reader().cursor()
+        cursor.execute(sql("tarifas.todas"))
+        schedules: List[TariffSchedule] = []
+        for tarifa_id, nombre, vigente_desde, tramo_min, tramo_max, precio in cursor.fetchall():
+            if not schedules or schedules[-1].id != tarifa_id:
+                schedules.append(
+                    TariffSchedule(
+                        id=tarifa_id,
+                        nombre=nombre,
+                        vigente_desde=date.fromisoformat(vigente_desde),
+                    )
+                )
+            schedules[-1].tramos.append(
+                (
+                    Decimal(tramo_min),
+                    Decimal("Infinity") if tramo_max is None else Decimal(tramo_max),
+                    Decimal(precio),
+                )
+            )
+        return schedules
+
+    def save(self, schedule: TariffSchedule) -> TariffSchedule:
+        """
+        Guarda una tarifa y sus tramos en una sola transacción.
+
+        Args:
+            schedule (TariffSchedule): Tarifa a persistir (con al menos un tramo).
+
+        Returns:
+            TariffSchedule: Tarifa guardada con el ID asignado.
+
+        Raises:
+            ValueError: Si la tarifa no tiene tramos o ya existe otra con la misma vigencia.
+        """
+        if not schedule.tramos:
+            raise ValueError("La tarifa debe tener al menos un tramo.")
+        try:
+            with self.db.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    sql("tarifas.insertar"),
+                    (schedule.nombre, schedule.vigente_desde.isoformat()),
+                )
+                tarifa_id = cursor.lastrowid
+                cursor.executemany(
+                    sql("tramos_tarifa.insertar"),
+                    [
+                        (
+                            tarifa_id,
+                            orden,
+                            str(tramo_min),
+                            None if tramo_max.is_infinite() else str(tramo_max),
+                            str(precio),
+                        )
+                        for orden, (tramo_min, tramo_max, precio) in enumerate(schedule.tramos)
+                    ],
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Ya existe una tarifa vigente desde {schedule.vigente_desde}.") from e
+
+        return TariffSchedule(
+            id=tarifa_id,
+            nombre=schedule.nombre,
+            vigente_desde=schedule.vigente_desde,
+            tramos=list(schedule.tramos),
+        )
@@ -1,5 +1,11 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence, Set
 from domain.entities.user import User
+from infrastructure.database.mappers import user_factory
+from infrastructure.database.pool import as_pool
+from infrastructure.database.statements import USER_COLUMNS, sql
+
+# Parámetros por consulta `IN (...)`: SQLite anterior a 3.32 admite como máximo 999
+MAX_SQL_PARAMS = 900
 
 
 class UserRepository:
@@ -13,96 +19,82 @@ class UserRepository:
         Inicializa el repositorio con una conexión a la base de datos.
 
         Args:
-            conn: Conexión SQLite3 activa.
+            conn: Conexión SQLite3 activa o `ConnectionPool`.
         """
-        self.conn = conn
-
-    def get_all_active(self) -> List[User]:
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT id, nombre, username, password_hash, rol, activo, fecha_creacion "
-            "FROM usuarios WHERE activo = 1 ORDER BY nombre ASC"
-        )
-        rows = cursor.fetchall()
-        return [
-            User(
-                id=row[0],
-                nombre=row[1],
-                username=row[2],
-                password_hash=row[3],
-                rol=row[4],
-                activo=bool(row[5]),
-                fecha_creacion=row[6]
-            )
-            for row in rows
-        ]
+        self.db = as_pool(conn)
+
+    def _query(self, name: str, params: tuple = (), columns: Optional[Sequence[str]] = None):
+        """Ejecuta una consulta con nombre y devuelve un cursor que produce `User`."""
+        columns = tuple(columns) if columns is not None else USER_COLUMNS
+        cursor = self.db.reader().cursor()
+        cursor.row_factory = user_factory(columns)
+        return cursor.execute(sql(name, columns), params)
+
+    def get_all_active(self, columns: Optional[Sequence[str]] = None) -> List[User]:
+        """
+        Obtiene los usuarios activos ordenados por nombre.
+
+        Args:
+            columns (Optional[Sequence[str]]): Columnas a cargar; las demás quedan en
+                None (los listados no necesitan `password_hash`).
+        """
+        return self._query("usuarios.activos", columns=columns).fetchall()
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         if user_id <= 0:
             return None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT id, nombre, username, password_hash, rol, activo, fecha_creacion "
-            "FROM usuarios WHERE id = ?",
-            (user_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return User(
-                id=row[0],
-                nombre=row[1],
-                username=row[2],
-                password_hash=row[3],
-                rol=row[4],
-                activo=bool(row[5]),
-                fecha_creacion=row[6]
-            )
-        return None
+        return self._query("usuarios.por_id", (user_id,)).fetchone()
 
     def get_by_username(self, username: str) -> Optional[User]:
         if not username or not isinstance(username, str):
             return None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT id, nombre, username, password_hash, rol, activo, fecha_creacion "
-            "FROM usuarios WHERE username = ?",
-            (username,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return User(
-                id=row[0],
-                nombre=row[1],
-                username=row[2],
-                password_hash=row[3],
-                rol=row[4],
-                activo=bool(row[5]),
-                fecha_creacion=row[6]
+        return self._query("usuarios.por_username", (username,)).fetchone()
+
+    def get_active_ids(self, user_ids: Iterable[int]) -> Set[int]:
+        """
+        Filtra los IDs dados y devuelve solo los de usuarios activos.
+
+        Args:
+            user_ids (Iterable[int]): IDs a comprobar.
+
+        Returns:
+            Set[int]: Subconjunto de IDs que pertenecen a usuarios activos.
+        """
+        ids = list(set(user_ids))
+        activos: Set[int] = set()
+        cursor = self.db.reader().cursor()
+        # Un bloque de importación trae miles de IDs: se consultan por tramos
+        for inicio in range(0, len(ids), MAX_SQL_PARAMS):
+            tramo = ids[inicio:inicio + MAX_SQL_PARAMS]
+            cursor.execute(
+                f"SELECT id FROM usuarios WHERE activo = 1 AND id IN ({', '.join('?' * len(tramo))})",
+                tramo,
             )
-        return None
+            activos.update(row[0] for row in cursor.fetchall())
+        return activos
 
     def delete(self, user_id: int) -> None:
         if user_id <= 0:
             raise ValueError("ID de usuario inválido.")
-        cursor = self.conn.cursor()
-        cursor.execute("UPDATE usuarios SET activo = 0 WHERE id = ?", (user_id,))
-        cursor.execute("DELETE FROM lecturas WHERE usuario_id = ?", (user_id,))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            conn.execute(sql("usuarios.desactivar"), (user_id,))
+            conn.execute(sql("lecturas.eliminar_por_usuario"), (user_id,))
+
+    def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """Reemplaza el hash de la contraseña (p. ej. al cambiar el costo de bcrypt)."""
+        with self.db.writer() as conn:
+            conn.execute(sql("usuarios.actualizar_password"), (password_hash, user_id))
 
     def count_deleted(self) -> int:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM usuarios WHERE activo = 0")
+        cursor = self.db.reader().cursor()
+        cursor.execute(sql("usuarios.contar_eliminados"))
         return cursor.fetchone()[0]
 
     def create(self, user: User) -> int:
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO usuarios (nombre, username, password_hash, rol, activo)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (user.nombre, user.username, user.password_hash, user.rol, user.activo)
-        )
-        user_id = cursor.lastrowid
-        self.conn.commit()
-        return user_id
\ No newline at end of file
+        with self.db.writer() as conn:
+            cursor = conn.execute(
+                sql("usuarios.insertar"),
+                (user.nombre, user.username, user.password_hash, user.rol, user.activo)
+            )
+            user_id = cursor.lastrowid
+        return user_id
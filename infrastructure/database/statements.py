@@ -0,0 +1,182 @@
+"""
+Sentencias SQL con nombre, compartidas por los repositorios.
+
+sqlite3 prepara cada sentencia la primera vez que se ejecuta y la reutiliza
+desde la caché de la conexión mientras el texto sea idéntico; centralizar el
+texto aquí garantiza esos aciertos y permite dimensionar `cached_statements`.
+Las sentencias con `{columnas}` admiten proyección de columnas.
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional, Sequence, Tuple
+
+READING_COLUMNS: Tuple[str, ...] = (
+    "id", "usuario_id", "lectura_actual", "lectura_anterior", "consumo", "costo", "fecha",
+)
+USER_COLUMNS: Tuple[str, ...] = (
+    "id", "nombre", "username", "password_hash", "rol", "activo", "fecha_creacion",
+)
+
+STATEMENTS: Dict[str, str] = {
+    # Lecturas
+    "lecturas.insertar": (
+        "INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo) "
+        "VALUES (?, ?, ?, ?, ?) RETURNING id, fecha"
+    ),
+    "lecturas.insertar_lote": (
+        "INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha) "
+        "VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))"
+    ),
+    "lecturas.por_usuario": (
+        "SELECT {columnas} FROM lecturas WHERE usuario_id = ? ORDER BY fecha DESC, id DESC"
+    ),
+    # Paginación por keyset (usuario_id, fecha, id): cada página continúa tras la anterior
+    "lecturas.pagina_usuario": (
+        "SELECT {columnas} FROM lecturas WHERE usuario_id = ? "
+        "ORDER BY fecha DESC, id DESC LIMIT ?"
+    ),
+    "lecturas.pagina_usuario_antes_de": (
+        "SELECT {columnas} FROM lecturas WHERE usuario_id = ? AND fecha < ? "
+        "ORDER BY fecha DESC, id DESC LIMIT ?"
+    ),
+    "lecturas.pagina_usuario_tras_clave": (
+        "SELECT {columnas} FROM lecturas WHERE usuario_id = ? AND (fecha, id) < (?, ?) "
+        "ORDER BY fecha DESC, id DESC LIMIT ?"
+    ),
+    "lecturas.ultima_por_usuario": (
+        "SELECT {columnas} FROM lecturas WHERE usuario_id = ? ORDER BY fecha DESC, id DESC LIMIT 1"
+    ),
+    "lecturas.por_id": "SELECT {columnas} FROM lecturas WHERE id = ?",
+    # Agregación directa sobre lecturas; para meses completos se usa el rollup
+    "lecturas.resumen_mensual": (
+        "SELECT strftime('%Y-%m', fecha) AS mes, SUM(consumo), SUM(costo), COUNT(*) "
+        "FROM lecturas WHERE usuario_id = ? AND fecha >= ? AND fecha < ? "
+        "GROUP BY mes ORDER BY mes ASC"
+    ),
+    # Serie temporal de consumo: lecturas en bruto o cubetas de igual duración con su
+    # mínimo y máximo; cubeta = (julianday(fecha) - julianday(desde)) * cubetas por día
+    "lecturas.rango_fechas": "SELECT MIN(fecha), MAX(fecha) FROM lecturas WHERE usuario_id = ?",
+    "lecturas.serie_detalle": (
+        "SELECT fecha, consumo FROM lecturas WHERE usuario_id = ? AND fecha >= ? AND fecha < ? "
+        "ORDER BY fecha ASC, id ASC LIMIT ?"
+    ),
+    "lecturas.serie_cubetas": (
+        "SELECT CAST((julianday(fecha) - julianday(?)) * ? AS INTEGER) AS cubeta, "
+        "MIN(fecha), MAX(fecha), MIN(consumo), MAX(consumo), COUNT(*) "
+        "FROM lecturas WHERE usuario_id = ? AND fecha >= ? AND fecha < ? "
+        "GROUP BY cubeta ORDER BY cubeta ASC"
+    ),
+    "lecturas.tarificacion": "SELECT id, consumo, fecha, costo FROM lecturas",
+    "lecturas.tarificacion_usuario": (
+        "SELECT id, consumo, fecha, costo FROM lecturas WHERE usuario_id = ?"
+    ),
+    "lecturas.actualizar_costo": "UPDATE lecturas SET costo = ? WHERE id = ?",
+    "lecturas.eliminar": "DELETE FROM lecturas WHERE id = ?",
+    "lecturas.eliminar_por_usuario": "DELETE FROM lecturas WHERE usuario_id = ?",
+    # Rollup mensual (lecturas_mensuales), mantenido por triggers sobre lecturas
+    "lecturas_mensuales.por_usuario": (
+        "SELECT mes, consumo, costo, lecturas FROM lecturas_mensuales "
+        "WHERE usuario_id = ? AND mes >= ? AND mes < ? ORDER BY mes ASC"
+    ),
+    "lecturas_mensuales.vaciar": "DELETE FROM lecturas_mensuales",
+    "lecturas_mensuales.reconstruir": (
+        "INSERT INTO lecturas_mensuales (usuario_id, mes, consumo, costo, lecturas) "
+        "SELECT usuario_id, strftime('%Y-%m', fecha), SUM(consumo), SUM(costo), COUNT(*) "
+        "FROM lecturas GROUP BY usuario_id, strftime('%Y-%m', fecha)"
+    ),
+    # Diferencias entre el rollup y la agregación de lecturas (vacío si son consistentes)
+    "lecturas_mensuales.diferencias": (
+        "SELECT usuario_id, mes, SUM(consumo), SUM(costo), SUM(lecturas) FROM ("
+        "SELECT usuario_id, strftime('%Y-%m', fecha) AS mes, consumo, costo, 1 AS lecturas "
+        "FROM lecturas UNION ALL "
+        "SELECT usuario_id, mes, -consumo, -costo, -lecturas FROM lecturas_mensuales"
+        ") GROUP BY usuario_id, mes "
+        "HAVING SUM(lecturas) != 0 OR ABS(SUM(consumo)) > 0.0005 OR ABS(SUM(costo)) > 0.005 "
+        "ORDER BY usuario_id, mes"
+    ),
+    # Usuarios
+    "usuarios.activos": "SELECT {columnas} FROM usuarios WHERE activo = 1 ORDER BY nombre ASC",
+    "usuarios.por_id": "SELECT {columnas} FROM usuarios WHERE id = ?",
+    "usuarios.por_username": "SELECT {columnas} FROM usuarios WHERE username = ?",
+    "usuarios.desactivar": "UPDATE usuarios SET activo = 0 WHERE id = ?",
+    "usuarios.actualizar_password": "UPDATE usuarios SET password_hash = ? WHERE id = ?",
+    "usuarios.contar_eliminados": "SELECT COUNT(*) FROM usuarios WHERE activo = 0",
+    "usuarios.insertar": (
+        "INSERT INTO usuarios (nombre, username, password_hash, rol, activo) VALUES (?, ?, ?, ?, ?)"
+    ),
+    # Tarifas
+    "tarifas.todas": (
+        "SELECT t.id, t.nombre, t.vigente_desde, tr.tramo_min, tr.tramo_max, tr.precio "
+        "FROM tarifas t JOIN tramos_tarifa tr ON tr.tarifa_id = t.id "
+        "ORDER BY t.vigente_desde ASC, tr.orden ASC"
+    ),
+    "tarifas.insertar": "INSERT INTO tarifas (nombre, vigente_desde) VALUES (?, ?)",
+    "tramos_tarifa.insertar": (
+        "INSERT INTO tramos_tarifa (tarifa_id, orden, tramo_min, tramo_max, precio) "
+        "VALUES (?, ?, ?, ?, ?)"
+    ),
+    # Registro de actividad. Páginas del más reciente al más antiguo por clave
+    # (timestamp, id): el límite superior es el menor entre el fin del rango y la
+    # última fila de la página anterior. Cada filtro tiene su índice (timestamp, id implícito).
+    "eventos.insertar": (
+        "INSERT INTO eventos (timestamp, usuario_id, evento, detalles) VALUES (?, ?, ?, ?)"
+    ),
+    "eventos.pagina": (
+        "SELECT id, timestamp, usuario_id, evento, detalles FROM eventos "
+        "WHERE timestamp >= ? AND (timestamp, id) < (?, ?) "
+        "ORDER BY timestamp DESC, id DESC LIMIT ?"
+    ),
+    "eventos.pagina_usuario": (
+        "SELECT id, timestamp, usuario_id, evento, detalles FROM eventos "
+        "WHERE usuario_id = ? AND timestamp >= ? AND (timestamp, id) < (?, ?) "
+        "ORDER BY timestamp DESC, id DESC LIMIT ?"
+    ),
+    "eventos.pagina_evento": (
+        "SELECT id, timestamp, usuario_id, evento, detalles FROM eventos "
+        "WHERE evento = ? AND timestamp >= ? AND (timestamp, id) < (?, ?) "
+        "ORDER BY timestamp DESC, id DESC LIMIT ?"
+    ),
+    "eventos.pagina_usuario_evento": (
+        "SELECT id, timestamp, usuario_id, evento, detalles FROM eventos "
+        "WHERE usuario_id = ? AND evento = ? AND timestamp >= ? AND (timestamp, id) < (?, ?) "
+        "ORDER BY timestamp DESC, id DESC LIMIT ?"
+    ),
+}
+
+_DEFAULT_COLUMNS = {"lecturas": READING_COLUMNS, "usuarios": USER_COLUMNS}
+
+# Holgura para las variantes proyectadas y las consultas ad hoc
+STATEMENT_CACHE_SIZE = max(128, 4 * len(STATEMENTS))
+
+_rendered: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+
+def sql(name: str, columns: Optional[Sequence[str]] = None) -> str:
+    """
+    Texto de la sentencia `name`, con la proyección de columnas indicada.
+
+    Args:
+        name (str): Nombre de la sentencia en `STATEMENTS`.
+        columns (Optional[Sequence[str]]): Columnas a seleccionar; None selecciona todas.
+
+    Returns:
+        str: SQL listo para ejecutar (el mismo objeto en cada llamada).
+
+    Raises:
+        KeyError: Si la sentencia no existe.
+        ValueError: Si alguna columna no pertenece a la tabla.
+    """
+    template = STATEMENTS[name]
+    if "{columnas}" not in template:
+        return template
+    tabla = name.split(".", 1)[0]
+    columns = tuple(columns) if columns is not None else _DEFAULT_COLUMNS[tabla]
+    key = (name, columns)
+    text = _rendered.get(key)
+    if text is None:
+        invalidas = set(columns) - set(_DEFAULT_COLUMNS[tabla])
+        if invalidas:
+            raise ValueError(f"Columnas desconocidas en {tabla}: {sorted(invalidas)}")
+        text = template.format(columnas=", ".join(columns))
+        _rendered[key] = text
+    return text
@@ -0,0 +1 @@
+"""Diagnóstico de rendimiento."""
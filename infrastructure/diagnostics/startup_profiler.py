@@ -0,0 +1,132 @@
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+def _resolver(name: str, globals_: Optional[dict], level: int) -> Optional[str]:
+    """Nombre absoluto del módulo de una sentencia `import` (None si no se puede resolver)."""
+    if level == 0:
+        return name
+    package = (globals_ or {}).get("__package__") or (globals_ or {}).get("__name__")
+    try:
+        return importlib.util.resolve_name("." * level + name, package)
+    except (ImportError, ValueError):
+        return None
+
+
+class StartupProfiler:
+    """
+    Mide el arranque de la aplicación: la duración de cada fase y el costo de cada
+    módulo importado por primera vez, atribuido a la sentencia `import` que lo cargó
+    (tiempo acumulado y propio, sin sus imports anidados). Solo mide el hilo que
+    llama a `start()`. Desactivado, `phase` y `mark` no hacen nada.
+    """
+
+    def __init__(self, enabled: bool = True, reloj: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Args:
+            enabled (bool): False convierte el perfilador en un no-op.
+            reloj (Callable[[], float]): Fuente de tiempo (inyectable en tests).
+        """
+        self.enabled = enabled
+        self._reloj = reloj
+        self._inicio = reloj()
+        # (nombre, inicio relativo, duración); las marcas tienen duración None
+        self._fases: List[Tuple[str, float, Optional[float]]] = []
+        # (módulo, acumulado, propio), en orden de finalización
+        self._imports: List[Tuple[str, float, float]] = []
+        # Tiempo de imports hijos acumulado por cada import en curso
+        self._pila: List[float] = []
+        self._import_original = builtins.__import__
+        self._hilo: Optional[int] = None
+
+    def start(self) -> None:
+        """Empieza a medir los imports del hilo actual."""
+        if not self.enabled or self._hilo is not None:
+            return
+        self._hilo = threading.get_ident()
+        self._import_original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        """Deja de medir imports; las fases y marcas siguen disponibles."""
+        if self._hilo is not None and builtins.__import__ == self._import:
+            builtins.__import__ = self._import_original
+        self._hilo = None
+
+    @contextmanager
+    def phase(self, nombre: str) -> Iterator[None]:
+        """Mide la duración del bloque como una fase del arranque."""
+        if not self.enabled:
+            yield
+            return
+        inicio = self._reloj()
+        try:
+            yield
+        finally:
+            self._fases.append((nombre, inicio - self._inicio, self._reloj() - inicio))
+
+    def mark(self, nombre: str) -> None:
+        """Registra un instante (p. ej. la primera vez que se pinta una ventana)."""
+        if self.enabled:
+            self._fases.append((nombre, self._reloj() - self._inicio, None))
+
+    def imports(self) -> List[Tuple[str, float, float]]:
+        """(módulo, segundos acumulados, segundos propios) de cada import medido."""
+        return list(self._imports)
+
+    def report(self, top: int = 30) -> str:
+        """
+        Genera el informe de texto.
+
+        Args:
+            top (int): Cantidad de imports a listar, de mayor a menor tiempo acumulado.
+
+        Returns:
+            str: Informe con las fases, las marcas y los imports más costosos.
+        """
+        lineas = ["Perfil de arranque", "", "Fases (ms desde el inicio | duración ms):"]
+        for nombre, inicio, duracion in sorted(self._fases, key=lambda f: f[1]):
+            columna = f"{duracion * 1000:10.1f}" if duracion is not None else f"{'marca':>10}"
+            lineas.append(f"  {inicio * 1000:10.1f} | {columna}  {nombre}")
+
+        total_propio = sum(propio for _, _, propio in self._imports)
+        lineas += [
+            "",
+            f"Imports: {len(self._imports)} módulos, {total_propio * 1000:.1f} ms en total",
+            "  acumulado ms | propio ms  módulo",
+        ]
+        for modulo, acumulado, propio in sorted(self._imports, key=lambda i: -i[1])[:top]:
+            lineas.append(f"  {acumulado * 1000:12.1f} | {propio * 1000:9.1f}  {modulo}")
+        return "\n".join(lineas) + "\n"
+
+    def write(self, path: Path) -> Path:
+        """Escribe el informe en `path` (creando el directorio) y devuelve la ruta."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report(), encoding="utf-8")
+        return path
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._import_original
+        if threading.get_ident() != self._hilo:
+            return original(name, globals, locals, fromlist, level)
+        modulo = _resolver(name, globals, level)
+        if modulo is None or modulo in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._pila.append(0.0)
+        inicio = self._reloj()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            acumulado = self._reloj() - inicio
+            hijos = self._pila.pop()
+            if self._pila:
+                self._pila[-1] += acumulado
+            self._imports.append((modulo, acumulado, acumulado - hijos))
@@ -1,45 +1,117 @@
-import os
-import csv
+import atexit
+import queue
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional
+
+from config import settings
+from domain.entities.activity_event import ActivityEvent
+from infrastructure.logging.csv_backend import TS_FORMATO, CsvLogBackend
+
+PAGE_SIZE = 100
+
+# Logger activos, para vaciarlos al salir aunque nadie llame a close()
+_ACTIVOS: "weakref.WeakSet[ActivityLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _cerrar_activos() -> None:
+    # Con un plazo: un almacén atascado no debe impedir que termine el proceso
+    for logger in list(_ACTIVOS):
+        logger.close(settings.LOG_EXIT_TIMEOUT_S)
+
+
+class _Vaciado:
+    """Marca en la cola: el escritor la señala tras escribir todo lo anterior."""
+
+    def __init__(self) -> None:
+        self.hecho = threading.Event()
+
+
+_DETENER = object()
+
+
+@dataclass(frozen=True)
+class LoggerStats:
+    """Contadores del logger de actividad."""
+    encolados: int
+    escritos: int
+    descartados: int
+    fallidos: int
+    lotes: int
+
+    @property
+    def pendientes(self) -> int:
+        """Eventos aceptados que aún no llegaron al almacén."""
+        return self.encolados - self.escritos - self.fallidos
 
 
 class ActivityLogger:
     """
-    Sistema de registro de actividades sensibles en formato CSV.
-    Diseñado para ser thread-safe, offline y resistente a fallos.
+    Sistema de registro de actividades sensibles.
+
+    `log_event` no bloquea: valida, pone el evento en una cola acotada y vuelve.
+    Un hilo escritor entrega los eventos al almacén por lotes: al llegar a `lote`
+    eventos, a los `intervalo` segundos, con `flush()` y al cerrar (también al
+    salir del intérprete). Si la cola está llena el evento se descarta y se
+    cuenta en `stats()`; un fallo de escritura tampoco detiene la app.
+
+    El almacén es intercambiable: por defecto `CsvLogBackend` (archivos CSV
+    rotados); `SqliteLogBackend` guarda los eventos en la tabla `eventos`, con
+    índices para consultar por usuario o por tipo de evento. Un almacén ofrece
+    `write(filas)`, `query(...)` (del más reciente al más antiguo) y `close()`.
     """
 
-    def __init__(self, log_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        log_path: Optional[str] = None,
+        max_cola: Optional[int] = None,
+        lote: Optional[int] = None,
+        intervalo: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        rotacion_diaria: Optional[bool] = None,
+        reloj: Callable[[], datetime] = datetime.now,
+        backend=None,
+    ) -> None:
         """
-        Inicializa el logger con una ruta opcional de archivo.
+        Inicializa el logger con una ruta opcional de archivo o un almacén.
 
         Args:
             log_path (Optional[str]): Ruta al archivo CSV de logs.
                                       Si es None, usa 'logs/logs_actividad.csv'.
+            max_cola (Optional[int]): Eventos en espera antes de descartar; por defecto `LOG_QUEUE_MAX`.
+            lote (Optional[int]): Eventos que fuerzan una escritura; por defecto `LOG_BATCH_SIZE`.
+            intervalo (Optional[float]): Segundos máximos antes de vaciar al almacén;
+                por defecto `LOG_FLUSH_INTERVAL_S`.
+            max_bytes (Optional[int]): Tamaño que dispara la rotación del CSV; por defecto `LOG_ROTATE_MAX_BYTES`.
+            rotacion_diaria (Optional[bool]): Rotar el CSV al cambiar el día; por defecto `LOG_ROTATE_DAILY`.
+            reloj (Callable[[], datetime]): Fecha de cada evento (inyectable en tests).
+            backend: Almacén de los eventos; si es None, un `CsvLogBackend` en `log_path`.
         """
-        if log_path is None:
-            self.log_path = Path("logs") / "logs_actividad.csv"
-        else:
-            self.log_path = Path(log_path)
-        self.ensure_log_directory_and_file()
-
-    def ensure_log_directory_and_file(self) -> None:
-        """
-        Crea el directorio de logs y el archivo CSV con encabezados si no existen.
-        """
-        log_dir = self.log_path.parent
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        if not self.log_path.exists():
-            with open(self.log_path, mode="w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "usuario_id", "evento", "detalles"])
+        if backend is None:
+            backend = CsvLogBackend(log_path, max_bytes=max_bytes, rotacion_diaria=rotacion_diaria)
+        self.backend = backend
+        self._reloj = reloj
+        self.lote = lote if lote is not None else settings.LOG_BATCH_SIZE
+        self.intervalo = intervalo if intervalo is not None else settings.LOG_FLUSH_INTERVAL_S
+        self._cola: "queue.Queue" = queue.Queue(
+            maxsize=max_cola if max_cola is not None else settings.LOG_QUEUE_MAX
+        )
+        self._lock = threading.Lock()
+        self._escritor: Optional[threading.Thread] = None
+        self._encolados = 0
+        self._escritos = 0
+        self._descartados = 0
+        self._fallidos = 0
+        self._lotes = 0
+        _ACTIVOS.add(self)
 
     def log_event(self, user_id: int, event: str, details: str = "") -> None:
         """
-        Registra un evento en el archivo CSV de forma segura.
+        Encola un evento para escribirlo en el almacén, sin esperar al disco.
 
         Args:
             user_id (int): ID del usuario que generó el evento.
@@ -54,11 +126,181 @@ class ActivityLogger:
         if not event or not isinstance(event, str):
             raise ValueError("event debe ser una cadena no vacía.")
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._reloj().strftime(TS_FORMATO)
+        self._iniciar_escritor()
+        # Se cuenta antes de encolar: el escritor podría escribirlo antes de volver de put
+        with self._lock:
+            self._encolados += 1
+        try:
+            self._cola.put_nowait((timestamp, user_id, event, details))
+        except queue.Full:
+            with self._lock:
+                self._encolados -= 1
+                self._descartados += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que los eventos encolados hasta ahora estén escritos en el almacén.
+
+        Args:
+            timeout (Optional[float]): Espera máxima en segundos, incluida la de
+                encolar la marca si la cola está llena; None espera sin límite.
+
+        Returns:
+            bool: False si venció `timeout` antes de terminar.
+        """
+        if self._escritor is None and self._cola.empty():
+            return True
+        self._iniciar_escritor()
+        marca = _Vaciado()
+        limite = time.monotonic() + timeout if timeout is not None else None
+        try:
+            self._cola.put(marca, timeout=timeout)
+        except queue.Full:
+            return False
+        return marca.hecho.wait(max(0.0, limite - time.monotonic()) if limite is not None else None)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Escribe lo pendiente, cierra el almacén y detiene el hilo escritor.
+
+        Args:
+            timeout (Optional[float]): Espera máxima en segundos; al vencer, el hilo
+                sigue en segundo plano y lo pendiente puede no llegar al almacén.
+        """
+        escritor = self._escritor
+        if escritor is None:
+            return
+        limite = time.monotonic() + timeout if timeout is not None else None
+        try:
+            self._cola.put(_DETENER, timeout=timeout)
+        except queue.Full:
+            return
+        escritor.join(max(0.0, limite - time.monotonic()) if limite is not None else None)
+        # Lo encolado tras la parada lo escribe un nuevo hilo en el próximo evento o flush()
+        with self._lock:
+            if self._escritor is escritor and not escritor.is_alive():
+                self._escritor = None
+
+    def query_page(
+        self,
+        user_id: Optional[int] = None,
+        evento: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        limit: int = PAGE_SIZE,
+        antes_de: Optional[ActivityEvent] = None,
+    ) -> List[ActivityEvent]:
+        """
+        Página de eventos filtrados, del más reciente al más antiguo.
+
+        Args:
+            user_id (Optional[int]): Solo eventos de este usuario; None todos.
+            evento (Optional[str]): Solo eventos de este tipo; None todos.
+            desde (Optional[datetime]): Inicio del rango (incluido); None sin límite.
+            hasta (Optional[datetime]): Fin del rango (excluido); None sin límite.
+            limit (int): Tamaño de la página.
+            antes_de (Optional[ActivityEvent]): Último evento de la página anterior;
+                la página empieza justo después (paginación por clave).
+
+        Returns:
+            List[ActivityEvent]: Hasta `limit` eventos.
+        """
+        # Lo encolado hasta ahora también cuenta, sin colgar la consulta si el escritor se atasca
+        self.flush(settings.LOG_QUERY_FLUSH_TIMEOUT_S)
+        return self.backend.query(user_id, evento, desde, hasta, limit, antes_de)
+
+    def query_events(
+        self,
+        user_id: Optional[int] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        evento: Optional[str] = None,
+    ) -> List[ActivityEvent]:
+        """
+        Todos los eventos que cumplen los filtros.
+
+        Args:
+            user_id (Optional[int]): Solo eventos de este usuario; None todos.
+            desde (Optional[datetime]): Inicio del rango (incluido); None sin límite.
+            hasta (Optional[datetime]): Fin del rango (excluido); None sin límite.
+            evento (Optional[str]): Solo eventos de este tipo; None todos.
+
+        Returns:
+            List[ActivityEvent]: Eventos en orden cronológico.
+        """
+        self.flush(settings.LOG_QUERY_FLUSH_TIMEOUT_S)
+        eventos = self.backend.query(user_id, evento, desde, hasta)
+        eventos.reverse()
+        return eventos
+
+    def stats(self) -> LoggerStats:
+        with self._lock:
+            return LoggerStats(
+                self._encolados, self._escritos, self._descartados, self._fallidos, self._lotes
+            )
+
+    def _iniciar_escritor(self) -> None:
+        # El hilo se crea con el primer evento, y de nuevo si se cerró el logger o si
+        # un close() con timeout dejó apuntando a un hilo que ya terminó
+        escritor = self._escritor
+        if escritor is not None and escritor.is_alive():
+            return
+        with self._lock:
+            if self._escritor is None or not self._escritor.is_alive():
+                self._escritor = threading.Thread(
+                    target=self._escribir, name="activity-logger", daemon=True
+                )
+                self._escritor.start()
+
+    def _escribir(self) -> None:
+        """Bucle del hilo escritor: agrupa eventos y los vuelca por lotes."""
+        pendientes: List[tuple] = []
+        limite = 0.0
+        try:
+            while True:
+                # Sin pendientes espera sin plazo; con pendientes, hasta vencer el intervalo
+                espera = max(0.0, limite - time.monotonic()) if pendientes else None
+                try:
+                    item = self._cola.get(timeout=espera)
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, tuple):
+                    if not pendientes:
+                        limite = time.monotonic() + self.intervalo
+                    pendientes.append(item)
+                    if len(pendientes) < self.lote:
+                        continue
+
+                # Lote lleno, intervalo vencido, flush() o cierre: se vuelca al almacén
+                self._volcar(pendientes)
+                pendientes = []
+                if isinstance(item, _Vaciado):
+                    item.hecho.set()
+                elif item is _DETENER:
+                    return
+        finally:
+            self.backend.close()
+            with self._lock:
+                if self._escritor is threading.current_thread():
+                    self._escritor = None
+            # Lo encolado tras _DETENER (p. ej. si close() venció su timeout) lo escribe otro hilo
+            if not self._cola.empty():
+                self._iniciar_escritor()
+
+    def _volcar(self, filas: List[tuple]) -> None:
+        """Escribe un lote en el almacén y actualiza los contadores."""
+        if not filas:
+            return
         try:
-            with open(self.log_path, mode="a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([timestamp, user_id, event, details])
+            self.backend.write(filas)
         except Exception as e:
             # Fallback seguro: no detiene la app, pero registra en stderr
-            print(f"[ERROR LOG] No se pudo escribir en {self.log_path}: {e}", flush=True)
\ No newline at end of file
+            print(f"[ERROR LOG] No se pudo escribir en {self.backend}: {e}", flush=True)
+            with self._lock:
+                self._fallidos += len(filas)
+            return
+        with self._lock:
+            self._escritos += len(filas)
+            self._lotes += 1
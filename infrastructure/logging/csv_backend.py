@@ -0,0 +1,298 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import groupby
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from config import settings
+from domain.entities.activity_event import ActivityEvent
+
+ENCABEZADO = ["timestamp", "usuario_id", "evento", "detalles"]
+TS_FORMATO = "%Y-%m-%d %H:%M:%S"
+
+
+def _valida(fila: List[str]) -> bool:
+    # Filas ajenas al formato (p. ej. editadas a mano) se ignoran
+    return len(fila) == 4 and str(fila[1]).isdigit()
+
+
+@dataclass
+class _Segmento:
+    """Rango de tiempo y usuarios de un segmento del log (el activo o uno rotado)."""
+    desde: Optional[str] = None
+    hasta: Optional[str] = None
+    usuarios: Set[int] = field(default_factory=set)
+    eventos: int = 0
+
+    def agregar(self, filas: Iterable[tuple]) -> None:
+        for fila in filas:
+            if not _valida(fila):
+                continue
+            timestamp, user_id = fila[0], fila[1]
+            self.desde = min(self.desde or timestamp, timestamp)
+            self.hasta = max(self.hasta or timestamp, timestamp)
+            self.usuarios.add(int(user_id))
+            self.eventos += 1
+
+
+class CsvLogBackend:
+    """
+    Almacén del log de actividad en archivos CSV.
+
+    El archivo activo rota al superar `max_bytes` o al cambiar el día: pasa a un
+    segmento `.csv.gz` y el manifiesto JSON anota su rango de fechas y sus
+    usuarios, para que las consultas abran solo los segmentos necesarios.
+    Cada evento recibe como `id` su posición en el log (1 el primero).
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        rotacion_diaria: Optional[bool] = None,
+    ) -> None:
+        """
+        Args:
+            log_path (Optional[str]): Ruta al archivo CSV de logs.
+                                      Si es None, usa 'logs/logs_actividad.csv'.
+            max_bytes (Optional[int]): Tamaño que dispara la rotación; por defecto `LOG_ROTATE_MAX_BYTES`.
+            rotacion_diaria (Optional[bool]): Rotar al cambiar el día; por defecto `LOG_ROTATE_DAILY`.
+        """
+        if log_path is None:
+            self.log_path = Path("logs") / "logs_actividad.csv"
+        else:
+            self.log_path = Path(log_path)
+        self.max_bytes = max_bytes if max_bytes is not None else settings.LOG_ROTATE_MAX_BYTES
+        self.rotacion_diaria = (
+            rotacion_diaria if rotacion_diaria is not None else settings.LOG_ROTATE_DAILY
+        )
+        # Archivo y csv.writer únicos, usados solo desde el hilo escritor del logger
+        self._archivo = None
+        self._csv = None
+        self._segmento: Optional[_Segmento] = None
+        # Excluye rotar mientras una consulta lee el manifiesto y el archivo activo
+        self._rotacion = threading.Lock()
+        self.ensure_log_directory_and_file()
+
+    def __str__(self) -> str:
+        return str(self.log_path)
+
+    def ensure_log_directory_and_file(self) -> None:
+        """
+        Crea el directorio de logs y el archivo CSV con encabezados si no existen.
+        """
+        log_dir = self.log_path.parent
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self.log_path.exists():
+            with open(self.log_path, mode="w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(ENCABEZADO)
+
+    @property
+    def manifest_path(self) -> Path:
+        """Manifiesto JSON de los segmentos rotados (`logs_actividad.manifest.json`)."""
+        return self.log_path.with_suffix(".manifest.json")
+
+    def write(self, filas: List[tuple]) -> None:
+        """
+        Añade un lote de filas (timestamp, usuario_id, evento, detalles) al archivo activo.
+
+        Raises:
+            OSError: Si no se pudo escribir; el archivo se reabre en el siguiente lote.
+        """
+        try:
+            with self._rotacion:
+                if self._archivo is None:
+                    self._abrir()
+                # Un lote puede cruzar la medianoche: cada día va a su segmento
+                for dia, grupo in groupby(filas, key=lambda fila: fila[0][:10]):
+                    if self._debe_rotar(dia):
+                        self._rotar()
+                    grupo = list(grupo)
+                    self._csv.writerows(grupo)
+                    self._segmento.agregar(grupo)
+                self._archivo.flush()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._archivo is not None:
+            try:
+                self._archivo.close()
+            except Exception:
+                pass
+            self._archivo = None
+
+    def segments_for(
+        self,
+        user_id: Optional[int] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Path]:
+        """
+        Segmentos rotados que pueden contener eventos del usuario en el rango,
+        según el manifiesto (el archivo activo no se incluye).
+        """
+        return [
+            self.log_path.parent / seg["archivo"]
+            for seg in self._leer_manifiesto()
+            if _segmento_coincide(seg, user_id, _ts(desde), _ts(hasta))
+        ]
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        evento: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        antes_de: Optional[ActivityEvent] = None,
+    ) -> List[ActivityEvent]:
+        """
+        Eventos filtrados, del más reciente al más antiguo. Lee los segmentos que el
+        manifiesto señala y el archivo activo; la paginación no evita leerlos.
+        """
+        d, h = _ts(desde), _ts(hasta)
+        clave = (_ts(antes_de.timestamp), antes_de.id) if antes_de is not None else None
+        filas: List[Tuple[str, int, List[str]]] = []
+        with self._rotacion:
+            # La posición de cada evento cuenta también los segmentos que no se abren
+            posicion = 0
+            for seg in self._leer_manifiesto():
+                if _segmento_coincide(seg, user_id, d, h):
+                    path = self.log_path.parent / seg["archivo"]
+                    with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+                        filas.extend(_filtrar(csv.reader(f), posicion, user_id, evento, d, h, clave))
+                posicion += seg["eventos"]
+            if self.log_path.exists():
+                with open(self.log_path, newline="", encoding="utf-8") as f:
+                    filas.extend(_filtrar(csv.reader(f), posicion, user_id, evento, d, h, clave))
+        filas.sort(key=lambda fila: (fila[0], fila[1]), reverse=True)
+        if limit is not None:
+            filas = filas[:limit]
+        return [
+            ActivityEvent(datetime.strptime(ts, TS_FORMATO), int(uid), ev, detalles, id=n)
+            for ts, n, (_, uid, ev, detalles) in filas
+        ]
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """
+        Filas (timestamp, usuario_id, evento, detalles) de todo el log en el orden
+        en que se escribieron: los segmentos rotados y después el archivo activo.
+        """
+        with self._rotacion:
+            paths = [self.log_path.parent / seg["archivo"] for seg in self._leer_manifiesto()]
+        for path in paths:
+            with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+                yield from _filas_validas(csv.reader(f))
+        if self.log_path.exists():
+            with open(self.log_path, newline="", encoding="utf-8") as f:
+                yield from _filas_validas(csv.reader(f))
+
+    def _abrir(self) -> None:
+        """Abre el archivo activo y recupera el rango y los usuarios que ya contiene."""
+        self.ensure_log_directory_and_file()
+        self._segmento = _Segmento()
+        with open(self.log_path, newline="", encoding="utf-8") as f:
+            lector = csv.reader(f)
+            next(lector, None)
+            self._segmento.agregar(lector)
+        self._archivo = open(self.log_path, mode="a", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._archivo)
+
+    def _debe_rotar(self, dia: str) -> bool:
+        if not self._segmento.eventos:
+            return False
+        if self.rotacion_diaria and self._segmento.hasta[:10] != dia:
+            return True
+        return self._archivo.tell() >= self.max_bytes
+
+    def _rotar(self) -> None:
+        """Comprime el archivo activo como segmento, lo anota en el manifiesto y abre uno nuevo."""
+        self._archivo.close()
+        seg = self._segmento
+        base = f"{self.log_path.stem}.{seg.desde.replace('-', '').replace(':', '').replace(' ', '-')}"
+        destino = self.log_path.with_name(f"{base}.csv.gz")
+        n = 1
+        while destino.exists():
+            destino = self.log_path.with_name(f"{base}-{n}.csv.gz")
+            n += 1
+        with open(self.log_path, "rb") as origen, gzip.open(destino, "wb") as comprimido:
+            shutil.copyfileobj(origen, comprimido)
+
+        manifiesto = self._leer_manifiesto()
+        manifiesto.append({
+            "archivo": destino.name,
+            "desde": seg.desde,
+            "hasta": seg.hasta,
+            "usuarios": sorted(seg.usuarios),
+            "eventos": seg.eventos,
+        })
+        # Reemplazo atómico: una consulta nunca ve un manifiesto a medias
+        temporal = self.manifest_path.with_suffix(".tmp")
+        temporal.write_text(json.dumps({"segmentos": manifiesto}, indent=1), encoding="utf-8")
+        os.replace(temporal, self.manifest_path)
+
+        self.log_path.unlink()
+        self._abrir()
+
+    def _leer_manifiesto(self) -> List[dict]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))["segmentos"]
+        except FileNotFoundError:
+            return []
+
+
+def _ts(fecha: Optional[datetime]) -> Optional[str]:
+    """Fecha en el formato de texto de la columna timestamp."""
+    return fecha.strftime(TS_FORMATO) if fecha is not None else None
+
+
+def _segmento_coincide(seg: dict, user_id: Optional[int], desde: Optional[str], hasta: Optional[str]) -> bool:
+    return (
+        (desde is None or seg["hasta"] >= desde)
+        and (hasta is None or seg["desde"] < hasta)
+        and (user_id is None or user_id in seg["usuarios"])
+    )
+
+
+def _filas_validas(lector) -> Iterator[tuple]:
+    next(lector, None)  # encabezado
+    for fila in lector:
+        if _valida(fila):
+            yield fila[0], int(fila[1]), fila[2], fila[3]
+
+
+def _filtrar(
+    lector,
+    posicion: int,
+    user_id: Optional[int],
+    evento: Optional[str],
+    desde: Optional[str],
+    hasta: Optional[str],
+    antes_de: Optional[Tuple[str, int]],
+) -> Iterator[Tuple[str, int, List[str]]]:
+    """Filas que cumplen los filtros, con su timestamp y su posición en el log."""
+    next(lector, None)  # encabezado
+    uid = str(user_id) if user_id is not None else None
+    for fila in lector:
+        if not _valida(fila):
+            continue
+        posicion += 1
+        if uid is not None and fila[1] != uid:
+            continue
+        if evento is not None and fila[2] != evento:
+            continue
+        if (desde is not None and fila[0] < desde) or (hasta is not None and fila[0] >= hasta):
+            continue
+        if antes_de is not None and (fila[0], posicion) >= antes_de:
+            continue
+        yield fila[0], posicion, fila
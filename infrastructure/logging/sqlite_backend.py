@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from domain.entities.activity_event import ActivityEvent
+from infrastructure.database.repositories.event_repository import EventRepository
+
+
+class SqliteLogBackend:
+    """
+    Almacén del log de actividad en la tabla `eventos` de la base de datos.
+
+    Cada lote del `ActivityLogger` es una sola transacción; las consultas usan
+    los índices (usuario_id, timestamp) y (evento, timestamp) y paginan por clave,
+    así que su costo depende del tamaño de la página y no del historial.
+    """
+
+    def __init__(self, conn) -> None:
+        """
+        Args:
+            conn: Conexión SQLite3 activa o `ConnectionPool` (el llamador la cierra).
+        """
+        self.repository = EventRepository(conn)
+
+    def __str__(self) -> str:
+        return "la tabla eventos"
+
+    def write(self, filas: List[tuple]) -> None:
+        self.repository.save_many(filas)
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        evento: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        antes_de: Optional[ActivityEvent] = None,
+    ) -> List[ActivityEvent]:
+        return self.repository.get_page(user_id, evento, desde, hasta, limit, antes_de)
+
+    def import_history(self, rows: Iterable[tuple]) -> int:
+        """
+        Copia una sola vez un historial previo (p. ej. `CsvLogBackend.iter_rows()`)
+        a la tabla, en una transacción.
+
+        Returns:
+            int: Eventos importados.
+
+        Raises:
+            ValueError: Si la tabla ya tiene eventos (el historial se duplicaría).
+        """
+        if self.repository.get_page(limit=1):
+            raise ValueError("La tabla eventos ya tiene eventos: el historial solo se importa una vez.")
+        return self.repository.import_rows(rows)
+
+    def close(self) -> None:
+        # La conexión pertenece a quien creó el almacén
+        pass
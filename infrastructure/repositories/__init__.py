@@ -1 +1,6 @@
-"""Repositorios de infraestructura."""
+"""
+Repositorios de infraestructura con la interfaz anterior (`create_tables`,
+`add_user`, `add_reading`, `get_by_user`). Son subclases de los repositorios
+de `infrastructure.database.repositories`: comparten sus consultas y su pool
+de conexiones, así que no abren una conexión por llamada.
+"""
@@ -1,53 +1,112 @@
+import argparse
 import sys
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from infrastructure.database.connection import init_db, get_db_connection
-from infrastructure.database.repositories.user_repository import UserRepository
-from infrastructure.auth.auth_service import AuthService
-from application.services.reading_service import ReadingService
-from application.services.user_service import UserService
-from presentation.views.login_view import LoginView
-from presentation.views.main_window import MainWindow
+from infrastructure.diagnostics.startup_profiler import StartupProfiler
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Electric Tariffs App")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="RUTA",
+        help="Escribe un informe de tiempos de import y de cada fase del arranque "
+             "(por defecto en logs/perfil_arranque.txt).",
+    )
+    # Los argumentos restantes son para Qt (p. ej. -platform)
+    return parser.parse_known_args(argv)
 
 
 def main() -> None:
-    # ✅ Inicializar base de datos al inicio
-    init_db()
+    args, qt_args = parse_args(sys.argv[1:])
+    profiler = StartupProfiler(enabled=args.profile_startup is not None)
+    profiler.start()
+    try:
+        run(profiler, qt_args)
+    finally:
+        if profiler.enabled:
+            profiler.stop()
+            from config import settings
+            path = profiler.write(args.profile_startup or settings.LOGS_DIR / "perfil_arranque.txt")
+            print(f"Perfil de arranque escrito en {path}")
+
 
-    app = QApplication(sys.argv)
-    conn = get_db_connection()
+def run(profiler: StartupProfiler, qt_args) -> None:
+    # Antes del login solo se carga lo que necesita el diálogo; matplotlib, bcrypt y
+    # las vistas se importan después de autenticar
+    with profiler.phase("imports del login"):
+        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QApplication, QMessageBox
+        from config import settings
+        from infrastructure.database.connection import init_db
+        from infrastructure.database.pool import ConnectionPool
+        from infrastructure.database.repositories.user_repository import UserRepository
+        from infrastructure.auth.auth_service import AuthService
+        from presentation.views.login_view import LoginView
+        from presentation.workers.task_runner import TaskRunner
 
-    # Inicializar dependencias
-    user_repo = UserRepository(conn)
+    # ✅ Inicializar base de datos al inicio
+    with profiler.phase("init_db"):
+        init_db()
+
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+    # Escritor único + un lector por hilo (WAL): las lecturas no esperan a las escrituras
+    pool = ConnectionPool()
+    user_repo = UserRepository(pool)
     auth_service = AuthService(user_repo)
-    logger = None  # Pendiente: inyectar logger real
-    reading_service = ReadingService(conn, logger)
-    user_service = UserService(user_repo, logger)
-
-    # Mostrar login
-    login = LoginView()
-    if login.exec() == login.DialogCode.Accepted:
-        username = login.username_input.text().strip()
-        password = login.password_input.text()
-
-        if not username or not password:
-            QMessageBox.warning(login, "Error", "Usuario y contraseña son obligatorios.")
-            sys.exit(1)
-
-        user = auth_service.login(username, password)
-        if user is None:
-            QMessageBox.warning(login, "Error", "Credenciales inválidas.")
-            sys.exit(1)
-
-        if user.rol not in ("admin", "usuario"):
-            QMessageBox.critical(login, "Error", "Rol de usuario no válido.")
-            sys.exit(1)
-
-        main_window = MainWindow(user, reading_service, user_service)
-        main_window.show()
-        sys.exit(app.exec())
-    else:
+    # Consultas, escrituras y la verificación de bcrypt en hilos de fondo:
+    # ni el login ni la ventana se congelan
+    runner = TaskRunner(app)
+
+    # Mostrar login; la contraseña se verifica en el runner mientras el diálogo muestra el progreso
+    with profiler.phase("construir login"):
+        login = LoginView(auth_service.login, runner)
+    QTimer.singleShot(0, lambda: profiler.mark("login visible"))
+    with profiler.phase("login (incluye la espera del usuario y la verificación)"):
+        accepted = login.exec() == login.DialogCode.Accepted
+    if not accepted:
         sys.exit(0)
+    user = login.user
+
+    if user.rol not in ("admin", "usuario"):
+        QMessageBox.critical(login, "Error", "Rol de usuario no válido.")
+        sys.exit(1)
+
+    with profiler.phase("imports de la ventana principal"):
+        from application.services.audit_service import AuditService
+        from application.services.reading_service import ReadingService
+        from application.services.user_service import UserService
+        from infrastructure.logging.activity_logger import ActivityLogger
+        from infrastructure.logging.sqlite_backend import SqliteLogBackend
+        from presentation.views.main_window import MainWindow
+
+    with profiler.phase("ventana principal"):
+        if settings.LOG_BACKEND == "sqlite":
+            # Los lotes del log comparten el escritor del pool con el resto de la app
+            logger = ActivityLogger(backend=SqliteLogBackend(pool))
+        else:
+            logger = ActivityLogger(str(settings.LOGS_DIR / "logs_actividad.csv"))
+        reading_service = ReadingService(pool, logger)
+        user_service = UserService(user_repo, logger, reading_service)
+        main_window = MainWindow(
+            user, reading_service, user_service, runner, audit_service=AuditService(logger)
+        )
+        main_window.show()
+
+    def primer_pintado() -> None:
+        profiler.mark("ventana principal visible")
+        # Lo que se importe a partir de aquí (p. ej. al abrir la gráfica) ya no es arranque
+        profiler.stop()
+
+    QTimer.singleShot(0, primer_pintado)
+    exit_code = app.exec()
+    runner.wait_for_done()
+    logger.close()
+    pool.close()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
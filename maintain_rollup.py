@@ -0,0 +1,48 @@
+"""
+Script de mantenimiento del rollup mensual de lecturas (`lecturas_mensuales`).
+Sin opciones verifica la consistencia; con --rebuild lo recalcula por completo.
+"""
+
+import argparse
+import sys
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.repositories.reading_repository import ReadingRepository
+
+
+def maintain_rollup(rebuild: bool = False) -> int:
+    """
+    Verifica (y opcionalmente reconstruye) el rollup mensual.
+
+    Returns:
+        int: Código de salida (0 si el rollup queda consistente).
+    """
+    init_db()
+    conn = get_db_connection()
+    repository = ReadingRepository(conn)
+
+    try:
+        if rebuild:
+            filas = repository.rebuild_monthly_rollup()
+            print(f"🔁 Rollup mensual reconstruido: {filas} filas (usuario, mes).")
+        diferencias = repository.check_monthly_rollup()
+    finally:
+        conn.close()
+
+    if not diferencias:
+        print("✅ El rollup mensual es consistente con las lecturas.")
+        return 0
+    print(f"⚠️  {len(diferencias)} meses inconsistentes (ejecute con --rebuild para corregir):")
+    for usuario_id, mes, consumo, costo, lecturas in diferencias:
+        print(f"   - usuario {usuario_id}, {mes}: consumo {consumo:+.3f}, "
+              f"costo {costo:+.2f}, lecturas {lecturas:+d}")
+    return 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifica o reconstruye el rollup mensual de lecturas.")
+    parser.add_argument(
+        "--rebuild", action="store_true",
+        help="Recalcula lecturas_mensuales desde lecturas antes de verificar.",
+    )
+    args = parser.parse_args()
+    sys.exit(maintain_rollup(args.rebuild))
@@ -0,0 +1,130 @@
+"""
+Script para administrar las tarifas versionadas y re-tarificar las lecturas guardadas.
+
+    python manage_tariffs.py listar
+    python manage_tariffs.py agregar "Tarifa 2026" 2026-01-01 tramos.csv
+    python manage_tariffs.py retarificar [--usuario ID]
+
+El CSV de tramos tiene las columnas minimo, maximo y tarifa; el último tramo deja
+`maximo` vacío (o `inf`) porque no tiene límite. Una tarifa nueva no cambia el costo
+de las lecturas ya guardadas hasta ejecutar `retarificar`.
+"""
+
+import argparse
+import csv
+import sqlite3
+import sys
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
+from config import settings
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.pool import as_pool
+from infrastructure.database.repositories.tariff_repository import TariffRepository
+from infrastructure.logging.activity_logger import ActivityLogger
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+from application.services.reading_service import ReadingService
+from application.services.tariff_schedule_service import TariffScheduleService
+
+
+def _leer_tramos(csv_path: str) -> List[Tuple[Decimal, Decimal, Decimal]]:
+    """Tramos (mínimo, máximo, tarifa) del CSV; un máximo vacío es ilimitado."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        tramos = []
+        for fila, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                maximo = (row.get("maximo") or "").strip() or "Infinity"
+                tramos.append((Decimal(row["minimo"].strip()), Decimal(maximo), Decimal(row["tarifa"].strip())))
+            except (KeyError, AttributeError, InvalidOperation):
+                raise ValueError(f"Fila {fila}: se esperan las columnas minimo, maximo y tarifa numéricas.")
+    return tramos
+
+
+def list_schedules() -> int:
+    db = as_pool(get_db_connection())
+    try:
+        schedules = TariffScheduleService(TariffRepository(db)).get_schedules()
+    finally:
+        db.close()
+    if not schedules:
+        print("Sin tarifas guardadas: se aplica la tarifa por defecto (TariffCalculator.TRAMOS).")
+    for s in schedules:
+        tramos = ", ".join(f"{lo}-{hi}: {tarifa}" for lo, hi, tarifa in s.tramos)
+        print(f"{s.vigente_desde}  {s.nombre}  [{tramos}]")
+    return 0
+
+
+def add_schedule(nombre: str, vigente_desde: str, csv_path: str) -> int:
+    """
+    Guarda una tarifa nueva a partir del CSV de tramos.
+
+    Returns:
+        int: Código de salida (0 si se guardó).
+    """
+    try:
+        desde = date.fromisoformat(vigente_desde)
+    except ValueError:
+        print(f"❌ Fecha de vigencia '{vigente_desde}' inválida (se espera YYYY-MM-DD).")
+        return 1
+    try:
+        tramos = _leer_tramos(csv_path)
+    except FileNotFoundError:
+        print(f"❌ No existe el archivo '{csv_path}'.")
+        return 1
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    db = as_pool(get_db_connection())
+    try:
+        saved = TariffScheduleService(TariffRepository(db)).add_schedule(nombre, desde, tramos)
+    except (ValueError, sqlite3.IntegrityError) as e:
+        print(f"❌ No se pudo guardar la tarifa: {e}")
+        return 1
+    finally:
+        db.close()
+    print(f"✅ Tarifa '{saved.nombre}' vigente desde {saved.vigente_desde} ({len(saved.tramos)} tramos).")
+    print("   Ejecutar `python manage_tariffs.py retarificar` para aplicarla a las lecturas guardadas.")
+    return 0
+
+
+def reprice(user_id: Optional[int] = None) -> int:
+    """
+    Re-tarifica las lecturas guardadas con la tarifa vigente en su fecha.
+
+    Returns:
+        int: Código de salida (0 si terminó).
+    """
+    db = as_pool(get_db_connection())
+    if settings.LOG_BACKEND == "sqlite":
+        logger = ActivityLogger(backend=SqliteLogBackend(db))
+    else:
+        logger = ActivityLogger(str(settings.LOGS_DIR / "logs_actividad.csv"))
+    try:
+        cambiadas = ReadingService(db, logger).reprice_readings(user_id)
+    finally:
+        logger.close()
+        db.close()
+    alcance = f"del usuario {user_id}" if user_id is not None else "de todos los usuarios"
+    print(f"✅ {cambiadas} lecturas {alcance} cambiaron de costo.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Administra las tarifas versionadas.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    comandos.add_parser("listar", help="Muestra las tarifas guardadas.")
+    agregar = comandos.add_parser("agregar", help="Guarda una tarifa nueva.")
+    agregar.add_argument("nombre", help="Nombre descriptivo de la tarifa.")
+    agregar.add_argument("vigente_desde", help="Primer día en que aplica (YYYY-MM-DD).")
+    agregar.add_argument("csv_path", help="CSV con las columnas minimo, maximo y tarifa.")
+    retarificar = comandos.add_parser("retarificar", help="Recalcula el costo de las lecturas guardadas.")
+    retarificar.add_argument("--usuario", type=int, default=None, help="Solo las lecturas de este usuario.")
+    args = parser.parse_args()
+
+    init_db()
+    if args.comando == "listar":
+        sys.exit(list_schedules())
+    if args.comando == "agregar":
+        sys.exit(add_schedule(args.nombre, args.vigente_desde, args.csv_path))
+    sys.exit(reprice(args.usuario))
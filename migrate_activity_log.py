@@ -0,0 +1,44 @@
+"""
+Script para copiar el historial del registro de actividad en CSV (archivo activo
+y segmentos rotados) a la tabla `eventos`, antes de cambiar `LOG_BACKEND` a "sqlite".
+Se ejecuta una sola vez, con la aplicación cerrada.
+"""
+
+import argparse
+import sys
+from config import settings
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.logging.csv_backend import CsvLogBackend
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+
+
+def migrate_activity_log(log_path: str) -> int:
+    """
+    Importa el log CSV en la tabla `eventos`.
+
+    Returns:
+        int: Código de salida (0 si se importó el historial).
+    """
+    init_db()
+    conn = get_db_connection()
+    try:
+        importados = SqliteLogBackend(conn).import_history(CsvLogBackend(log_path).iter_rows())
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        conn.close()
+
+    print(f"✅ {importados} eventos copiados a la tabla eventos.")
+    print('   Ya puede fijarse LOG_BACKEND = "sqlite" en config/settings.py.')
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Copia el log de actividad CSV a la base de datos.")
+    parser.add_argument(
+        "--log-path", default=str(settings.LOGS_DIR / "logs_actividad.csv"),
+        help="Archivo activo del log CSV (por defecto %(default)s).",
+    )
+    args = parser.parse_args()
+    sys.exit(migrate_activity_log(args.log_path))
@@ -0,0 +1,190 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from application.services.reading_events import (
+    LECTURA_AGREGADA,
+    LECTURA_ELIMINADA,
+    LECTURAS_RECARGADAS,
+    ReadingChange,
+)
+from domain.entities.reading import Reading
+from infrastructure.database.repositories.reading_repository import PAGE_SIZE
+from ..workers.task_runner import TaskRunner
+
+# Columnas que usan la tabla y el desglose del costo; el resto no se carga
+DASHBOARD_COLUMNS = ("id", "lectura_actual", "consumo", "costo", "fecha")
+HEADERS = ["Fecha", "Lectura Actual", "Consumo", "Costo", "Eliminar"]
+COSTO_COLUMN = 3
+DELETE_COLUMN = 4
+
+
+class _Orden:
+    """
+    Clave ascendente equivalente al orden (fecha DESC, id DESC) de la tabla.
+    Compara las fechas tal cual, sin pasar por el epoch: `timestamp()` sobre una
+    fecha naive usa la zona local y desordena las horas de un cambio de horario.
+    """
+
+    __slots__ = ("fecha", "id")
+
+    def __init__(self, reading: Reading) -> None:
+        self.fecha = reading.fecha
+        self.id = reading.id
+
+    def __lt__(self, other: "_Orden") -> bool:
+        return (self.fecha, self.id) > (other.fecha, other.id)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Orden) and (self.fecha, self.id) == (other.fecha, other.id)
+
+
+class ReadingTableModel(QAbstractTableModel):
+    """
+    Lecturas de un usuario, de la más reciente a la más antigua, cargadas por
+    páginas (keyset) a medida que la vista las necesita (`canFetchMore`/`fetchMore`).
+    No crea widgets ni items por celda: el texto se formatea al pintarse.
+    Con un `TaskRunner` asíncrono las páginas se consultan en segundo plano.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        reading_service,
+        page_size: int = PAGE_SIZE,
+        parent=None,
+        runner: Optional[TaskRunner] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.user_id = user_id
+        self.reading_service = reading_service
+        self.page_size = page_size
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self._rows: List[Reading] = []
+        self._claves: List[_Orden] = []
+        self._agotado = False
+        self._fetching = False
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        r = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return r.fecha.strftime("%Y-%m-%d %H:%M")
+            if column == 1:
+                return f"{r.lectura_actual:.2f}"
+            if column == 2:
+                return f"{r.consumo:.2f}"
+            if column == COSTO_COLUMN:
+                return f"${r.costo:.2f}"
+            if column == DELETE_COLUMN:
+                return "Eliminar"
+        elif role == Qt.ItemDataRole.ToolTipRole and column == COSTO_COLUMN:
+            # El desglose solo se calcula para la celda sobre la que se posa el cursor
+            return self.format_breakdown(r)
+        return None
+
+    def format_breakdown(self, reading: Reading) -> Optional[str]:
+        """
+        Desglose del costo para el tooltip, solo con las tarifas ya compiladas:
+        en frío devuelve None y las compila en segundo plano en lugar de
+        consultar la base desde el hilo de la interfaz.
+        """
+        tramos = self.reading_service.get_cached_cost_breakdown(reading)
+        if tramos is None:
+            self.runner.submit(self.reading_service.preload_tariffs, key=f"tarifas:{id(self)}")
+            return None
+        lines = []
+        for tramo in tramos:
+            limite = "+" if tramo.tramo_max.is_infinite() else f"-{tramo.tramo_max}"
+            lines.append(
+                f"{tramo.tramo_min}{limite} kWh: {tramo.consumo:.2f} kWh x {tramo.tarifa} = ${tramo.costo:.2f}"
+            )
+        return "\n".join(lines)
+
+    def reading_at(self, row: int) -> Optional[Reading]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._agotado and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._agotado or self._fetching:
+            return
+        self._fetching = True
+        last = self._rows[-1] if self._rows else None
+        self.runner.submit(
+            self._load_page,
+            self.user_id,
+            last.fecha if last else None,
+            self.page_size,
+            last.id if last else None,
+            DASHBOARD_COLUMNS,
+            key=f"pagina_lecturas:{id(self)}",
+            on_result=self._append_page,
+        )
+
+    def _load_page(self, *args: Any) -> List[Reading]:
+        """Corre en el runner: deja compiladas las tarifas que usará el tooltip del costo."""
+        self.reading_service.preload_tariffs()
+        return self.reading_service.get_readings_page(*args)
+
+    def _append_page(self, page: List[Reading]) -> None:
+        self._fetching = False
+        if len(page) < self.page_size:
+            self._agotado = True
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self._claves.extend(_Orden(r) for r in page)
+        self.endInsertRows()
+
+    def reload(self) -> None:
+        """Descarta las filas cargadas y vuelve a pedir la primera página."""
+        self.beginResetModel()
+        self._rows = []
+        self._claves = []
+        self._agotado = False
+        # Una página pedida antes del reinicio queda obsoleta al pedir la nueva
+        self._fetching = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def apply_change(self, change: ReadingChange) -> None:
+        """Inserta o quita solo la fila afectada; las recargas en lote reinician el modelo."""
+        if not change.afecta(self.user_id):
+            return
+        if change.tipo == LECTURAS_RECARGADAS:
+            self.reload()
+            return
+        r = change.reading
+        clave = _Orden(r)
+        if change.tipo == LECTURA_AGREGADA:
+            row = bisect_right(self._claves, clave)
+            if row == len(self._rows) and not self._agotado:
+                return  # cae después de lo cargado: llegará con su página
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, r)
+            self._claves.insert(row, clave)
+            self.endInsertRows()
+        elif change.tipo == LECTURA_ELIMINADA:
+            row = bisect_left(self._claves, clave)
+            if row < len(self._claves) and self._claves[row] == clave:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                del self._claves[row]
+                self.endRemoveRows()
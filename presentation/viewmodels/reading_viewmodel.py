@@ -1,20 +1,33 @@
+from typing import Optional
 from PyQt6.QtCore import QObject, pyqtSignal as Signal
 from decimal import Decimal
+from ..workers.task_runner import TaskRunner
 
 
 class ReadingViewModel(QObject):
     reading_saved = Signal(object)
     error_occurred = Signal(str)
+    last_reading_loaded = Signal(float)
 
-    def __init__(self, user_id: int, reading_service) -> None:
+    def __init__(self, user_id: int, reading_service, runner: Optional[TaskRunner] = None) -> None:
         super().__init__()
         self.user_id = user_id
         self.reading_service = reading_service
+        # Sin runner, las operaciones se ejecutan en el acto en el hilo llamador
+        self.runner = runner or TaskRunner(self, synchronous=True)
         self._last_reading: float = 0.0
 
     def load_last_reading(self) -> None:
-        last = self.reading_service.get_last_reading_by_user(self.user_id)
+        self.runner.submit(
+            self.reading_service.get_last_reading_by_user,
+            self.user_id,
+            key=f"ultima_lectura:{self.user_id}",
+            on_result=self._on_last_reading,
+        )
+
+    def _on_last_reading(self, last) -> None:
         self._last_reading = float(last.lectura_actual) if last else 0.0
+        self.last_reading_loaded.emit(self._last_reading)
 
     def get_last_reading(self) -> float:
         return self._last_reading
@@ -23,12 +36,12 @@ class ReadingViewModel(QObject):
         if current <= previous:
             self.error_occurred.emit("La lectura actual debe ser mayor que la anterior.")
             return
-        try:
-            reading = self.reading_service.register_reading(
-                user_id=self.user_id,
-                lectura_actual=current,
-                lectura_anterior=previous
-            )
-            self.reading_saved.emit(reading)
-        except Exception as e:
-            self.error_occurred.emit(f"Error al guardar: {str(e)}")
\ No newline at end of file
+        # Escritura: sin clave, nunca se descarta por una petición posterior
+        self.runner.submit(
+            self.reading_service.register_reading,
+            self.user_id,
+            str(current),
+            str(previous),
+            on_result=self.reading_saved.emit,
+            on_error=lambda e: self.error_occurred.emit(f"Error al guardar: {str(e)}"),
+        )
@@ -1,36 +1,50 @@
 from PyQt6.QtCore import QObject, pyqtSignal as Signal
-from typing import List
+from typing import List, Optional, Tuple
 from domain.entities.user import User
+from ..workers.task_runner import TaskRunner
 
 
 class UserViewModel(QObject):
     users_loaded = Signal(list)
+    deleted_count_loaded = Signal(int)
     user_deleted = Signal(int)
     error_occurred = Signal(str)
 
-    def __init__(self, user_service) -> None:
+    def __init__(self, user_service, runner: Optional[TaskRunner] = None) -> None:
         super().__init__()
         self.user_service = user_service
+        # Sin runner, las operaciones se ejecutan en el acto en el hilo llamador
+        self.runner = runner or TaskRunner(self, synchronous=True)
 
     def load_all_users(self) -> None:
-        try:
-            users: List[User] = self.user_service.get_all_users()
-            self.users_loaded.emit(users)
-        except Exception as e:
-            self.error_occurred.emit(f"Error al cargar usuarios: {str(e)}")
+        self.runner.submit(
+            self._fetch_users,
+            key="usuarios",
+            on_result=self._on_users,
+            on_error=lambda e: self.error_occurred.emit(f"Error al cargar usuarios: {str(e)}"),
+        )
+
+    def _fetch_users(self) -> Tuple[List[User], int]:
+        return self.user_service.get_all_users(), self.user_service.get_deleted_user_count()
+
+    def _on_users(self, result: Tuple[List[User], int]) -> None:
+        users, deleted = result
+        self.users_loaded.emit(users)
+        self.deleted_count_loaded.emit(deleted)
 
     def delete_user(self, user_id: int) -> None:
         if user_id <= 0:
             self.error_occurred.emit("ID de usuario inválido.")
             return
-        try:
-            self.user_service.delete_user(user_id)
-            self.user_deleted.emit(user_id)
-        except Exception as e:
-            self.error_occurred.emit(f"Error al eliminar usuario: {str(e)}")
+        self.runner.submit(
+            self.user_service.delete_user,
+            user_id,
+            on_result=lambda _: self.user_deleted.emit(user_id),
+            on_error=lambda e: self.error_occurred.emit(f"Error al eliminar usuario: {str(e)}"),
+        )
 
     def get_deleted_user_count(self) -> int:
         try:
             return self.user_service.get_deleted_user_count()
         except Exception:
-            return 0
\ No newline at end of file
+            return 0
@@ -0,0 +1,149 @@
+from datetime import datetime
+from typing import List, Optional
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
+    QLabel, QLineEdit, QDateEdit, QMessageBox
+)
+from PyQt6.QtCore import QDate
+from PyQt6.QtGui import QIntValidator
+from config import settings
+from domain.entities.activity_event import ActivityEvent
+from ..workers.task_runner import TaskRunner
+
+# Fecha mínima de los selectores: se muestra como "Sin límite" y no filtra
+_SIN_LIMITE = QDate(2000, 1, 1)
+
+
+class AuditLogView(QWidget):
+    """
+    Registro de actividad para administradores: filtros por usuario, tipo de
+    evento y fechas, en páginas del evento más reciente al más antiguo.
+    Cada página continúa tras el último evento de la anterior, así que pasar
+    de página cuesta lo mismo al principio que al final del historial.
+    """
+
+    def __init__(self, audit_service, runner: Optional[TaskRunner] = None,
+                 page_size: Optional[int] = None) -> None:
+        super().__init__()
+        self.audit_service = audit_service
+        self.page_size = page_size or settings.AUDIT_PAGE_SIZE
+        # Sin runner, la consulta se ejecuta en el acto en el hilo de la interfaz
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        # Último evento de cada página ya vista; la primera página no tiene cursor
+        self._cursores: List[Optional[ActivityEvent]] = [None]
+        self._eventos: List[ActivityEvent] = []
+        self.setup_ui()
+        self.load_data()
+
+    def setup_ui(self) -> None:
+        layout = QVBoxLayout()
+
+        filtros = QHBoxLayout()
+        self.user_input = QLineEdit()
+        self.user_input.setPlaceholderText("ID de usuario")
+        self.user_input.setValidator(QIntValidator(1, 2 ** 31 - 1, self))
+        self.event_input = QLineEdit()
+        self.event_input.setPlaceholderText("Evento (ej: registro_lectura)")
+        self.desde_input = self.create_date_input()
+        self.hasta_input = self.create_date_input()
+        self.search_btn = QPushButton("Buscar")
+        self.search_btn.clicked.connect(self.load_data)
+        self.user_input.returnPressed.connect(self.load_data)
+        self.event_input.returnPressed.connect(self.load_data)
+        filtros.addWidget(self.user_input)
+        filtros.addWidget(self.event_input)
+        filtros.addWidget(QLabel("Desde"))
+        filtros.addWidget(self.desde_input)
+        filtros.addWidget(QLabel("Hasta"))
+        filtros.addWidget(self.hasta_input)
+        filtros.addWidget(self.search_btn)
+        layout.addLayout(filtros)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Fecha", "Usuario", "Evento", "Detalles"])
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        paginacion = QHBoxLayout()
+        self.prev_btn = QPushButton("Anterior")
+        self.next_btn = QPushButton("Siguiente")
+        self.page_label = QLabel()
+        self.prev_btn.clicked.connect(self.previous_page)
+        self.next_btn.clicked.connect(self.next_page)
+        paginacion.addWidget(self.prev_btn)
+        paginacion.addWidget(self.page_label)
+        paginacion.addWidget(self.next_btn)
+        paginacion.addStretch()
+        layout.addLayout(paginacion)
+        self.setLayout(layout)
+
+    def create_date_input(self) -> QDateEdit:
+        date_input = QDateEdit()
+        date_input.setCalendarPopup(True)
+        date_input.setDisplayFormat("yyyy-MM-dd")
+        date_input.setMinimumDate(_SIN_LIMITE)
+        date_input.setSpecialValueText("Sin límite")
+        date_input.setDate(_SIN_LIMITE)
+        return date_input
+
+    def filters(self) -> tuple:
+        """(usuario, evento, desde, hasta) de los filtros; None donde no se filtra."""
+        user_text = self.user_input.text().strip()
+        desde = self.desde_input.date()
+        hasta = self.hasta_input.date()
+        return (
+            int(user_text) if user_text else None,
+            self.event_input.text().strip() or None,
+            _inicio_del_dia(desde) if desde != _SIN_LIMITE else None,
+            # La fecha final se incluye completa
+            _inicio_del_dia(hasta.addDays(1)) if hasta != _SIN_LIMITE else None,
+        )
+
+    def load_data(self) -> None:
+        """Primera página con los filtros actuales."""
+        self._cursores = [None]
+        self.fetch_page()
+
+    def next_page(self) -> None:
+        if self._eventos:
+            self._cursores.append(self._eventos[-1])
+            self.fetch_page()
+
+    def previous_page(self) -> None:
+        if len(self._cursores) > 1:
+            self._cursores.pop()
+            self.fetch_page()
+
+    def fetch_page(self) -> None:
+        self.runner.submit(
+            self.audit_service.get_events_page,
+            *self.filters(),
+            self._cursores[-1],
+            self.page_size,
+            key="auditoria",
+            on_result=self.show_events,
+            on_error=lambda e: QMessageBox.warning(self, "Error", str(e)),
+        )
+
+    def show_events(self, eventos: List[ActivityEvent]) -> None:
+        if not eventos and len(self._cursores) > 1:
+            # La página anterior era la última aunque estuviera completa
+            self._cursores.pop()
+            self.next_btn.setEnabled(False)
+            return
+        self._eventos = eventos
+        self.table.setRowCount(len(eventos))
+        for row, e in enumerate(eventos):
+            self.table.setItem(row, 0, QTableWidgetItem(e.timestamp.strftime("%Y-%m-%d %H:%M:%S")))
+            self.table.setItem(row, 1, QTableWidgetItem(str(e.user_id)))
+            self.table.setItem(row, 2, QTableWidgetItem(e.evento))
+            self.table.setItem(row, 3, QTableWidgetItem(e.detalles))
+        self.page_label.setText(f"Página {len(self._cursores)}")
+        self.prev_btn.setEnabled(len(self._cursores) > 1)
+        # Una página incompleta es la última
+        self.next_btn.setEnabled(len(eventos) == self.page_size)
+
+
+def _inicio_del_dia(fecha: QDate) -> datetime:
+    return datetime(fecha.year(), fecha.month(), fecha.day())
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import QTimer, pyqtSignal as Signal
+from config import settings
+from application.services.reading_events import ReadingChange
+from .reading_changes import DeferredReload, follow_reading_changes
+from ..workers.task_runner import TaskRunner
+
+# Puntos pedidos por píxel de ancho: la decimación min/max entrega dos por cubeta
+POINTS_PER_PIXEL = 2
+# Margen a cada lado del rango visible, para que la línea llegue a los bordes
+RANGE_MARGIN = 0.05
+
+
+class ConsumptionSeriesView(DeferredReload, QWidget):
+    """
+    Serie temporal del consumo por lectura, con zoom y desplazamiento.
+    Cada cambio del rango visible o del ancho pide solo la resolución que cabe en
+    pantalla: SQLite agrupa las lecturas en una cubeta por píxel y devuelve su
+    mínimo y su máximo (ver `ReadingRepository.consumption_series`).
+    """
+
+    # Reenvía los cambios del servicio al hilo de la interfaz
+    reading_changed = Signal(object)
+
+    def __init__(self, user_id: int, reading_service, runner: Optional[TaskRunner] = None) -> None:
+        super().__init__()
+        self.user_id = user_id
+        self.reading_service = reading_service
+        # Sin runner, la consulta se ejecuta en el acto en el hilo de la interfaz
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self._full_range: Optional[Tuple[datetime, datetime]] = None
+        self._points: List[Tuple[datetime, float]] = []
+        # Los límites que pone el código no deben disparar otra consulta
+        self._setting_limits = False
+        # Zoom, desplazamiento y cambio de tamaño se agrupan en una sola consulta
+        self._refetch = QTimer(self)
+        self._refetch.setSingleShot(True)
+        self._refetch.setInterval(settings.SERIES_REFETCH_DELAY_MS)
+        self._refetch.timeout.connect(self.fetch_visible)
+        self.setup_ui()
+        self.load_data()
+        follow_reading_changes(self, reading_service)
+
+    def setup_ui(self) -> None:
+        from matplotlib import dates as mdates
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
+        from matplotlib.figure import Figure
+
+        self._mdates = mdates
+        layout = QVBoxLayout()
+        self.figure = Figure(figsize=(8, 6), dpi=100)
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar2QT(self.canvas, self)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.xaxis_date()
+        self.ax.set_ylabel("Consumo (kWh)")
+        self.ax.set_title("Consumo por lectura")
+        self.ax.grid(linestyle='--', alpha=0.7)
+        (self.line,) = self.ax.plot([], [], color="#00C8D6", linewidth=1)
+        self._empty_text = self.ax.text(
+            0.5, 0.5, "No hay datos para mostrar", ha='center', va='center',
+            transform=self.ax.transAxes, visible=False,
+        )
+        self.ax.callbacks.connect("xlim_changed", self.on_xlim_changed)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+    def load_data(self) -> None:
+        self.runner.submit(
+            self.reading_service.get_reading_date_range,
+            self.user_id,
+            key=f"serie_rango:{self.user_id}",
+            on_result=self.show_range,
+        )
+
+    def show_range(self, full_range: Optional[Tuple[datetime, datetime]]) -> None:
+        """Fija el rango completo; la primera carga muestra todo, las siguientes conservan el zoom."""
+        primera_carga = self._full_range is None
+        self._full_range = full_range
+        if full_range is None:
+            self.show_series([])
+            return
+        if primera_carga:
+            primera, ultima = full_range
+            if primera == ultima:
+                primera, ultima = primera - timedelta(days=1), ultima + timedelta(days=1)
+            self.set_visible_range(primera, ultima)
+        self.fetch_visible()
+
+    def visible_range(self) -> Tuple[datetime, datetime]:
+        x0, x1 = self.ax.get_xlim()
+        return (
+            self._mdates.num2date(x0).replace(tzinfo=None),
+            self._mdates.num2date(x1).replace(tzinfo=None),
+        )
+
+    def set_visible_range(self, desde: datetime, hasta: datetime) -> None:
+        self._setting_limits = True
+        try:
+            self.ax.set_xlim(self._mdates.date2num(desde), self._mdates.date2num(hasta))
+        finally:
+            self._setting_limits = False
+
+    def fetch_visible(self) -> None:
+        """Pide la serie del rango visible con a lo sumo `POINTS_PER_PIXEL` puntos por píxel."""
+        self._refetch.stop()
+        if self._full_range is None:
+            return
+        desde, hasta = self.visible_range()
+        margen = (hasta - desde) * RANGE_MARGIN
+        max_puntos = POINTS_PER_PIXEL * max(self.canvas.width(), 100)
+        # La clave descarta la respuesta de un rango que el usuario ya dejó atrás
+        self.runner.submit(
+            self.reading_service.get_consumption_series,
+            self.user_id,
+            desde - margen,
+            hasta + margen + timedelta(seconds=1),
+            max_puntos,
+            key=f"serie:{self.user_id}",
+            on_result=self.show_series,
+        )
+
+    def show_series(self, points: List[Tuple[datetime, float]]) -> None:
+        self._points = points
+        self.line.set_data(self._mdates.date2num([fecha for fecha, _ in points]), [c for _, c in points])
+        self._empty_text.set_visible(not points)
+        max_consumo = max((c for _, c in points), default=0.0)
+        # Solo se ajusta el eje Y: el X lo controlan el zoom y el desplazamiento
+        self.ax.set_ylim(0, max_consumo * 1.08 if max_consumo > 0 else 1.0)
+        self.canvas.draw_idle()
+
+    def on_xlim_changed(self, _ax) -> None:
+        if not self._setting_limits:
+            self._refetch.start()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        if self._full_range is not None:
+            self._refetch.start()
+
+    def apply_change(self, change: ReadingChange) -> None:
+        # Recargar el rango visible son dos consultas acotadas por el ancho en píxeles
+        if change.afecta(self.user_id):
+            self.request_reload()
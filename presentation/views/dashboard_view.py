@@ -1,37 +1,54 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox
-from PyQt6.QtCore import Qt
+from typing import Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView, QMessageBox
+from PyQt6.QtCore import pyqtSignal as Signal
+from application.services.reading_events import LECTURAS_RECARGADAS, ReadingChange
+from ..models.reading_table_model import DELETE_COLUMN, ReadingTableModel
+from ..widgets.delete_button_delegate import DeleteButtonDelegate
+from .reading_changes import DeferredReload, follow_reading_changes
+from ..workers.task_runner import TaskRunner
 
 
-class DashboardView(QWidget):
-    def __init__(self, user_id: int, reading_service) -> None:
+class DashboardView(DeferredReload, QWidget):
+    # Reenvía los cambios del servicio al hilo de la interfaz
+    reading_changed = Signal(object)
+
+    def __init__(self, user_id: int, reading_service, runner: Optional[TaskRunner] = None) -> None:
         super().__init__()
         self.user_id = user_id
         self.reading_service = reading_service
+        self.runner = runner
         self.setup_ui()
         self.load_data()
+        follow_reading_changes(self, reading_service)
 
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Fecha", "Lectura Actual", "Consumo", "Costo", "Eliminar"])
+        # Modelo paginado: la vista pide más filas al desplazarse hasta el final
+        self.model = ReadingTableModel(self.user_id, self.reading_service, parent=self, runner=self.runner)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
+        # Altura de fila fija: la vista no mide cada fila al desplazarse
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.delete_delegate = DeleteButtonDelegate(self.table)
+        self.delete_delegate.delete_requested.connect(self.on_delete_requested)
+        self.table.setItemDelegateForColumn(DELETE_COLUMN, self.delete_delegate)
         layout.addWidget(self.table)
         self.setLayout(layout)
 
     def load_data(self) -> None:
-        readings = self.reading_service.get_all_readings_by_user(self.user_id)
-        self.table.setRowCount(len(readings))
-        for row, r in enumerate(reversed(readings)):
-            self.table.setItem(row, 0, QTableWidgetItem(r.fecha.strftime("%Y-%m-%d %H:%M")))
-            self.table.setItem(row, 1, QTableWidgetItem(f"{r.lectura_actual:.2f}"))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{r.consumo:.2f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(f"${r.costo:.2f}"))
-
-            delete_btn = QPushButton("Eliminar")
-            delete_btn.setStyleSheet("background-color: #ff4d4d; color: white;")
-            delete_btn.clicked.connect(lambda _, rid=r.id: self.delete_reading(rid))
-            self.table.setCellWidget(row, 4, delete_btn)
+        self.model.reload()
+
+    def apply_change(self, change: ReadingChange) -> None:
+        if change.tipo == LECTURAS_RECARGADAS and change.afecta(self.user_id):
+            self.request_reload()
+        else:
+            self.model.apply_change(change)
+
+    def on_delete_requested(self, row: int) -> None:
+        reading = self.model.reading_at(row)
+        if reading is not None:
+            self.delete_reading(reading.id)
 
     def delete_reading(self, reading_id: int) -> None:
         reply = QMessageBox.question(
@@ -39,5 +56,8 @@ class DashboardView(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.reading_service.delete_reading(reading_id)
-            self.load_data()
\ No newline at end of file
+            # La fila se quita al recibir el evento LECTURA_ELIMINADA
+            if self.runner is None:
+                self.reading_service.delete_reading(reading_id)
+            else:
+                self.runner.submit(self.reading_service.delete_reading, reading_id)
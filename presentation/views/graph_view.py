@@ -1,62 +1,255 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from collections import defaultdict
-from typing import List, Dict
+from bisect import bisect_left
 from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List, Optional
+from PyQt6.QtWidgets import (
+    QButtonGroup, QHBoxLayout, QMessageBox, QPushButton, QStackedWidget, QWidget, QVBoxLayout
+)
+from PyQt6.QtCore import pyqtSignal as Signal
+from config import settings
+from application.services.reading_events import LECTURA_AGREGADA, LECTURAS_RECARGADAS, ReadingChange
+from .reading_changes import DeferredReload, follow_reading_changes
+from ..workers.task_runner import TaskRunner
 
+if TYPE_CHECKING:
+    from matplotlib.patches import Rectangle
+    from .consumption_series_view import ConsumptionSeriesView
 
-class GraphView(QWidget):
-    def __init__(self, user_id: int, reading_service) -> None:
+
+BAR_WIDTH = 0.8
+BAR_COLOR = "#00C8D6"
+# Modos de la gráfica: barras por mes o serie temporal por lectura
+MODE_MONTHLY, MODE_SERIES = range(2)
+
+
+class GraphView(DeferredReload, QWidget):
+    # Reenvía los cambios del servicio al hilo de la interfaz
+    reading_changed = Signal(object)
+
+    def __init__(
+        self,
+        user_id: int,
+        reading_service,
+        runner: Optional[TaskRunner] = None,
+        max_meses: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            user_id (int): Usuario cuyas lecturas se grafican.
+            reading_service: Servicio de lecturas.
+            runner (Optional[TaskRunner]): Ejecuta las consultas; None las hace en el acto.
+            max_meses (Optional[int]): Meses más recientes a dibujar (0 dibuja todos);
+                por defecto `GRAPH_MAX_MONTHS`.
+        """
         super().__init__()
         self.user_id = user_id
         self.reading_service = reading_service
+        # Sin runner, la consulta se ejecuta en el acto en el hilo de la interfaz
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self.max_meses = max_meses if max_meses is not None else settings.GRAPH_MAX_MONTHS
+        self._loading = False
+        # mes -> [consumo, costo, lecturas]; `_meses` en orden ascendente. Solo los
+        # últimos `max_meses` tienen barra: la barra j es el mes visible j
+        self._mensual: Dict[str, list] = {}
+        self._meses: List[str] = []
+        self._bars: List["Rectangle"] = []
+        self._labels = []
+        self.series_view: Optional["ConsumptionSeriesView"] = None
         self.setup_ui()
         self.load_data()
+        follow_reading_changes(self, reading_service)
 
     def setup_ui(self) -> None:
+        # matplotlib tarda cientos de ms en importarse: se carga al abrir la gráfica
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         layout = QVBoxLayout()
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+        # Ejes y textos fijos se crean una sola vez; las recargas solo ajustan barras
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_ylabel("Consumo (kWh)")
+        self.ax.set_title("Consumo Mensual")
+        self.ax.grid(axis='y', linestyle='--', alpha=0.7)
+        self.ax.set_axisbelow(True)
+        self._empty_text = self.ax.text(
+            0.5, 0.5, "No hay datos para mostrar", ha='center', va='center',
+            transform=self.ax.transAxes, visible=False,
+        )
+
+        modos = QHBoxLayout()
+        self.monthly_btn = QPushButton("Mensual")
+        self.series_btn = QPushButton("Serie por lectura")
+        self._mode_group = QButtonGroup(self)
+        for modo, btn in ((MODE_MONTHLY, self.monthly_btn), (MODE_SERIES, self.series_btn)):
+            btn.setCheckable(True)
+            self._mode_group.addButton(btn, modo)
+            modos.addWidget(btn)
+        modos.addStretch()
+        self.monthly_btn.setChecked(True)
+        self._mode_group.idClicked.connect(self.show_mode)
+
+        # La serie temporal se construye la primera vez que se elige
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.canvas)
+        self.stack.addWidget(QWidget())
+        layout.addLayout(modos)
+        layout.addWidget(self.stack)
         self.setLayout(layout)
 
+    def show_mode(self, mode: int) -> None:
+        """Muestra las barras mensuales (`MODE_MONTHLY`) o la serie por lectura (`MODE_SERIES`)."""
+        if mode == MODE_SERIES and self.series_view is None:
+            from .consumption_series_view import ConsumptionSeriesView
+            self.series_view = ConsumptionSeriesView(self.user_id, self.reading_service, self.runner)
+            placeholder = self.stack.widget(MODE_SERIES)
+            self.stack.insertWidget(MODE_SERIES, self.series_view)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        self._mode_group.button(mode).setChecked(True)
+        self.stack.setCurrentIndex(mode)
+
     def load_data(self) -> None:
-        readings = self.reading_service.get_all_readings_by_user(self.user_id)
-        monthly: Dict[str, Dict[str, float]] = defaultdict(lambda: {"consumo": 0.0, "costo": 0.0})
-
-        for r in readings:
-            key = r.fecha.strftime("%Y-%m")
-            monthly[key]["consumo"] += float(r.consumo)
-            monthly[key]["costo"] += float(r.costo)
-
-        sorted_items = sorted(monthly.items())
-        if not sorted_items:
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, "No hay datos para mostrar", ha='center', va='center', transform=ax.transAxes)
-            self.canvas.draw()
+        # SQLite agrega por mes en segundo plano: solo viaja una fila por mes
+        self._loading = True
+        self.runner.submit(
+            self.reading_service.get_monthly_summary,
+            self.user_id,
+            key=f"grafica:{self.user_id}",
+            on_result=self.show_summary,
+            on_error=self.show_error,
+        )
+
+    def show_summary(self, summary) -> None:
+        self._loading = False
+        self._mensual = {m.mes: [m.consumo, m.costo, m.lecturas] for m in summary}
+        self._meses = [m.mes for m in summary]
+        self.draw_chart()
+
+    def show_error(self, error: Exception) -> None:
+        # Sin esto `_loading` quedaría activo y cada cambio solo pediría otra recarga
+        self._loading = False
+        QMessageBox.warning(self, "Error", f"No se pudo cargar la gráfica: {error}")
+
+    def visible_months(self) -> List[str]:
+        """Meses con barra: los últimos `max_meses`, o todos si es 0."""
+        return self._meses[-self.max_meses:] if self.max_meses else list(self._meses)
+
+    def apply_change(self, change: ReadingChange) -> None:
+        """
+        Ajusta la barra del mes afectado. Solo reasigna todas las barras si cambia
+        un mes intermedio o se desplaza la ventana; los meses fuera de ella no redibujan.
+        """
+        if not change.afecta(self.user_id):
+            return
+        if change.tipo == LECTURAS_RECARGADAS or self._loading:
+            # Con una carga en curso no se sabe si ya incluye el cambio: se repite
+            self.request_reload()
             return
+        r = change.reading
+        mes = r.fecha.strftime("%Y-%m")
+        signo = 1 if change.tipo == LECTURA_AGREGADA else -1
+        if mes not in self._mensual:
+            if signo < 0:
+                return
+            i = bisect_left(self._meses, mes)
+            self._meses.insert(i, mes)
+            self._mensual[mes] = [Decimal("0"), Decimal("0"), 0]
+            self._sumar(mes, r, signo)
+            ventana_llena = bool(self.max_meses) and len(self._bars) >= self.max_meses
+            if i < len(self._meses) - 1 or not self._bars or ventana_llena:
+                # Mes intercalado o ventana desplazada: cambian los meses de las barras
+                self.draw_chart()
+                return
+            self.append_bar()
+            self.set_ticks()
+            self.patch_bar(len(self._bars) - 1)
+            return
+
+        self._sumar(mes, r, signo)
+        i = bisect_left(self._meses, mes)
+        ocultos = len(self._meses) - len(self._bars)
+        if self._mensual[mes][2] > 0:
+            if i >= ocultos:
+                self.patch_bar(i - ocultos)
+            return
+        del self._mensual[mes]
+        del self._meses[i]
+        if i < ocultos:
+            return  # Mes anterior a la ventana: no cambia ninguna barra
+        if ocultos == 0 and i == len(self._meses) and self._meses:
+            self.pop_bar()
+        else:
+            self.draw_chart()
+
+    def _sumar(self, mes: str, r, signo: int) -> None:
+        datos = self._mensual[mes]
+        datos[0] += signo * r.consumo
+        datos[1] += signo * r.costo
+        datos[2] += signo
+
+    def append_bar(self) -> None:
+        """Agrega una barra vacía al final, sin tocar las demás."""
+        from matplotlib.patches import Rectangle
+
+        i = len(self._bars)
+        bar = Rectangle((i - BAR_WIDTH / 2, 0), BAR_WIDTH, 0.0, color=BAR_COLOR)
+        self._bars.append(self.ax.add_patch(bar))
+        self._labels.append(self.ax.text(i, 0, "", ha='center', va='bottom', fontweight='bold'))
+
+    def pop_bar(self) -> None:
+        """Quita la barra del final, sin tocar las demás."""
+        self._bars.pop().remove()
+        self._labels.pop().remove()
+        self.set_ticks()
+        self.refresh()
+
+    def patch_bar(self, j: int) -> None:
+        """Actualiza la altura y la etiqueta de la barra visible `j`."""
+        self.set_bar(j, self.visible_months()[j])
+        self.refresh()
+
+    def set_bar(self, j: int, mes: str) -> None:
+        consumo, costo, _ = self._mensual[mes]
+        self._bars[j].set_height(float(consumo))
+        self._labels[j].set_text(f"${costo:.2f}")
+
+    def refresh(self) -> None:
+        self.place_labels()
+        self.set_limits()
+        # draw_idle agrupa varios cambios en un solo repintado cuando vuelve el bucle de eventos
+        self.canvas.draw_idle()
+
+    def set_limits(self) -> None:
+        # Límites explícitos: relim() recorrería el trazado de todas las barras
+        max_consumo = max((bar.get_height() for bar in self._bars), default=0.0)
+        self.ax.set_xlim(-0.6, max(len(self._bars), 1) - 0.4)
+        self.ax.set_ylim(0, max_consumo * 1.08 if max_consumo > 0 else 1.0)
+
+    def set_ticks(self) -> None:
+        # Posiciones numéricas y etiqueta MM/AA: meses homónimos de años distintos no se confunden
+        meses = self.visible_months()
+        self.ax.set_xticks(range(len(meses)), [f"{mes[5:7]}/{mes[2:4]}" for mes in meses])
+
+    def place_labels(self) -> None:
+        max_consumo = max((bar.get_height() for bar in self._bars), default=0.0)
+        offset = max_consumo * 0.01 if max_consumo > 0 else 0.1
+        for bar, label in zip(self._bars, self._labels):
+            label.set_position((bar.get_x() + bar.get_width() / 2, bar.get_height() + offset))
 
-        months: List[str] = [item[0].split("-")[1] for item in sorted_items]
-        consumos: List[float] = [item[1]["consumo"] for item in sorted_items]
-        costos: List[float] = [item[1]["costo"] for item in sorted_items]
-
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        bars = ax.bar(months, consumos, color="#00C8D6")
-
-        max_consumo = max(consumos) if consumos else 0.0
-        for bar, costo in zip(bars, costos):
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                height + (max_consumo * 0.01 if max_consumo > 0 else 0.1),
-                f"${costo:.2f}",
-                ha='center', va='bottom', fontweight='bold'
-            )
-
-        ax.set_ylabel("Consumo (kWh)")
-        ax.set_title("Consumo Mensual")
-        ax.grid(axis='y', linestyle='--', alpha=0.7)
-        self.canvas.draw()
\ No newline at end of file
+    def draw_chart(self) -> None:
+        """
+        Ajusta las barras a los meses visibles reutilizando los artistas existentes:
+        solo crea o quita las barras que sobran o faltan, sin limpiar la figura.
+        """
+        meses = self.visible_months()
+        while len(self._bars) > len(meses):
+            self._bars.pop().remove()
+            self._labels.pop().remove()
+        while len(self._bars) < len(meses):
+            self.append_bar()
+        for j, mes in enumerate(meses):
+            self.set_bar(j, mes)
+        self._empty_text.set_visible(not meses)
+        self.set_ticks()
+        self.refresh()
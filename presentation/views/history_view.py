@@ -1,15 +1,30 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem
-from PyQt6.QtCore import Qt
-from collections import defaultdict
-from datetime import datetime
+from bisect import bisect_left
+from decimal import Decimal
+from typing import Dict, List, Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QMessageBox
+from PyQt6.QtCore import Qt, pyqtSignal as Signal
+from application.services.reading_events import LECTURA_AGREGADA, LECTURAS_RECARGADAS, ReadingChange
+from .reading_changes import DeferredReload, follow_reading_changes
+from ..workers.task_runner import TaskRunner
 
-class HistoryView(QWidget):
-    def __init__(self, user_id: int, reading_service) -> None:
+
+class HistoryView(DeferredReload, QWidget):
+    # Reenvía los cambios del servicio al hilo de la interfaz
+    reading_changed = Signal(object)
+
+    def __init__(self, user_id: int, reading_service, runner: Optional[TaskRunner] = None) -> None:
         super().__init__()
         self.user_id = user_id
         self.reading_service = reading_service
+        # Sin runner, la consulta se ejecuta en el acto en el hilo de la interfaz
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self._loading = False
+        # mes -> [consumo, costo, lecturas]; `_meses` en orden ascendente
+        self._mensual: Dict[str, list] = {}
+        self._meses: List[str] = []
         self.setup_ui()
         self.load_data()
+        follow_reading_changes(self, reading_service)
 
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
@@ -21,20 +36,64 @@ class HistoryView(QWidget):
         self.setLayout(layout)
 
     def load_data(self) -> None:
-        readings = self.reading_service.get_all_readings_by_user(self.user_id)
-        monthly = defaultdict(lambda: {"consumo": 0.0, "costo": 0.0, "count": 0})
-
-        for r in readings:
-            key = r.fecha.strftime("%Y-%m")
-            monthly[key]["consumo"] += float(r.consumo)
-            monthly[key]["costo"] += float(r.costo)
-            monthly[key]["count"] += 1
-
-        months = sorted(monthly.keys(), reverse=True)
-        self.table.setRowCount(len(months))
-        for row, month in enumerate(months):
-            data = monthly[month]
-            self.table.setItem(row, 0, QTableWidgetItem(month))
-            self.table.setItem(row, 1, QTableWidgetItem(f"{data['consumo']:.2f}"))
-            self.table.setItem(row, 2, QTableWidgetItem(f"${data['costo']:.2f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(str(data["count"])))
\ No newline at end of file
+        # SQLite agrega por mes en segundo plano: solo viaja una fila por mes
+        self._loading = True
+        self.runner.submit(
+            self.reading_service.get_monthly_summary,
+            self.user_id,
+            key=f"historial:{self.user_id}",
+            on_result=self.show_summary,
+            on_error=self.show_error,
+        )
+
+    def show_summary(self, summary) -> None:
+        self._loading = False
+        self._mensual = {m.mes: [m.consumo, m.costo, m.lecturas] for m in summary}
+        self._meses = [m.mes for m in summary]
+        self.table.setRowCount(len(self._meses))
+        for row, mes in enumerate(reversed(self._meses)):
+            self.set_row(row, mes)
+
+    def show_error(self, error: Exception) -> None:
+        # Sin esto `_loading` quedaría activo y cada cambio solo pediría otra recarga
+        self._loading = False
+        QMessageBox.warning(self, "Error", f"No se pudo cargar el historial: {error}")
+
+    def apply_change(self, change: ReadingChange) -> None:
+        """Ajusta solo el mes de la lectura agregada o eliminada."""
+        if not change.afecta(self.user_id):
+            return
+        if change.tipo == LECTURAS_RECARGADAS or self._loading:
+            # Con una carga en curso no se sabe si ya incluye el cambio: se repite
+            self.request_reload()
+            return
+        r = change.reading
+        mes = r.fecha.strftime("%Y-%m")
+        signo = 1 if change.tipo == LECTURA_AGREGADA else -1
+        i = bisect_left(self._meses, mes)
+        # La tabla muestra los meses del más reciente al más antiguo
+        row = len(self._meses) - 1 - i
+        if mes not in self._mensual:
+            if signo < 0:
+                return
+            self._meses.insert(i, mes)
+            self._mensual[mes] = [Decimal("0"), Decimal("0"), 0]
+            row += 1
+            self.table.insertRow(row)
+        datos = self._mensual[mes]
+        datos[0] += signo * r.consumo
+        datos[1] += signo * r.costo
+        datos[2] += signo
+        if datos[2] <= 0:
+            del self._mensual[mes]
+            del self._meses[i]
+            self.table.removeRow(row)
+        else:
+            self.set_row(row, mes)
+
+    def set_row(self, row: int, mes: str) -> None:
+        consumo, costo, lecturas = self._mensual[mes]
+        self.table.setItem(row, 0, QTableWidgetItem(mes))
+        self.table.setItem(row, 1, QTableWidgetItem(f"{consumo:.2f}"))
+        self.table.setItem(row, 2, QTableWidgetItem(f"${costo:.2f}"))
+        self.table.setItem(row, 3, QTableWidgetItem(str(lecturas)))
@@ -1,14 +1,33 @@
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QWidget
+    QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QWidget, QProgressBar
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 from pathlib import Path
+from typing import Callable, Optional
+from ..workers.task_runner import TaskRunner
 
 
 class LoginView(QDialog):
-    def __init__(self) -> None:
+    """
+    Diálogo de inicio de sesión.
+
+    Con `authenticate`, la verificación (bcrypt, deliberadamente lenta) corre en
+    el runner: el diálogo muestra un estado de progreso y sigue respondiendo, y
+    se cierra aceptado solo si la función devuelve un usuario (`self.user`).
+    Sin ella, el botón acepta el diálogo y quien lo abrió valida las credenciales.
+    """
+
+    def __init__(
+        self,
+        authenticate: Optional[Callable[[str, str], object]] = None,
+        runner: Optional[TaskRunner] = None,
+    ) -> None:
         super().__init__()
+        self.authenticate = authenticate
+        # Sin runner, la verificación se ejecuta en el acto en el hilo de la interfaz
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self.user = None
         self.setWindowTitle("Electric Tariffs App")
         self.setFixedSize(800, 600)
         self.setStyleSheet(self.load_stylesheet())
@@ -93,11 +112,66 @@ class LoginView(QDialog):
         self.password_input.setStyleSheet("color: #333333;")  # Fallback
 
         self.login_button = QPushButton("Iniciar Sesión")
-        self.login_button.clicked.connect(self.accept)
+        self.login_button.clicked.connect(self.submit)
+        self.password_input.returnPressed.connect(self.submit)
+
+        # Progreso indeterminado mientras se verifica la contraseña
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 0)
+        self.progress.setTextVisible(False)
+        self.progress.setFixedHeight(6)
+        self.progress.hide()
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setStyleSheet("color: #333333;")
 
         form_layout.addWidget(self.username_input)
         form_layout.addWidget(self.password_input)
         form_layout.addWidget(self.login_button)
+        form_layout.addWidget(self.progress)
+        form_layout.addWidget(self.status_label)
 
         main_layout.addWidget(form_container)
-        self.setLayout(main_layout)
\ No newline at end of file
+        self.setLayout(main_layout)
+
+    def submit(self) -> None:
+        if self.authenticate is None:
+            self.accept()
+            return
+        if not self.login_button.isEnabled():
+            return  # ya hay una verificación en curso
+        username = self.username_input.text().strip()
+        password = self.password_input.text()
+        if not username or not password:
+            self.show_error("Usuario y contraseña son obligatorios.")
+            return
+        self.set_busy(True)
+        self.runner.submit(
+            self.authenticate,
+            username,
+            password,
+            key="login",
+            on_result=self.on_authenticated,
+            on_error=lambda e: self.show_error(str(e)),
+        )
+
+    def set_busy(self, busy: bool) -> None:
+        self.username_input.setEnabled(not busy)
+        self.password_input.setEnabled(not busy)
+        self.login_button.setEnabled(not busy)
+        self.progress.setVisible(busy)
+        self.status_label.setText("Verificando credenciales..." if busy else "")
+
+    def on_authenticated(self, user) -> None:
+        if user is None:
+            self.show_error("Credenciales inválidas.")
+            return
+        self.user = user
+        self.set_busy(False)
+        self.accept()
+
+    def show_error(self, message: str) -> None:
+        self.set_busy(False)
+        self.status_label.setText(message)
+        self.password_input.clear()
+        self.password_input.setFocus()
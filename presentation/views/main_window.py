@@ -1,21 +1,40 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
-    QStackedWidget, QLabel, QFrame
+    QStackedWidget, QLabel, QFrame, QMessageBox
 )
 from PyQt6.QtCore import Qt
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 from .dashboard_view import DashboardView
-from .history_view import HistoryView
-from .graph_view import GraphView
-from .user_stats_view import UserStatsView
 from ..widgets.reading_form_widget import ReadingFormWidget
+from ..viewmodels.reading_viewmodel import ReadingViewModel
+from ..workers.task_runner import TaskRunner
+
+if TYPE_CHECKING:
+    from .audit_log_view import AuditLogView
+    from .graph_view import GraphView
+    from .history_view import HistoryView
+    from .user_stats_view import UserStatsView
+
+# Índices de las páginas del QStackedWidget
+PAGE_DASHBOARD, PAGE_HISTORY, PAGE_GRAPH, PAGE_USER_STATS, PAGE_AUDIT = range(5)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, user, reading_service, user_service) -> None:
+    def __init__(self, user, reading_service, user_service, runner: Optional[TaskRunner] = None,
+                 audit_service=None) -> None:
         super().__init__()
         self.user = user
         self.reading_service = reading_service
         self.user_service = user_service
+        # Registro de actividad: solo para administradores y si hay servicio
+        self.audit_service = audit_service if user.rol == "admin" else None
+        # Consultas y escrituras fuera del hilo de la interfaz (síncrono si no se indica)
+        self.runner = runner or TaskRunner(self, synchronous=True)
+        self.reading_vm = ReadingViewModel(user.id, reading_service, self.runner)
+        self.reading_vm.last_reading_loaded.connect(
+            lambda prev: self.reading_form.previous_input.setText(f"{prev:.2f}")
+        )
+        self.reading_vm.error_occurred.connect(lambda msg: QMessageBox.warning(self, "Error", msg))
         self.setWindowTitle(f"Electric Tariffs App - {user.username}")
         self.setMinimumSize(1000, 700)
         self.setup_ui()
@@ -30,28 +49,79 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.sidebar, 1)
 
         self.stacked_widget = QStackedWidget()
-        self.dashboard_view = DashboardView(self.user.id, self.reading_service)
-        self.history_view = HistoryView(self.user.id, self.reading_service)
-        self.graph_view = GraphView(self.user.id, self.reading_service)
+        # Solo el dashboard se construye al iniciar; las demás vistas ocupan un
+        # marcador hasta la primera vez que se navega a ellas
+        self.dashboard_view = DashboardView(self.user.id, self.reading_service, self.runner)
+        self.history_view: Optional["HistoryView"] = None
+        self.graph_view: Optional["GraphView"] = None
+        self.user_stats_view: Optional["UserStatsView"] = None
+        self.audit_view: Optional["AuditLogView"] = None
+        self._factories: Dict[int, Callable[[], QWidget]] = {
+            PAGE_HISTORY: self.create_history_view,
+            PAGE_GRAPH: self.create_graph_view,
+        }
+        if self.user.rol == "admin":
+            self._factories[PAGE_USER_STATS] = self.create_user_stats_view
+        if self.audit_service is not None:
+            self._factories[PAGE_AUDIT] = self.create_audit_view
 
         self.stacked_widget.addWidget(self.dashboard_view)
-        self.stacked_widget.addWidget(self.history_view)
-        self.stacked_widget.addWidget(self.graph_view)
-
-        if self.user.rol == "admin":
-            self.user_stats_view = UserStatsView(self.user_service)
-            self.stacked_widget.addWidget(self.user_stats_view)
+        for _ in self._factories:
+            self.stacked_widget.addWidget(QWidget())
 
         main_layout.addWidget(self.stacked_widget, 4)
         self.setCentralWidget(central_widget)
 
-        self.dashboard_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
-        self.history_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
-        self.graph_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(2))
+        self.dashboard_btn.clicked.connect(lambda: self.show_page(PAGE_DASHBOARD))
+        self.history_btn.clicked.connect(lambda: self.show_page(PAGE_HISTORY))
+        self.graph_btn.clicked.connect(lambda: self.show_page(PAGE_GRAPH))
         if self.user.rol == "admin":
-            self.stats_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(3))
+            self.stats_btn.clicked.connect(lambda: self.show_page(PAGE_USER_STATS))
+        if self.audit_service is not None:
+            self.audit_btn.clicked.connect(lambda: self.show_page(PAGE_AUDIT))
 
         self.update_reading_form()
+        self.dashboard_view.reading_changed.connect(lambda _: self.update_reading_form())
+
+    def show_page(self, index: int) -> QWidget:
+        """
+        Muestra una página, construyendo su vista si es la primera visita.
+
+        Args:
+            index (int): Índice de la página (`PAGE_*`).
+
+        Returns:
+            QWidget: Vista mostrada.
+        """
+        factory = self._factories.pop(index, None)
+        if factory is not None:
+            placeholder = self.stacked_widget.widget(index)
+            self.stacked_widget.insertWidget(index, factory())
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+        self.stacked_widget.setCurrentIndex(index)
+        return self.stacked_widget.currentWidget()
+
+    # Cada vista se importa al construirse (la gráfica arrastra matplotlib)
+    def create_history_view(self) -> "HistoryView":
+        from .history_view import HistoryView
+        self.history_view = HistoryView(self.user.id, self.reading_service, self.runner)
+        return self.history_view
+
+    def create_graph_view(self) -> "GraphView":
+        from .graph_view import GraphView
+        self.graph_view = GraphView(self.user.id, self.reading_service, self.runner)
+        return self.graph_view
+
+    def create_user_stats_view(self) -> "UserStatsView":
+        from .user_stats_view import UserStatsView
+        self.user_stats_view = UserStatsView(self.user_service, self.runner)
+        return self.user_stats_view
+
+    def create_audit_view(self) -> "AuditLogView":
+        from .audit_log_view import AuditLogView
+        self.audit_view = AuditLogView(self.audit_service, self.runner)
+        return self.audit_view
 
     def create_sidebar(self) -> QWidget:
         sidebar = QWidget()
@@ -79,6 +149,9 @@ class MainWindow(QMainWindow):
         if self.user.rol == "admin":
             self.stats_btn = self.create_menu_button("Estadísticas de usuarios")
             layout.addWidget(self.stats_btn)
+        if self.audit_service is not None:
+            self.audit_btn = self.create_menu_button("Registro de actividad")
+            layout.addWidget(self.audit_btn)
 
         layout.addSpacing(30)
         layout.addWidget(QLabel("Registrar lectura", styleSheet="font-weight: bold;"))
@@ -113,20 +186,8 @@ class MainWindow(QMainWindow):
         return btn
 
     def update_reading_form(self) -> None:
-        last = self.reading_service.get_last_reading_by_user(self.user.id)
-        prev = float(last.lectura_actual) if last else 0.0
-        self.reading_form.previous_input.setText(f"{prev:.2f}")
+        self.reading_vm.load_last_reading()
 
     def handle_reading_submission(self, previous: float, current: float) -> None:
-        try:
-            self.reading_service.register_reading(
-                user_id=self.user.id,
-                lectura_actual=current,
-                lectura_anterior=previous
-            )
-            self.update_reading_form()
-            self.dashboard_view.load_data()
-            self.history_view.load_data()
-            self.graph_view.load_data()
-        except Exception:
-            pass
\ No newline at end of file
+        # Las vistas y el formulario se actualizan con el evento LECTURA_AGREGADA del servicio
+        self.reading_vm.save_reading(previous, current)
\ No newline at end of file
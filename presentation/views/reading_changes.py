@@ -0,0 +1,46 @@
+import weakref
+
+from PyQt6 import sip
+
+
+def follow_reading_changes(view, reading_service) -> None:
+    """
+    Suscribe una vista a los cambios de lecturas del servicio.
+
+    El servicio notifica en el hilo que escribió; la señal `reading_changed` de la
+    vista lleva el cambio a `apply_change` en el hilo de la interfaz. El servicio
+    solo guarda una referencia débil: la suscripción se retira sola en el primer
+    cambio tras liberarse la vista, sin emitir sobre un objeto ya destruido.
+    """
+    ref = weakref.ref(view)
+
+    def reenviar(change) -> None:
+        target = ref()
+        if target is None or sip.isdeleted(target):
+            reading_service.unsubscribe(reenviar)
+            return
+        target.reading_changed.emit(change)
+
+    view.reading_changed.connect(view.apply_change)
+    reading_service.subscribe(reenviar)
+
+
+class DeferredReload:
+    """
+    Mixin para vistas con `load_data()`: las recargas pedidas mientras la vista
+    está oculta se posponen hasta que vuelve a mostrarse.
+    """
+
+    _dirty = False
+
+    def request_reload(self) -> None:
+        if self.isVisible():
+            self.load_data()
+        else:
+            self._dirty = True
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.load_data()
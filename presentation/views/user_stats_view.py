@@ -1,10 +1,19 @@
+from typing import List, Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel, QMessageBox
+from ..viewmodels.user_viewmodel import UserViewModel
+from ..workers.task_runner import TaskRunner
 
 
 class UserStatsView(QWidget):
-    def __init__(self, user_service) -> None:
+    def __init__(self, user_service, runner: Optional[TaskRunner] = None) -> None:
         super().__init__()
         self.user_service = user_service
+        # Las consultas y el borrado corren en el runner; la vista solo pinta resultados
+        self.view_model = UserViewModel(user_service, runner)
+        self.view_model.users_loaded.connect(self.show_users)
+        self.view_model.deleted_count_loaded.connect(self.show_deleted_count)
+        self.view_model.user_deleted.connect(lambda _: self.load_data())
+        self.view_model.error_occurred.connect(lambda msg: QMessageBox.warning(self, "Error", msg))
         self.setup_ui()
         self.load_data()
 
@@ -28,11 +37,14 @@ class UserStatsView(QWidget):
         self.setLayout(layout)
 
     def load_data(self) -> None:
-        users = self.user_service.get_all_users()
-        deleted_count = self.user_service.get_deleted_user_count()
-        self.active_label.setText(f"Usuarios registrados: {len(users)}")
+        self.view_model.load_all_users()
+
+    def show_deleted_count(self, deleted_count: int) -> None:
         self.deleted_label.setText(f"Usuarios eliminados: {deleted_count}")
 
+    def show_users(self, users: List) -> None:
+        self.active_label.setText(f"Usuarios registrados: {len(users)}")
+
         self.table.setRowCount(len(users))
         for row, u in enumerate(users):
             self.table.setItem(row, 0, QTableWidgetItem(str(u.id)))
@@ -50,5 +62,4 @@ class UserStatsView(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.user_service.delete_user(user_id)
-            self.load_data()
\ No newline at end of file
+            self.view_model.delete_user(user_id)
@@ -0,0 +1,36 @@
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+from PyQt6.QtCore import QEvent, QModelIndex, Qt, pyqtSignal as Signal
+from PyQt6.QtGui import QColor, QPainter
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Pinta un botón "Eliminar" en la celda y emite `delete_requested(fila)` al
+    hacer clic, sin crear un QPushButton por fila.
+    """
+
+    delete_requested = Signal(int)
+
+    BACKGROUND = QColor("#ff4d4d")
+    FOREGROUND = QColor("white")
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.BACKGROUND)
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.setPen(self.FOREGROUND)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(index.data() or "Eliminar"))
+        painter.restore()
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,143 @@
+import itertools
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal as Signal, pyqtSlot as Slot
+from config import settings
+
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class _Task(QRunnable):
+    """Ejecuta `fn(*args)` en un hilo del pool y devuelve el resultado al runner."""
+
+    def __init__(self, runner: "TaskRunner", ticket: int, fn: Callable, args: Tuple) -> None:
+        super().__init__()
+        self.runner = runner
+        self.ticket = ticket
+        self.fn = fn
+        self.args = args
+
+    def run(self) -> None:
+        try:
+            if not self.runner.is_current(self.ticket):
+                # Reemplazada antes de empezar: no se ejecuta, solo se libera su registro
+                self._emit(True, None)
+                return
+        except RuntimeError:
+            return  # el runner ya fue destruido (ventana cerrada)
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self._emit(False, e)
+        else:
+            self._emit(True, result)
+
+    def _emit(self, ok: bool, payload: Any) -> None:
+        try:
+            self.runner._finished.emit(self.ticket, ok, payload)
+        except RuntimeError:
+            pass  # el runner ya fue destruido: no queda nadie a quien entregar
+
+
+class TaskRunner(QObject):
+    """
+    Ejecuta consultas y escrituras fuera del hilo de la interfaz con un
+    `QThreadPool` y entrega el resultado en el hilo del runner (el de la GUI).
+
+    Las tareas con la misma `key` se reemplazan: al enviar una nueva, la anterior
+    no llega a ejecutarse si seguía en cola y, si ya corría, su resultado se
+    descarta. Las tareas sin `key` (escrituras) nunca se descartan.
+    """
+
+    # (ticket, ok, resultado o excepción); conexión en cola hacia el hilo del runner
+    _finished = Signal(int, bool, object)
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: Optional[int] = None,
+                 synchronous: bool = False) -> None:
+        """
+        Args:
+            parent (Optional[QObject]): Dueño Qt del runner.
+            max_threads (Optional[int]): Hilos del pool; por defecto `UI_WORKER_THREADS`.
+            synchronous (bool): Ejecuta cada tarea en el acto, en el hilo llamador
+                (útil con conexiones SQLite de un solo hilo y en tests).
+        """
+        super().__init__(parent)
+        self.synchronous = synchronous
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or settings.UI_WORKER_THREADS)
+        self._tickets = itertools.count(1)
+        # ticket -> (key, on_result, on_error); las claves vigentes en `_current`
+        self._pending: Dict[int, Tuple[Optional[str], Optional[ResultCallback], Optional[ErrorCallback]]] = {}
+        self._current: Dict[str, int] = {}
+        self.stale = 0  # resultados descartados por haber sido reemplazados
+        self._finished.connect(self._deliver)
+
+    def submit(
+        self,
+        fn: Callable,
+        *args: Any,
+        key: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> int:
+        """
+        Encola `fn(*args)`.
+
+        Args:
+            fn (Callable): Trabajo a ejecutar (consulta, agregación o escritura).
+            key (Optional[str]): Identifica la petición; una nueva con la misma
+                clave deja obsoleta a la anterior.
+            on_result (Optional[ResultCallback]): Recibe el resultado en el hilo del runner.
+            on_error (Optional[ErrorCallback]): Recibe la excepción en el hilo del runner.
+
+        Returns:
+            int: Ticket de la tarea.
+        """
+        ticket = next(self._tickets)
+        if key is not None:
+            self.cancel(key)
+            self._current[key] = ticket
+        self._pending[ticket] = (key, on_result, on_error)
+        if self.synchronous:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self._deliver(ticket, False, e)
+            else:
+                self._deliver(ticket, True, result)
+            return ticket
+        self.pool.start(_Task(self, ticket, fn, args))
+        return ticket
+
+    def cancel(self, key: str) -> None:
+        """Deja obsoleta la tarea vigente de `key`: no se ejecuta o su resultado se descarta."""
+        if self._current.pop(key, None) is not None:
+            self.stale += 1
+
+    def is_current(self, ticket: int) -> bool:
+        """True si el resultado de `ticket` todavía se va a entregar (consultable desde el pool)."""
+        pending = self._pending.get(ticket)
+        return pending is not None and (pending[0] is None or self._current.get(pending[0]) == ticket)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Espera a que terminen las tareas en curso (p. ej. antes de cerrar el pool de BD)."""
+        return self.pool.waitForDone(msecs)
+
+    @Slot(int, bool, object)
+    def _deliver(self, ticket: int, ok: bool, payload: Any) -> None:
+        pending = self._pending.pop(ticket, None)
+        if pending is None:
+            return
+        key, on_result, on_error = pending
+        if key is not None:
+            if self._current.get(key) != ticket:
+                return  # obsoleta: ya se pidió un resultado más reciente
+            del self._current[key]
+        if ok:
+            if on_result is not None:
+                on_result(payload)
+        elif on_error is not None:
+            on_error(payload)
+        else:
+            print(f"[ERROR TAREA] {payload!r}", file=sys.stderr, flush=True)
@@ -0,0 +1,36 @@
+import sqlite3
+from typing import Callable, Iterable, Iterator, Mapping
+
+import pytest
+from application.services.reading_service import ReadingService
+from infrastructure.database.connection import apply_schema
+from infrastructure.logging.activity_logger import ActivityLogger
+
+
+@pytest.fixture
+def conn() -> Iterator[sqlite3.Connection]:
+    """Base en memoria con el esquema y el usuario 1 ('a', rol usuario, hash 'hash')."""
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    conn.execute(
+        "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('A', 'a', 'hash', 'usuario')"
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def make_service(conn, tmp_path) -> Callable[..., ReadingService]:
+    """
+    Fábrica de `ReadingService` sobre `conn`, con el log en `tmp_path`.
+    Recibe las filas de importación (como las de `import_readings`) con que sembrar la base.
+    """
+    def crear(filas: Iterable[Mapping[str, str]] = ()) -> ReadingService:
+        service = ReadingService(conn, ActivityLogger(str(tmp_path / "logs.csv")))
+        filas = list(filas)
+        if filas:
+            service.import_readings(filas)
+        return service
+
+    return crear
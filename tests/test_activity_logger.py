@@ -0,0 +1,325 @@
+import csv
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import settings
+from infrastructure.database.connection import init_db
+from infrastructure.database.pool import ConnectionPool
+from infrastructure.logging.activity_logger import ActivityLogger
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+
+
+def _filas(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_events_from_many_threads_are_written_once(tmp_path) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=64)
+
+    def registrar(hilo: int) -> None:
+        for i in range(500):
+            logger.log_event(hilo + 1, "evento", f"{hilo}:{i}")
+
+    hilos = [threading.Thread(target=registrar, args=(h,)) for h in range(8)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    assert logger.flush(timeout=5)
+
+    filas = _filas(tmp_path / "logs.csv")
+    assert filas[0] == ["timestamp", "usuario_id", "evento", "detalles"]
+    assert sorted(f[3] for f in filas[1:]) == sorted(f"{h}:{i}" for h in range(8) for i in range(500))
+    stats = logger.stats()
+    assert (stats.encolados, stats.escritos, stats.descartados, stats.pendientes) == (4000, 4000, 0, 0)
+    assert stats.lotes < 4000
+    logger.close()
+
+
+def test_partial_batches_are_written_after_the_interval(tmp_path) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1000, intervalo=0.05)
+    logger.log_event(1, "login")
+
+    limite = time.monotonic() + 5
+    while logger.stats().escritos < 1 and time.monotonic() < limite:
+        time.sleep(0.01)
+
+    assert [f[2] for f in _filas(tmp_path / "logs.csv")[1:]] == ["login"]
+    logger.close()
+
+
+def test_full_queue_drops_without_blocking(tmp_path) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), max_cola=1, lote=1)
+    liberar = threading.Event()
+    volcar = logger._volcar
+
+    def volcar_lento(filas):
+        liberar.wait(5)
+        return volcar(filas)
+
+    logger._volcar = volcar_lento
+    logger.log_event(1, "a")  # el escritor lo toma y queda bloqueado en disco
+    limite = time.monotonic() + 5
+    while not logger._cola.empty() and time.monotonic() < limite:
+        time.sleep(0.01)
+    inicio = time.perf_counter()
+    logger.log_event(1, "b")  # ocupa la cola
+    logger.log_event(1, "c")  # no cabe: se descarta
+    assert time.perf_counter() - inicio < 0.5
+
+    stats = logger.stats()
+    assert (stats.encolados, stats.descartados, stats.pendientes) == (2, 1, 2)
+    liberar.set()
+    assert logger.flush(timeout=5)
+    assert [f[2] for f in _filas(tmp_path / "logs.csv")[1:]] == ["a", "b"]
+    logger.close()
+
+
+def test_close_writes_pending_events_and_logger_can_be_reused(tmp_path) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1000, intervalo=60)
+    logger.log_event(1, "antes")
+    logger.close(timeout=5)
+    assert [f[2] for f in _filas(tmp_path / "logs.csv")[1:]] == ["antes"]
+
+    logger.log_event(1, "despues")
+    logger.close(timeout=5)
+    assert [f[2] for f in _filas(tmp_path / "logs.csv")[1:]] == ["antes", "despues"]
+
+
+class _AlmacenLento:
+    """Almacén en memoria cuyo primer lote tarda hasta que el test lo libera."""
+
+    def __init__(self) -> None:
+        self.filas = []
+        self.liberar = threading.Event()
+
+    def write(self, filas) -> None:
+        self.liberar.wait(5)
+        self.filas.extend(filas)
+
+    def query(self, *args):
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+def test_writer_is_replaced_after_close_times_out() -> None:
+    almacen = _AlmacenLento()
+    logger = ActivityLogger(lote=1, backend=almacen)
+    logger.log_event(1, "lento")
+    time.sleep(0.05)
+    logger.close(timeout=0.1)  # vence con el escritor aún escribiendo
+    logger.log_event(1, "tras_cierre")
+    almacen.liberar.set()
+
+    assert logger.flush(timeout=2)
+    assert [f[2] for f in almacen.filas] == ["lento", "tras_cierre"]
+    logger.close(timeout=5)
+
+
+def test_queries_do_not_hang_on_a_stuck_writer(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "LOG_QUERY_FLUSH_TIMEOUT_S", 0.1)
+    almacen = _AlmacenLento()
+    logger = ActivityLogger(lote=1, backend=almacen)
+    logger.log_event(1, "lento")
+
+    inicio = time.monotonic()
+    assert logger.query_page(1) == []
+    assert time.monotonic() - inicio < 2
+    almacen.liberar.set()
+    logger.close(timeout=5)
+
+
+def test_flush_close_and_exit_are_bounded_when_the_queue_is_full(monkeypatch) -> None:
+    from infrastructure.logging import activity_logger
+    monkeypatch.setattr(settings, "LOG_EXIT_TIMEOUT_S", 0.1)
+    almacen = _AlmacenLento()
+    logger = ActivityLogger(max_cola=1, lote=1, backend=almacen)
+    logger.log_event(1, "lento")
+    time.sleep(0.05)  # el escritor lo tomó y quedó escribiendo
+    logger.log_event(1, "en_cola")
+
+    inicio = time.monotonic()
+    assert logger.flush(timeout=0.1) is False
+    logger.close(timeout=0.1)
+    activity_logger._cerrar_activos()
+    assert time.monotonic() - inicio < 2
+
+    almacen.liberar.set()
+    assert logger.flush(timeout=5)
+    assert [f[2] for f in almacen.filas] == ["lento", "en_cola"]
+    logger.close(timeout=5)
+
+
+def test_write_errors_are_counted_and_do_not_raise(tmp_path, capsys) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"))
+    logger.backend.log_path = tmp_path  # un directorio: open() falla
+
+    logger.log_event(1, "evento")
+    assert logger.flush(timeout=5)
+
+    stats = logger.stats()
+    assert (stats.fallidos, stats.escritos, stats.pendientes) == (1, 0, 0)
+    assert "[ERROR LOG]" in capsys.readouterr().out
+    logger.close()
+
+
+class _Reloj:
+    def __init__(self, inicio: datetime) -> None:
+        self.ahora = inicio
+
+    def __call__(self) -> datetime:
+        return self.ahora
+
+
+def test_log_rotates_daily_into_gzip_segments_with_manifest(tmp_path) -> None:
+    reloj = _Reloj(datetime(2025, 3, 1, 23, 59, 0))
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1000, reloj=reloj)
+    logger.log_event(1, "login")
+    logger.log_event(2, "login")
+    reloj.ahora += timedelta(minutes=2)  # 2 de marzo: mismo lote, otro segmento
+    logger.log_event(3, "login")
+    logger.close(timeout=5)
+
+    manifiesto = json.loads((tmp_path / "logs.manifest.json").read_text())["segmentos"]
+    assert manifiesto == [{
+        "archivo": "logs.20250301-235900.csv.gz",
+        "desde": "2025-03-01 23:59:00",
+        "hasta": "2025-03-01 23:59:00",
+        "usuarios": [1, 2],
+        "eventos": 2,
+    }]
+    with gzip.open(tmp_path / manifiesto[0]["archivo"], "rt", newline="") as f:
+        assert [fila[1] for fila in csv.reader(f)] == ["usuario_id", "1", "2"]
+    assert [f[1] for f in _filas(tmp_path / "logs.csv")] == ["usuario_id", "3"]
+
+
+def test_log_rotates_by_size_and_resumes_an_existing_file(tmp_path) -> None:
+    reloj = _Reloj(datetime(2025, 3, 1, 8, 0, 0))
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1, max_bytes=200, reloj=reloj)
+    for i in range(20):
+        reloj.ahora += timedelta(seconds=1)
+        logger.log_event(1, "evento", "x" * 20)
+    logger.close(timeout=5)
+    # Un logger nuevo continúa el archivo activo y su rango
+    ActivityLogger(str(tmp_path / "logs.csv"), lote=1, max_bytes=200, reloj=reloj).close()
+
+    segmentos = json.loads((tmp_path / "logs.manifest.json").read_text())["segmentos"]
+    assert len(segmentos) > 1
+    assert sum(s["eventos"] for s in segmentos) + len(_filas(tmp_path / "logs.csv")) - 1 == 20
+    assert all((tmp_path / s["archivo"]).stat().st_size < 200 for s in segmentos)
+
+
+def test_queries_open_only_matching_segments(tmp_path) -> None:
+    reloj = _Reloj(datetime(2025, 3, 1, 12, 0, 0))
+    logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1, reloj=reloj)
+    for dia in range(10):
+        logger.log_event(1, "login", f"dia {dia}")
+        if dia % 3 == 0:
+            logger.log_event(2, "registro_lectura", f"dia {dia}")
+        reloj.ahora += timedelta(days=1)
+    logger.log_event(2, "registro_lectura", "hoy")  # sigue en el archivo activo
+    assert logger.flush(timeout=5)
+
+    semana = (datetime(2025, 3, 4), datetime(2025, 3, 12))
+    assert [p.name for p in logger.backend.segments_for(2, *semana)] == [
+        "logs.20250304-120000.csv.gz", "logs.20250307-120000.csv.gz", "logs.20250310-120000.csv.gz",
+    ]
+    eventos = logger.query_events(2, *semana)
+    assert [e.detalles for e in eventos] == ["dia 3", "dia 6", "dia 9", "hoy"]
+    assert all(e.user_id == 2 and e.evento == "registro_lectura" for e in eventos)
+    assert len(logger.query_events()) == 15
+    logger.close()
+
+
+@pytest.fixture(params=["csv", "sqlite"])
+def logger_con_eventos(request, tmp_path):
+    """Logger de cada almacén con 12 eventos: 3 por minuto, usuarios 1 y 2 alternados."""
+    reloj = _Reloj(datetime(2025, 3, 1, 8, 0, 0))
+    pool = None
+    if request.param == "csv":
+        logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=5, reloj=reloj)
+    else:
+        init_db(str(tmp_path / "app.db"))
+        pool = ConnectionPool(str(tmp_path / "app.db"))
+        logger = ActivityLogger(lote=5, reloj=reloj, backend=SqliteLogBackend(pool))
+    for i in range(12):
+        logger.log_event(1 + i % 2, "login" if i % 3 else "registro_lectura", str(i))
+        if i % 3 == 2:
+            reloj.ahora += timedelta(minutes=1)
+    yield logger
+    logger.close()
+    if pool is not None:
+        pool.close()
+
+
+def test_queries_filter_by_user_event_and_range(logger_con_eventos) -> None:
+    logger = logger_con_eventos
+
+    assert [e.detalles for e in logger.query_events()] == [str(i) for i in range(12)]
+    assert [e.detalles for e in logger.query_events(evento="registro_lectura")] == ["0", "3", "6", "9"]
+    assert [e.detalles for e in logger.query_events(1, evento="login")] == ["2", "4", "8", "10"]
+    assert [e.detalles for e in logger.query_events(
+        2, datetime(2025, 3, 1, 8, 1), datetime(2025, 3, 1, 8, 3)
+    )] == ["3", "5", "7"]
+
+
+def test_pages_continue_after_the_last_event_even_with_equal_timestamps(logger_con_eventos) -> None:
+    logger = logger_con_eventos
+    paginas = []
+    pagina = logger.query_page(limit=5)
+    while pagina:
+        paginas.append([e.detalles for e in pagina])
+        pagina = logger.query_page(limit=5, antes_de=pagina[-1])
+
+    assert paginas == [["11", "10", "9", "8", "7"], ["6", "5", "4", "3", "2"], ["1", "0"]]
+    primera = logger.query_page(1, hasta=datetime(2025, 3, 1, 8, 3), limit=2)
+    assert [e.detalles for e in primera] == ["8", "6"]
+    assert [e.detalles for e in logger.query_page(1, hasta=datetime(2025, 3, 1, 8, 3), antes_de=primera[-1])] == [
+        "4", "2", "0"
+    ]
+
+
+def test_sqlite_backend_writes_each_batch_in_one_transaction(tmp_path) -> None:
+    init_db(str(tmp_path / "app.db"))
+    pool = ConnectionPool(str(tmp_path / "app.db"))
+    logger = ActivityLogger(lote=100, intervalo=60, backend=SqliteLogBackend(pool))
+    for i in range(250):
+        logger.log_event(1, "evento", str(i))
+    logger.close(timeout=5)
+
+    stats = logger.stats()
+    assert (stats.escritos, stats.lotes) == (250, 3)
+    assert pool.reader().execute("SELECT COUNT(*) FROM eventos").fetchone()[0] == 250
+    pool.close()
+
+
+def test_csv_history_is_imported_once_into_the_events_table(tmp_path) -> None:
+    reloj = _Reloj(datetime(2025, 3, 1, 8, 0, 0))
+    csv_logger = ActivityLogger(str(tmp_path / "logs.csv"), lote=1, max_bytes=200, reloj=reloj)
+    for i in range(20):
+        reloj.ahora += timedelta(seconds=1)
+        csv_logger.log_event(1 + i % 3, "evento", f"detalle {i}")
+    csv_logger.close(timeout=5)
+    init_db(str(tmp_path / "app.db"))
+    pool = ConnectionPool(str(tmp_path / "app.db"))
+    backend = SqliteLogBackend(pool)
+
+    assert backend.import_history(csv_logger.backend.iter_rows()) == 20
+    assert len(json.loads((tmp_path / "logs.manifest.json").read_text())["segmentos"]) > 1
+
+    def _sin_id(eventos):
+        return [(e.timestamp, e.user_id, e.evento, e.detalles) for e in eventos]
+
+    assert _sin_id(backend.query()) == _sin_id(csv_logger.backend.query())
+    assert _sin_id(backend.query(user_id=2)) == _sin_id(csv_logger.backend.query(user_id=2))
+    with pytest.raises(ValueError):
+        backend.import_history(csv_logger.backend.iter_rows())
+    pool.close()
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import pytest
+pytest.importorskip("PyQt6")
+from PyQt6.QtCore import QDate
+from pytestqt.qtbot import QtBot
+
+from application.services.audit_service import AuditService
+from infrastructure.database.connection import init_db
+from infrastructure.database.pool import ConnectionPool
+from infrastructure.logging.activity_logger import ActivityLogger
+from infrastructure.logging.sqlite_backend import SqliteLogBackend
+
+
+class _Reloj:
+    def __init__(self) -> None:
+        self.ahora = datetime(2025, 3, 1, 8, 0, 0)
+
+    def __call__(self) -> datetime:
+        self.ahora += timedelta(hours=1)
+        return self.ahora
+
+
+@pytest.fixture
+def audit_service(tmp_path):
+    """25 eventos, uno por hora desde el 1 de marzo a las 09:00; usuarios 1 a 5."""
+    init_db(str(tmp_path / "app.db"))
+    pool = ConnectionPool(str(tmp_path / "app.db"))
+    logger = ActivityLogger(reloj=_Reloj(), backend=SqliteLogBackend(pool))
+    for i in range(25):
+        logger.log_event(1 + i % 5, "login" if i % 2 else "registro_lectura", str(i))
+    yield AuditService(logger)
+    logger.close()
+    pool.close()
+
+
+def _view(qtbot: QtBot, service):
+    from presentation.views.audit_log_view import AuditLogView
+    view = AuditLogView(service, page_size=10)
+    qtbot.addWidget(view)
+    return view
+
+
+def _detalles(view) -> list:
+    return [view.table.item(row, 3).text() for row in range(view.table.rowCount())]
+
+
+def test_pages_go_forward_and_back(qtbot: QtBot, audit_service) -> None:
+    view = _view(qtbot, audit_service)
+    assert _detalles(view) == [str(i) for i in range(24, 14, -1)]
+    assert not view.prev_btn.isEnabled() and view.next_btn.isEnabled()
+
+    view.next_btn.click()
+    view.next_btn.click()
+    assert _detalles(view) == ["4", "3", "2", "1", "0"]
+    assert view.page_label.text() == "Página 3" and not view.next_btn.isEnabled()
+
+    view.prev_btn.click()
+    assert _detalles(view) == [str(i) for i in range(14, 4, -1)]
+
+
+def test_filters_by_user_event_and_dates(qtbot: QtBot, audit_service, monkeypatch) -> None:
+    from presentation.views import audit_log_view
+    avisos = []
+    monkeypatch.setattr(audit_log_view.QMessageBox, "warning", lambda *args: avisos.append(args[2]))
+    view = _view(qtbot, audit_service)
+    view.user_input.setText("2")
+    view.event_input.setText("login")
+    view.search_btn.click()
+    assert _detalles(view) == ["21", "11", "1"]
+
+    view.user_input.clear()
+    view.event_input.clear()
+    view.desde_input.setDate(QDate(2025, 3, 2))
+    view.search_btn.click()
+    # Desde el 2 de marzo a las 00:00: eventos 15 en adelante
+    assert _detalles(view) == [str(i) for i in range(24, 14, -1)]
+    view.hasta_input.setDate(QDate(2025, 3, 1))
+    view.search_btn.click()
+    assert avisos == ["La fecha inicial debe ser anterior a la final."]
+    assert view.table.rowCount() == 10  # el error no borra la página mostrada
+
+
+def test_full_last_page_disables_next_without_clearing(qtbot: QtBot, tmp_path) -> None:
+    logger = ActivityLogger(str(tmp_path / "logs.csv"))
+    for i in range(10):
+        logger.log_event(1, "login", str(i))
+    view = _view(qtbot, AuditService(logger))
+    assert view.next_btn.isEnabled()
+
+    view.next_btn.click()
+    assert _detalles(view) == [str(i) for i in range(9, -1, -1)]
+    assert view.page_label.text() == "Página 1" and not view.next_btn.isEnabled()
+    logger.close()
@@ -31,3 +31,67 @@ def test_duplicate_username_raises() -> None:  # ← Añadido "-> None"
     auth.create_user(name="User A", username="sameuser", password="p1")
     with pytest.raises(ValueError):
         auth.create_user(name="User B", username="sameuser", password="p2")
+
+
+def _login_service(rounds: int, password_rounds: int):
+    from datetime import datetime
+    from domain.entities.user import User
+    from infrastructure.auth.auth_service import AuthService as LoginService, hash_password
+    from infrastructure.database.connection import apply_schema
+    from infrastructure.database.repositories.user_repository import UserRepository
+
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    repo = UserRepository(conn)
+    repo.create(User(0, "A", "ana", hash_password("clave", password_rounds), "usuario", True, datetime.now()))
+    return LoginService(repo, rounds=rounds), repo
+
+
+def test_bcrypt_cost_is_read_from_the_hash() -> None:
+    from infrastructure.auth.auth_service import bcrypt_cost, hash_password
+
+    assert bcrypt_cost(hash_password("x", 5)) == 5
+    assert bcrypt_cost("no es un hash") is None
+
+
+def test_calibration_extrapolates_from_a_cheap_probe() -> None:
+    from infrastructure.auth.auth_service import calibrate_bcrypt_cost
+
+    class Reloj:
+        # Cada medición dura 16 ms: costo 8 -> 16 ms, 11 -> 128 ms, 12 -> 256 ms
+        t = 0.0
+
+        def __call__(self) -> float:
+            self.t += 0.016
+            return self.t
+
+    assert calibrate_bcrypt_cost(250, 4, 16, Reloj()) == 11
+    assert calibrate_bcrypt_cost(256, 4, 16, Reloj()) == 12
+    assert calibrate_bcrypt_cost(10, 10, 16, Reloj()) == 10  # nunca por debajo del mínimo
+    assert calibrate_bcrypt_cost(10 ** 6, 4, 14, Reloj()) == 14
+
+
+def test_login_rehashes_when_the_stored_cost_is_lower() -> None:
+    from infrastructure.auth.auth_service import bcrypt_cost
+    auth, repo = _login_service(rounds=5, password_rounds=4)
+
+    assert auth.login("ana", "mala") is None
+    assert bcrypt_cost(repo.get_by_username("ana").password_hash) == 4
+
+    user = auth.login("ana", "clave")
+    guardado = repo.get_by_username("ana").password_hash
+    assert bcrypt_cost(guardado) == 5 and user.password_hash == guardado
+
+    # Con el costo al día no se vuelve a generar
+    auth.login("ana", "clave")
+    assert repo.get_by_username("ana").password_hash == guardado
+
+
+def test_login_never_lowers_a_higher_stored_cost() -> None:
+    from infrastructure.auth.auth_service import bcrypt_cost
+    # Una calibración más baja en este arranque no debilita el hash guardado
+    auth, repo = _login_service(rounds=4, password_rounds=6)
+    guardado = repo.get_by_username("ana").password_hash
+
+    assert auth.login("ana", "clave").password_hash == guardado
+    assert bcrypt_cost(repo.get_by_username("ana").password_hash) == 6
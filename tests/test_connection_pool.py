@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+
+import pytest
+from infrastructure.database.connection import get_db_connection, init_db
+from infrastructure.database.pool import ConnectionPool
+
+
+def _pool(tmp_path) -> ConnectionPool:
+    db_path = str(tmp_path / "app.db")
+    init_db(db_path)
+    return ConnectionPool(db_path)
+
+
+def test_connections_use_tuned_pragmas(tmp_path) -> None:
+    pool = _pool(tmp_path)
+    with pool.writer() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert pool.reader().execute("PRAGMA cache_size").fetchone()[0] < 0
+    pool.close()
+
+
+def test_readers_are_per_thread_and_read_only(tmp_path) -> None:
+    pool = _pool(tmp_path)
+    otros = []
+    hilo = threading.Thread(target=lambda: otros.append(pool.reader()))
+    hilo.start()
+    hilo.join()
+
+    assert pool.reader() is pool.reader()
+    assert otros[0] is not pool.reader()
+    with pytest.raises(sqlite3.OperationalError):
+        pool.reader().execute("DELETE FROM usuarios")
+    pool.close()
+
+
+def test_readers_do_not_block_behind_open_write(tmp_path) -> None:
+    pool = _pool(tmp_path)
+    with pool.writer() as conn:
+        conn.execute(
+            "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('A', 'a', 'x', 'usuario')"
+        )
+        resultado = []
+        hilo = threading.Thread(
+            target=lambda: resultado.append(
+                pool.reader().execute("SELECT COUNT(*) FROM usuarios").fetchone()[0]
+            )
+        )
+        hilo.start()
+        hilo.join(timeout=2)
+        # El lector ve la última versión confirmada sin esperar al escritor
+        assert resultado == [0]
+
+    assert pool.reader().execute("SELECT COUNT(*) FROM usuarios").fetchone()[0] == 1
+    pool.close()
+
+
+def test_writer_rolls_back_on_error(tmp_path) -> None:
+    pool = _pool(tmp_path)
+    with pytest.raises(RuntimeError):
+        with pool.writer() as conn:
+            conn.execute(
+                "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('A', 'a', 'x', 'usuario')"
+            )
+            raise RuntimeError("fallo")
+
+    assert get_db_connection(pool.db_path).execute("SELECT COUNT(*) FROM usuarios").fetchone()[0] == 0
+    pool.close()
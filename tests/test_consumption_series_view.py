@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+import pytest
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+from pytestqt.qtbot import QtBot
+
+INICIO = datetime(2023, 1, 1)
+
+
+def _horas(horas: int = 24 * 200) -> list:
+    """Filas de importación del usuario 1, una por hora desde `INICIO`."""
+    return [
+        {"usuario_id": "1", "lectura_anterior": "0", "lectura_actual": str(1 + h % 5),
+         "fecha": (INICIO + timedelta(hours=h)).isoformat(sep=" ")}
+        for h in range(horas)
+    ]
+
+
+def _series_view(qtbot: QtBot, service):
+    from presentation.views.consumption_series_view import ConsumptionSeriesView
+    view = ConsumptionSeriesView(1, service)
+    qtbot.addWidget(view)
+    view.resize(500, 400)
+    view.show()
+    qtbot.waitExposed(view)
+    view.fetch_visible()
+    return view
+
+
+def test_full_range_is_downsampled_to_the_pixel_width(qtbot: QtBot, make_service) -> None:
+    view = _series_view(qtbot, make_service(_horas()))
+
+    assert 0 < len(view._points) <= 2 * view.canvas.width() < 24 * 200
+    desde, hasta = view.visible_range()
+    assert abs(desde - INICIO) < timedelta(minutes=1)
+    assert abs(hasta - (INICIO + timedelta(hours=24 * 200 - 1))) < timedelta(minutes=1)
+
+
+def test_zoom_fetches_full_resolution_for_the_visible_range(qtbot: QtBot, make_service) -> None:
+    view = _series_view(qtbot, make_service(_horas()))
+    consultas = []
+    original = view.reading_service.get_consumption_series
+
+    def contar(*args):
+        consultas.append(args)
+        return original(*args)
+
+    view.reading_service.get_consumption_series = contar
+
+    # Zoom a un día: el cambio de límites programa una única consulta
+    view.ax.set_xlim(view._mdates.date2num(INICIO + timedelta(days=10)),
+                     view._mdates.date2num(INICIO + timedelta(days=11)))
+    view.ax.set_xlim(view._mdates.date2num(INICIO + timedelta(days=20)),
+                     view._mdates.date2num(INICIO + timedelta(days=21)))
+    qtbot.waitUntil(lambda: len(consultas) == 1)
+
+    dia = [fecha for fecha, _ in view._points if INICIO + timedelta(days=20) <= fecha <= INICIO + timedelta(days=21)]
+    assert len(dia) == 25  # cada hora, sin decimar
+    assert len(view.line.get_xdata()) == len(view._points)
+
+
+def test_new_readings_refresh_the_visible_range(qtbot: QtBot, make_service) -> None:
+    service = make_service(_horas(5))
+    view = _series_view(qtbot, service)
+    assert len(view._points) == 5
+
+    service.import_readings([
+        {"usuario_id": "1", "lectura_anterior": "0", "lectura_actual": "9",
+         "fecha": (INICIO + timedelta(hours=2, minutes=30)).isoformat(sep=" ")},
+    ])
+
+    assert len(view._points) == 6 and max(c for _, c in view._points) == 9.0
+
+
+def test_graph_switches_to_series_mode_lazily(qtbot: QtBot, make_service) -> None:
+    from presentation.views.graph_view import MODE_MONTHLY, MODE_SERIES, GraphView
+    graph = GraphView(1, make_service(_horas(48)))
+    qtbot.addWidget(graph)
+    assert graph.series_view is None
+
+    graph.series_btn.click()
+    series = graph.series_view
+    assert series is not None and graph.stack.currentWidget() is series
+
+    graph.show_mode(MODE_MONTHLY)
+    assert graph.stack.currentWidget() is graph.canvas and graph.monthly_btn.isChecked()
+    graph.show_mode(MODE_SERIES)
+    assert graph.series_view is series and graph.stack.count() == 2
@@ -0,0 +1,181 @@
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+from pytestqt.qtbot import QtBot
+
+from application.services.reading_events import LECTURA_AGREGADA, LECTURA_ELIMINADA, ReadingChange
+from application.services.reading_service import ReadingService
+
+
+@pytest.fixture
+def service(make_service) -> ReadingService:
+    """Cuatro lecturas del usuario 1: dos en enero, una en febrero y una en marzo de 2025."""
+    return make_service([
+        {"usuario_id": "1", "lectura_anterior": str(10 * i), "lectura_actual": str(10 * i + 10),
+         "fecha": f"2025-{m:02d}-{d:02d} 08:00:00"}
+        for i, (m, d) in enumerate([(1, 5), (1, 20), (2, 3), (3, 9)])
+    ])
+
+
+def _tabla(table):
+    model = table.model()
+    return [
+        [model.index(row, col).data() for col in range(model.columnCount())]
+        for row in range(model.rowCount())
+    ]
+
+
+def _no_recargar(view) -> None:
+    view.load_data = lambda: pytest.fail("se reconstruyó la vista completa")
+
+
+def test_service_emits_changes_with_the_entity(service: ReadingService) -> None:
+    cambios = []
+    service.subscribe(cambios.append)
+
+    saved = service.register_reading(1, "60", "40")
+    service.delete_reading(saved.id)
+
+    assert [(c.tipo, c.reading.id) for c in cambios] == [
+        (LECTURA_AGREGADA, saved.id), (LECTURA_ELIMINADA, saved.id),
+    ]
+
+
+def test_dashboard_and_history_patch_rows(qtbot: QtBot, service: ReadingService) -> None:
+    from presentation.views.dashboard_view import DashboardView
+    from presentation.views.history_view import HistoryView
+
+    dashboard = DashboardView(1, service)
+    history = HistoryView(1, service)
+    qtbot.addWidget(dashboard)
+    qtbot.addWidget(history)
+    _no_recargar(dashboard)
+    _no_recargar(history)
+
+    saved = service.register_reading(1, "60", "40")
+    primera = service.get_all_readings_by_user(1)[-1]
+    service.delete_reading(primera.id)
+    # Alta y baja de una lectura en medio del historial
+    intermedia = replace(saved, id=999, fecha=datetime(2025, 1, 25))
+    service._notify(ReadingChange(LECTURA_AGREGADA, 1, intermedia))
+    assert _tabla(dashboard.table)[3][0] == "2025-01-25 00:00"
+    service._notify(ReadingChange(LECTURA_ELIMINADA, 1, intermedia))
+
+    fresh_dashboard = DashboardView(1, service)
+    fresh_history = HistoryView(1, service)
+    qtbot.addWidget(fresh_dashboard)
+    qtbot.addWidget(fresh_history)
+    assert _tabla(dashboard.table) == _tabla(fresh_dashboard.table)
+    assert _tabla(history.table) == _tabla(fresh_history.table)
+    assert _tabla(history.table)[0][0] == datetime.now().strftime("%Y-%m")
+
+
+def test_graph_patches_the_bar_of_the_month(qtbot: QtBot, service: ReadingService) -> None:
+    from presentation.views.graph_view import GraphView
+
+    graph = GraphView(1, service)
+    qtbot.addWidget(graph)
+    _no_recargar(graph)
+    bars = list(graph._bars)
+
+    graph.draw_chart = lambda: pytest.fail("se redibujaron todas las barras")
+    saved = service.register_reading(1, "60", "40")  # mes actual: barra nueva al final
+    assert graph._bars[:-1] == bars and graph._bars[-1].get_height() == 20.0
+    service.delete_reading(saved.id)
+    assert graph._bars == bars
+    assert [b.get_height() for b in graph._bars] == [20.0, 10.0, 10.0]
+
+    marzo = service.get_all_readings_by_user(1)[0]
+    service.delete_reading(marzo.id)
+    feb = service.get_all_readings_by_user(1)[0]
+    barras = list(graph._bars)
+    service._notify(ReadingChange(LECTURA_AGREGADA, 1, feb))
+    assert graph._bars == barras  # mismo artista, solo cambia la altura
+    assert graph._bars[1].get_height() == 20.0
+
+
+def test_graph_reload_reuses_axes_and_bars(qtbot: QtBot, service: ReadingService) -> None:
+    from presentation.views.graph_view import GraphView
+
+    graph = GraphView(1, service)
+    qtbot.addWidget(graph)
+    ax, bars = graph.ax, list(graph._bars)
+    textos = [label.get_text() for label in graph._labels]
+    graph.figure.clear = lambda: pytest.fail("se limpió la figura")
+
+    graph.load_data()
+
+    assert graph.figure.axes == [ax]
+    assert graph._bars == bars
+    assert [label.get_text() for label in graph._labels] == textos
+    assert len(textos) == 3 and all(t.startswith("$") for t in textos)
+
+
+def test_graph_window_draws_only_the_last_months(qtbot: QtBot, service: ReadingService) -> None:
+    from presentation.views.graph_view import GraphView
+
+    # enero (2 lecturas), febrero y marzo de 2025
+    graph = GraphView(1, service, max_meses=2)
+    qtbot.addWidget(graph)
+    _no_recargar(graph)
+    bars = list(graph._bars)
+    assert graph.visible_months() == ["2025-02", "2025-03"]
+    assert [b.get_height() for b in bars] == [10.0, 10.0]
+
+    # Un mes fuera de la ventana no toca ninguna barra
+    enero = service.get_all_readings_by_user(1)[-1]
+    graph.patch_bar = graph.draw_chart = lambda *_: pytest.fail("se redibujó por un mes oculto")
+    service.delete_reading(enero.id)
+    del graph.patch_bar, graph.draw_chart
+
+    # Un mes nuevo con la ventana llena la desplaza reutilizando las barras
+    service.register_reading(1, "60", "40")
+    assert graph._bars == bars
+    assert graph.visible_months() == ["2025-03", datetime.now().strftime("%Y-%m")]
+    assert [b.get_height() for b in graph._bars] == [10.0, 20.0]
+    assert [label.get_text() for label in graph.ax.get_xticklabels()] == [
+        "03/25", datetime.now().strftime("%m/%y"),
+    ]
+
+
+def test_destroyed_views_stop_listening(qtbot: QtBot, service: ReadingService) -> None:
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    from presentation.views.history_view import HistoryView
+
+    view = HistoryView(1, service)
+    assert len(service._subscribers) == 1
+
+    view.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    # La suscripción se retira en el primer cambio, sin emitir sobre la vista liberada
+    service.register_reading(1, "60", "40")
+    assert service._subscribers == []
+
+
+@pytest.mark.parametrize("modulo, clase", [("history_view", "HistoryView"), ("graph_view", "GraphView")])
+def test_failed_summary_load_is_reported_and_clears_loading(
+    qtbot: QtBot, service: ReadingService, monkeypatch, modulo: str, clase: str
+) -> None:
+    import importlib
+    vista = importlib.import_module(f"presentation.views.{modulo}")
+    avisos = []
+    monkeypatch.setattr(vista.QMessageBox, "warning", lambda *args: avisos.append(args[2]))
+    resumen = service.get_monthly_summary
+
+    def falla(user_id):
+        raise RuntimeError("base de datos bloqueada")
+
+    service.get_monthly_summary = falla
+    view = getattr(vista, clase)(1, service)
+    qtbot.addWidget(view)
+
+    assert len(avisos) == 1 and "base de datos bloqueada" in avisos[0]
+    assert not view._loading
+
+    service.get_monthly_summary = resumen
+    view.load_data()
+    assert view._meses == ["2025-01", "2025-02", "2025-03"]
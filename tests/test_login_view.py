@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+pytest.importorskip("PyQt6")
+from pytestqt.qtbot import QtBot
+
+from presentation.workers.task_runner import TaskRunner
+
+
+def _login(qtbot: QtBot, authenticate, runner=None):
+    from presentation.views.login_view import LoginView
+    login = LoginView(authenticate, runner)
+    qtbot.addWidget(login)
+    login.username_input.setText("ana")
+    login.password_input.setText("clave")
+    return login
+
+
+def test_verification_runs_off_the_gui_thread_with_a_busy_state(qtbot: QtBot) -> None:
+    liberar = threading.Event()
+    hilos = []
+
+    def autenticar(username, password):
+        hilos.append(threading.get_ident())
+        liberar.wait(5)
+        return {"username": username}
+
+    login = _login(qtbot, autenticar, TaskRunner(max_threads=1))
+    login.login_button.click()
+
+    # El diálogo sigue respondiendo mientras bcrypt trabaja
+    qtbot.waitUntil(lambda: bool(hilos), timeout=2000)
+    assert hilos[0] != threading.get_ident()
+    assert not login.login_button.isEnabled() and not login.progress.isHidden()
+    assert login.result() != login.DialogCode.Accepted
+
+    with qtbot.waitSignal(login.accepted, timeout=2000):
+        liberar.set()
+    assert login.user == {"username": "ana"}
+    assert login.progress.isHidden()
+
+
+def test_invalid_credentials_keep_the_dialog_open(qtbot: QtBot) -> None:
+    login = _login(qtbot, lambda username, password: None)
+    login.login_button.click()
+
+    assert login.status_label.text() == "Credenciales inválidas."
+    assert login.user is None and login.result() != login.DialogCode.Accepted
+    assert login.login_button.isEnabled() and login.password_input.text() == ""
+
+
+def test_empty_fields_are_rejected_without_verifying(qtbot: QtBot) -> None:
+    llamadas = []
+    login = _login(qtbot, lambda *args: llamadas.append(args))
+    login.password_input.clear()
+    login.login_button.click()
+
+    assert llamadas == [] and login.status_label.text() == "Usuario y contraseña son obligatorios."
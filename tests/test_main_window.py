@@ -0,0 +1,139 @@
+import time
+from datetime import datetime
+
+import pytest
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+from pytestqt.qtbot import QtBot
+
+from application.services.reading_events import LECTURAS_RECARGADAS, ReadingChange
+from application.services.user_service import UserService
+from config import settings
+from domain.entities.user import User
+from infrastructure.database.repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+def services(conn, make_service):
+    """Servicios de lecturas (36 lecturas mensuales desde 2020) y de usuarios; el usuario 1 es admin."""
+    conn.execute("UPDATE usuarios SET rol = 'admin' WHERE id = 1")
+    conn.commit()
+    reading_service = make_service([
+        {"usuario_id": "1", "lectura_anterior": str(10 * i), "lectura_actual": str(10 * i + 10),
+         "fecha": f"{2020 + i // 12}-{i % 12 + 1:02d}-15 08:00:00"}
+        for i in range(36)
+    ])
+    return reading_service, UserService(UserRepository(conn), reading_service.logger, reading_service)
+
+
+def _user(rol: str = "admin") -> User:
+    return User(1, "A", "a", "x", rol, True, datetime(2025, 1, 1))
+
+
+def _window(qtbot: QtBot, services, rol: str = "admin"):
+    from presentation.views.main_window import MainWindow
+    reading_service, user_service = services
+    w = MainWindow(_user(rol), reading_service, user_service)
+    qtbot.addWidget(w)
+    return w, reading_service
+
+
+def test_only_dashboard_is_built_at_startup(qtbot: QtBot, services) -> None:
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+    w, _ = _window(qtbot, services)
+
+    assert w.history_view is None and w.graph_view is None and w.user_stats_view is None
+    assert w.findChildren(FigureCanvasQTAgg) == []
+    assert w.stacked_widget.count() == 4
+    assert w.stacked_widget.currentWidget() is w.dashboard_view
+
+
+def test_views_are_built_on_first_navigation(qtbot: QtBot, services) -> None:
+    from presentation.views.main_window import PAGE_GRAPH, PAGE_HISTORY, PAGE_USER_STATS
+    w, _ = _window(qtbot, services)
+    w.show()
+
+    w.graph_btn.click()
+    graph = w.graph_view
+    assert graph is not None and w.stacked_widget.currentWidget() is graph
+    assert w.stacked_widget.indexOf(graph) == PAGE_GRAPH
+    assert len(graph._bars) == min(36, settings.GRAPH_MAX_MONTHS or 36)
+
+    w.history_btn.click()
+    assert w.stacked_widget.indexOf(w.history_view) == PAGE_HISTORY
+    assert w.history_view.table.rowCount() == 36
+
+    # Volver a una página ya visitada no reconstruye la vista
+    assert w.show_page(PAGE_GRAPH) is graph
+    assert w.show_page(PAGE_USER_STATS) is w.user_stats_view
+    assert w.stacked_widget.count() == 4
+
+
+def test_non_admin_has_no_stats_page(qtbot: QtBot, services) -> None:
+    w, _ = _window(qtbot, services, rol="usuario")
+
+    assert w.stacked_widget.count() == 3
+    assert not hasattr(w, "stats_btn")
+
+
+def test_audit_page_is_admin_only_and_lazy(qtbot: QtBot, services) -> None:
+    from application.services.audit_service import AuditService
+    from presentation.views.main_window import MainWindow, PAGE_AUDIT
+    reading_service, user_service = services
+    audit_service = AuditService(reading_service.logger)
+
+    admin = MainWindow(_user(), reading_service, user_service, audit_service=audit_service)
+    qtbot.addWidget(admin)
+    assert admin.stacked_widget.count() == 5 and admin.audit_view is None
+    admin.audit_btn.click()
+    assert admin.stacked_widget.indexOf(admin.audit_view) == PAGE_AUDIT
+    assert admin.audit_view.table.rowCount() == 1  # la importación de lecturas
+
+    usuario = MainWindow(_user("usuario"), reading_service, user_service, audit_service=audit_service)
+    qtbot.addWidget(usuario)
+    assert usuario.stacked_widget.count() == 3 and not hasattr(usuario, "audit_btn")
+
+
+def test_hidden_views_reload_when_shown(qtbot: QtBot, services) -> None:
+    from presentation.views.main_window import PAGE_DASHBOARD, PAGE_HISTORY
+    w, _ = _window(qtbot, services)
+    w.show()
+    history = w.show_page(PAGE_HISTORY)
+    w.show_page(PAGE_DASHBOARD)
+
+    cargas = []
+    original = history.load_data
+    history.load_data = lambda: (cargas.append(1), original())
+    history.apply_change(ReadingChange(LECTURAS_RECARGADAS, 1))
+    assert cargas == []
+
+    w.show_page(PAGE_HISTORY)
+    assert cargas == [1]
+    w.show_page(PAGE_DASHBOARD)
+    w.show_page(PAGE_HISTORY)
+    assert cargas == [1]
+
+
+def test_lazy_startup_is_faster_than_building_every_view(qtbot: QtBot, services) -> None:
+    from presentation.views.main_window import MainWindow, PAGE_GRAPH, PAGE_HISTORY, PAGE_USER_STATS
+    reading_service, user_service = services
+    user = _user()
+
+    def arranque(todas: bool) -> float:
+        inicio = time.perf_counter()
+        w = MainWindow(user, reading_service, user_service)
+        if todas:
+            for page in (PAGE_HISTORY, PAGE_GRAPH, PAGE_USER_STATS):
+                w.show_page(page)
+        w.show()
+        qtbot.waitExposed(w)
+        transcurrido = time.perf_counter() - inicio
+        w.close()
+        w.deleteLater()
+        return transcurrido
+
+    arranque(True)  # calentamiento: importaciones y cachés de fuentes de matplotlib
+    perezoso = min(arranque(False) for _ in range(3))
+    completo = min(arranque(True) for _ in range(3))
+
+    assert perezoso < completo
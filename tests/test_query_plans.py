@@ -0,0 +1,104 @@
+import sqlite3
+
+import pytest
+from infrastructure.database.connection import MIGRATIONS, apply_schema
+from infrastructure.database.statements import STATEMENTS, sql
+
+# Consultas que recorren la tabla completa a propósito (re-tarificación y carga de tarifas)
+FULL_SCAN_ALLOWED = {
+    "lecturas.tarificacion",
+    "tarifas.todas",
+    # Mantenimiento del rollup mensual: reconstrucción y verificación completas
+    "lecturas_mensuales.vaciar",
+    "lecturas_mensuales.reconstruir",
+    "lecturas_mensuales.diferencias",
+}
+# Agregaciones por expresión (strftime, julianday): el índice no puede entregar los grupos ordenados
+GROUP_BY_SORT_ALLOWED = {
+    "lecturas.resumen_mensual",
+    "lecturas.serie_cubetas",
+    "lecturas_mensuales.reconstruir",
+    "lecturas_mensuales.diferencias",
+}
+
+# Proyecciones que usan las vistas, además de la proyección completa
+PROJECTIONS = {
+    "lecturas": [("id", "fecha", "consumo", "costo"), ("id", "lectura_actual", "consumo", "costo", "fecha")],
+    "usuarios": [("id", "nombre", "username", "rol", "activo", "fecha_creacion")],
+}
+
+
+def _plan(conn: sqlite3.Connection, text: str):
+    params = (1,) * text.count("?")
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {text}", params)]
+
+
+def _variants():
+    for name, template in STATEMENTS.items():
+        yield name, sql(name)
+        if "{columnas}" in template:
+            for columns in PROJECTIONS[name.split(".", 1)[0]]:
+                yield name, sql(name, columns)
+
+
+@pytest.mark.parametrize("name,text", list(_variants()))
+def test_repository_queries_avoid_sorts_and_full_scans(
+    conn: sqlite3.Connection, name: str, text: str
+) -> None:
+    plan = _plan(conn, text)
+
+    sorts = [step for step in plan if "TEMP B-TREE" in step]
+    if name in GROUP_BY_SORT_ALLOWED:
+        assert sorts == ["USE TEMP B-TREE FOR GROUP BY"], plan
+    else:
+        assert not sorts, plan
+    if name not in FULL_SCAN_ALLOWED:
+        assert not [step for step in plan if step.startswith("SCAN")], plan
+
+
+def test_active_user_lookup_uses_an_index(conn: sqlite3.Connection) -> None:
+    plan = _plan(conn, "SELECT id FROM usuarios WHERE activo = 1 AND id IN (?, ?, ?)")
+
+    assert all(step.startswith("SEARCH") for step in plan), plan
+
+
+def test_history_projection_is_served_by_covering_index(conn: sqlite3.Connection) -> None:
+    plan = _plan(conn, sql("lecturas.pagina_usuario_tras_clave", ("id", "fecha", "consumo", "costo")))
+
+    assert plan == ["SEARCH lecturas USING COVERING INDEX idx_lecturas_usuario_fecha (usuario_id=? AND fecha<?)"]
+
+
+def test_event_pages_use_the_index_of_their_filter(conn: sqlite3.Connection) -> None:
+
+    assert _plan(conn, sql("eventos.pagina_usuario")) == [
+        "SEARCH eventos USING INDEX idx_eventos_usuario_timestamp (usuario_id=? AND timestamp>? AND timestamp<?)"
+    ]
+    assert _plan(conn, sql("eventos.pagina_evento")) == [
+        "SEARCH eventos USING INDEX idx_eventos_evento_timestamp (evento=? AND timestamp>? AND timestamp<?)"
+    ]
+
+
+def test_migrations_replace_single_column_indexes() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE usuarios (id INTEGER PRIMARY KEY, nombre TEXT, username TEXT UNIQUE,
+            password_hash TEXT, rol TEXT, activo INTEGER, fecha_creacion DATETIME);
+        CREATE INDEX idx_usuarios_activo ON usuarios(activo);
+        CREATE TABLE lecturas (id INTEGER PRIMARY KEY, usuario_id INTEGER, lectura_actual REAL,
+            lectura_anterior REAL, consumo REAL, costo REAL, fecha DATETIME);
+        CREATE INDEX idx_lecturas_usuario_id ON lecturas(usuario_id);
+        INSERT INTO usuarios (id, nombre, username, password_hash, rol, activo) VALUES (1, 'A', 'a', 'x', 'usuario', 1);
+        INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha)
+            VALUES (1, 20, 10, 10, 3.3, '2025-01-05 10:00:00'), (1, 30, 20, 10, 3.3, '2025-01-20 10:00:00');
+        """
+    )
+
+    apply_schema(conn)
+
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_lecturas_usuario_fecha" in indexes
+    assert not {"idx_lecturas_usuario_id", "idx_usuarios_activo"} & indexes
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+    # El rollup mensual se llena con el histórico existente
+    assert conn.execute("SELECT mes, lecturas FROM lecturas_mensuales").fetchall() == [("2025-01", 2)]
@@ -0,0 +1,103 @@
+from application.services.reading_cache import ReadingCache
+from application.services.reading_events import LECTURAS_RECARGADAS
+from application.services.user_service import UserService
+from infrastructure.database.repositories.user_repository import UserRepository
+
+
+class _Reloj:
+    def __init__(self) -> None:
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+def test_entries_expire_after_ttl() -> None:
+    reloj = _Reloj()
+    cache = ReadingCache(max_usuarios=4, ttl=10, reloj=reloj)
+    cargas = []
+
+    def cargar():
+        cargas.append(1)
+        return len(cargas)
+
+    assert cache.get(1, "k", cargar) == 1
+    reloj.ahora = 9.9
+    assert cache.get(1, "k", cargar) == 1
+    reloj.ahora = 10.0
+    assert cache.get(1, "k", cargar) == 2
+    assert (cache.stats().aciertos, cache.stats().fallos) == (1, 2)
+
+
+def test_least_recently_used_user_is_evicted() -> None:
+    cache = ReadingCache(max_usuarios=2, ttl=60)
+    for user_id in (1, 2):
+        cache.get(user_id, "k", lambda: user_id)
+    cache.get(1, "k", lambda: None)  # 1 pasa a ser el más reciente
+    cache.get(3, "k", lambda: 3)
+
+    assert cache.peek(1, "k") == 1
+    assert cache.peek(2, "k") is None
+    assert cache.stats().usuarios == 2
+
+
+def test_load_racing_an_invalidation_is_not_stored() -> None:
+    cache = ReadingCache(max_usuarios=4, ttl=60)
+
+    def cargar_e_invalidar():
+        cache.invalidate(1)  # una escritura termina mientras se consulta
+        return "obsoleto"
+
+    assert cache.get(1, "k", cargar_e_invalidar) == "obsoleto"
+    assert cache.peek(1, "k") is None
+
+
+def test_repeated_view_loads_hit_the_cache(make_service) -> None:
+    service = make_service()
+    service.register_reading(1, "110", "100")
+    antes = service.cache_stats()
+
+    for _ in range(3):
+        service.get_all_readings_by_user(1, ("id", "consumo"))
+        service.get_monthly_summary(1)
+        service.get_last_reading_by_user(1)
+
+    stats = service.cache_stats()
+    assert stats.fallos - antes.fallos == 3
+    assert stats.aciertos - antes.aciertos == 6
+
+
+def test_writes_invalidate_and_keep_last_reading_current(make_service) -> None:
+    service = make_service()
+    assert service.get_last_reading_by_user(1) is None
+    service.register_reading(1, "110", "100")
+    assert service.cache.peek(1, "ultima").lectura_actual == 110
+    assert len(service.get_all_readings_by_user(1)) == 1
+
+    saved = service.register_reading(1, "130", "110")
+    fallos = service.cache_stats().fallos
+
+    assert service.get_last_reading_by_user(1) == saved
+    assert service.cache_stats().fallos == fallos  # actualizada en el sitio
+    assert len(service.get_all_readings_by_user(1)) == 2
+
+    service.delete_reading(saved.id)
+    assert len(service.get_all_readings_by_user(1)) == 1
+    assert service.get_last_reading_by_user(1).lectura_actual == 110
+
+    service.import_readings([{"usuario_id": "1", "lectura_anterior": "130", "lectura_actual": "150"}])
+    assert len(service.get_all_readings_by_user(1)) == 2
+
+
+def test_deleting_a_user_invalidates_and_notifies(conn, make_service) -> None:
+    service = make_service()
+    service.register_reading(1, "110", "100")
+    assert len(service.get_all_readings_by_user(1)) == 1
+    cambios = []
+    service.subscribe(cambios.append)
+
+    UserService(UserRepository(conn), service.logger, service).delete_user(1)
+
+    assert service.get_all_readings_by_user(1) == []
+    assert service.get_last_reading_by_user(1) is None
+    assert [(c.tipo, c.user_id) for c in cambios] == [(LECTURAS_RECARGADAS, 1)]
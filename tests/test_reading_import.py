@@ -0,0 +1,86 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from application.services.reading_service import ReadingService
+from application.services.tariff_calculator import TariffCalculator
+
+pytest.importorskip("numpy")  # la tarificación en lote usa numpy
+
+
+@pytest.fixture
+def service(conn, make_service) -> ReadingService:
+    """Servicio con el usuario 1 activo y el 2 inactivo."""
+    conn.execute(
+        "INSERT INTO usuarios (nombre, username, password_hash, rol, activo) VALUES ('B', 'b', 'x', 'usuario', 0)"
+    )
+    conn.commit()
+    return make_service()
+
+
+def test_import_prices_and_inserts_valid_rows(service: ReadingService) -> None:
+    rows = [
+        {"usuario_id": "1", "lectura_anterior": str(100 * i), "lectura_actual": str(100 * i + 37 + i),
+         "fecha": f"2025-01-{i + 1:02d} 10:00:00"}
+        for i in range(10)
+    ]
+
+    result = service.import_readings(rows, chunk_size=3)
+
+    assert (result.leidas, result.importadas, result.rechazadas) == (10, 10, 0)
+    readings = service.get_all_readings_by_user(1)
+    assert len(readings) == 10
+    assert readings[0].fecha == datetime(2025, 1, 10, 10, 0)
+    for r in readings:
+        assert r.costo == TariffCalculator.calcular_costo(r.consumo)
+
+
+def test_import_reports_rejected_rows(service: ReadingService) -> None:
+    rows = [
+        {"usuario_id": "1", "lectura_anterior": "10", "lectura_actual": "20"},
+        {"usuario_id": "1", "lectura_anterior": "abc", "lectura_actual": "20"},
+        {"usuario_id": "1", "lectura_anterior": "30", "lectura_actual": "20"},
+        {"usuario_id": "2", "lectura_anterior": "10", "lectura_actual": "20"},
+        {"usuario_id": "99", "lectura_anterior": "10", "lectura_actual": "20"},
+        {"usuario_id": "1", "lectura_anterior": "10", "lectura_actual": "20", "fecha": "ayer"},
+    ]
+
+    result = service.import_readings(rows)
+
+    assert (result.leidas, result.importadas, result.rechazadas) == (6, 1, 5)
+    assert result.motivos == {
+        "valor_no_numerico": 1,
+        "lectura_no_creciente": 1,
+        "usuario_invalido": 2,
+        "fecha_invalida": 1,
+    }
+    assert sorted(fila for fila, _ in result.errores) == [2, 3, 4, 5, 6]
+    assert service.get_last_reading_by_user(1).consumo == Decimal("10.0")
+
+
+def test_register_reading_rejects_more_than_three_kwh_decimals(service: ReadingService) -> None:
+    with pytest.raises(ValueError, match="3 decimales"):
+        service.register_reading(1, "100.1234", "0")
+
+    assert service.register_reading(1, "100.123", "0").consumo == Decimal("100.123")
+
+
+@pytest.mark.parametrize("actual, anterior", [("inf", "0"), ("10", "-Infinity"), ("nan", "0")])
+def test_register_reading_rejects_non_finite_values(service: ReadingService, actual: str, anterior: str) -> None:
+    with pytest.raises(ValueError, match="finitos"):
+        service.register_reading(1, actual, anterior)
+
+
+def test_reprice_prices_legacy_high_precision_readings_by_scalar_path(service: ReadingService) -> None:
+    service.register_reading(1, "150", "0")
+    # Guardada antes de limitar la precisión, con un costo desactualizado
+    with service.repository.db.writer() as conn:
+        conn.execute(
+            "INSERT INTO lecturas (usuario_id, lectura_actual, lectura_anterior, consumo, costo, fecha) "
+            "VALUES (1, 100.1234, 0, 100.1234, 0, '2025-01-01 10:00:00')"
+        )
+
+    assert service.reprice_readings() == 1
+
+    for r in service.get_all_readings_by_user(1):
+        assert r.costo == TariffCalculator.calcular_costo(r.consumo)
@@ -0,0 +1,121 @@
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+pytest.importorskip("PyQt6")
+from pytestqt.qtbot import QtBot
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QMessageBox
+
+from application.services.reading_events import LECTURA_AGREGADA, LECTURA_ELIMINADA, ReadingChange
+from domain.entities.reading import Reading
+from presentation.models.reading_table_model import COSTO_COLUMN, DELETE_COLUMN, ReadingTableModel
+
+
+def _lecturas(n: int) -> list:
+    """Filas de importación del usuario 1, una por día desde 2020-01-01."""
+    inicio = datetime(2020, 1, 1)
+    return [
+        {"usuario_id": "1", "lectura_anterior": str(10 * i), "lectura_actual": str(10 * i + 10),
+         "fecha": (inicio + timedelta(days=i)).isoformat(sep=" ")}
+        for i in range(n)
+    ]
+
+
+def test_model_fetches_pages_on_demand(qtbot: QtBot, make_service) -> None:
+    model = ReadingTableModel(1, make_service(_lecturas(450)), page_size=200)
+    model.reload()
+
+    assert model.rowCount() == 200 and model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 450 and not model.canFetchMore()
+
+    fechas = [model.reading_at(row).fecha for row in range(model.rowCount())]
+    assert fechas == sorted(fechas, reverse=True) and len(set(fechas)) == 450
+    assert model.index(0, 0).data() == "2021-03-25 00:00"
+    assert "kWh" in model.index(0, COSTO_COLUMN).data(Qt.ItemDataRole.ToolTipRole)
+
+
+def test_cost_tooltip_never_queries_tariffs_from_data(qtbot: QtBot, make_service, monkeypatch) -> None:
+    service = make_service(_lecturas(3))
+    model = ReadingTableModel(1, service)
+    service.tariffs.reload()
+    model.reload()
+    assert service.tariffs.compiladas  # la carga de la página ya las compiló
+
+    service.tariffs.reload()
+    consultas = []
+    get_all = service.tariffs.repository.get_all
+    monkeypatch.setattr(service.tariffs.repository, "get_all", lambda: consultas.append(1) or get_all())
+    enviadas = []
+    submit = model.runner.submit
+    monkeypatch.setattr(model.runner, "submit", lambda fn, *a, **kw: enviadas.append(fn))
+
+    assert model.index(0, COSTO_COLUMN).data(Qt.ItemDataRole.ToolTipRole) is None
+    assert consultas == [] and enviadas == [service.preload_tariffs]
+
+    submit(enviadas[0])
+    assert "kWh" in model.index(0, COSTO_COLUMN).data(Qt.ItemDataRole.ToolTipRole)
+    assert consultas == [1]
+
+
+def test_changes_outside_the_loaded_pages_wait_for_fetch(qtbot: QtBot, make_service) -> None:
+    service = make_service(_lecturas(450))
+    model = ReadingTableModel(1, service, page_size=200)
+    model.reload()
+    antigua = replace(model.reading_at(199), id=10_000, fecha=datetime(2019, 1, 1))
+
+    model.apply_change(ReadingChange(LECTURA_AGREGADA, 1, antigua))
+    assert model.rowCount() == 200
+
+    saved = service.register_reading(1, "5000", "4500")
+    model.apply_change(ReadingChange(LECTURA_AGREGADA, 1, saved))
+    assert model.rowCount() == 201 and model.reading_at(0).id == saved.id
+
+
+@pytest.fixture
+def zona_con_cambio_de_horario(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset no existe en esta plataforma")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_changes_keep_date_order_across_a_dst_change(qtbot: QtBot, make_service, zona_con_cambio_de_horario) -> None:
+    model = ReadingTableModel(1, make_service())
+    model.reload()
+    base = Reading(None, 1, Decimal("10"), Decimal("0"), Decimal("10"), Decimal("4.00"))
+    # 02:30 no existe en la zona local ese día: en epoch cae después de las 03:10
+    antes = replace(base, id=1, fecha=datetime(2025, 3, 9, 2, 30))
+    despues = replace(base, id=2, fecha=datetime(2025, 3, 9, 3, 10))
+
+    model.apply_change(ReadingChange(LECTURA_AGREGADA, 1, antes))
+    model.apply_change(ReadingChange(LECTURA_AGREGADA, 1, despues))
+    assert [model.reading_at(row).id for row in range(2)] == [2, 1]
+
+    model.apply_change(ReadingChange(LECTURA_ELIMINADA, 1, antes))
+    assert model.rowCount() == 1 and model.reading_at(0).id == 2
+
+
+def test_delete_delegate_removes_the_clicked_row(qtbot: QtBot, make_service, monkeypatch) -> None:
+    from presentation.views.dashboard_view import DashboardView
+
+    service = make_service(_lecturas(5))
+    view = DashboardView(1, service)
+    qtbot.addWidget(view)
+    view.show()
+    monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.StandardButton.Yes)
+    newest = view.model.reading_at(0)
+
+    rect = view.table.visualRect(view.model.index(0, DELETE_COLUMN))
+    qtbot.mouseClick(view.table.viewport(), Qt.MouseButton.LeftButton, pos=rect.center())
+
+    assert view.model.rowCount() == 4
+    assert view.model.reading_at(0).id != newest.id
+    assert service.repository.get_by_id(newest.id) is None
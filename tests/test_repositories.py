@@ -0,0 +1,245 @@
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from domain.entities.reading import Reading
+from infrastructure.database.repositories.reading_repository import ReadingRepository
+from infrastructure.database.repositories.user_repository import UserRepository
+from infrastructure.database.statements import sql
+
+
+def _reading(actual: str, anterior: str) -> Reading:
+    consumo = Decimal(actual) - Decimal(anterior)
+    return Reading(id=None, user_id=1, lectura_actual=Decimal(actual),
+                   lectura_anterior=Decimal(anterior), consumo=consumo, costo=consumo)
+
+
+def test_reading_row_factory_maps_full_rows(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    saved = repo.save(_reading("150.5", "100"))
+
+    found = repo.get_by_id(saved.id)
+
+    assert found == saved
+    assert repo.get_by_user_id(1) == [saved]
+    assert repo.get_last_by_user(1) == saved
+    assert repo.get_by_id(999) is None
+
+
+def test_reading_projection_leaves_unloaded_fields_empty(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    repo.save(_reading("150.5", "100"))
+
+    (reading,) = repo.get_by_user_id(1, columns=("id", "consumo", "fecha"))
+
+    assert reading.consumo == Decimal("50.5")
+    assert reading.fecha is not None
+    assert reading.lectura_anterior is None and reading.costo is None
+
+
+def test_user_projection_skips_password_hash(conn: sqlite3.Connection) -> None:
+    repo = UserRepository(conn)
+
+    (full,) = repo.get_all_active()
+    (listed,) = repo.get_all_active(columns=("id", "nombre", "username"))
+
+    assert full.password_hash == "hash" and full.activo is True
+    assert (listed.id, listed.username, listed.password_hash) == (1, "a", None)
+
+
+def test_active_ids_lookup_stays_under_the_parameter_limit(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO usuarios (nombre, username, password_hash, rol, activo) VALUES ('B', 'b', 'x', 'usuario', 0)"
+    )
+    conn.execute(
+        "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('C', 'c', 'x', 'usuario')"
+    )
+    # Límite de compilaciones de SQLite anteriores a 3.32
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+
+    assert UserRepository(conn).get_active_ids(range(1, 5001)) == {1, 3}
+    assert UserRepository(conn).get_active_ids([]) == set()
+
+
+def test_named_statements_are_rendered_once() -> None:
+    assert sql("lecturas.por_usuario") is sql("lecturas.por_usuario")
+    assert sql("lecturas.por_id", ("id",)) == "SELECT id FROM lecturas WHERE id = ?"
+    with pytest.raises(ValueError):
+        sql("usuarios.por_id", ("id", "clave"))
+
+
+def _seed_with_ties(repo: ReadingRepository) -> None:
+    readings = [_reading(str(100 + i), "100") for i in range(1, 26)]
+    for i, r in enumerate(readings):
+        r.fecha = datetime(2025, 1, 1 + i // 5, 8, 0)  # cinco lecturas por fecha
+    repo.save_many(readings)
+
+
+def test_keyset_pages_cover_every_reading_once(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    _seed_with_ties(repo)
+
+    ids = []
+    page = repo.get_page(1, limit=7)
+    while page:
+        ids.extend(r.id for r in page)
+        page = repo.get_page(1, page[-1].fecha, 7, before_id=page[-1].id)
+
+    assert ids == [r.id for r in repo.get_by_user_id(1)]
+    assert sorted(ids) == list(range(1, 26))
+
+
+def test_page_before_fecha_excludes_that_instant(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    _seed_with_ties(repo)
+
+    page = repo.get_page(1, before_fecha=datetime(2025, 1, 3, 8, 0), limit=100)
+
+    assert {r.fecha.day for r in page} == {1, 2}
+
+
+def test_iter_by_user_streams_in_batches(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    _seed_with_ties(repo)
+
+    streamed = list(repo.iter_by_user(1, batch_size=4, columns=("consumo",)))
+
+    assert [r.id for r in streamed] == [r.id for r in repo.get_by_user_id(1)]
+    assert streamed[0].consumo == Decimal("25") and streamed[0].costo is None
+
+
+def test_monthly_summary_groups_in_sql(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    lecturas = [
+        ("110.5", "100", datetime(2025, 1, 3)),
+        ("130", "110.5", datetime(2025, 1, 31, 23, 59)),
+        ("150", "130", datetime(2025, 2, 1)),
+        ("170", "150", datetime(2025, 4, 15)),
+    ]
+    repo.save_many([
+        Reading(id=None, user_id=1, lectura_actual=Decimal(a), lectura_anterior=Decimal(b),
+                consumo=Decimal(a) - Decimal(b), costo=Decimal("1.10"), fecha=fecha)
+        for a, b, fecha in lecturas
+    ])
+
+    resumen = repo.monthly_summary(1)
+
+    assert [(m.mes, m.consumo, m.costo, m.lecturas) for m in resumen] == [
+        ("2025-01", Decimal("30.000"), Decimal("2.20"), 2),
+        ("2025-02", Decimal("20.000"), Decimal("1.10"), 1),
+        ("2025-04", Decimal("20.000"), Decimal("1.10"), 1),
+    ]
+    rango = repo.monthly_summary(1, desde=datetime(2025, 1, 31), hasta=datetime(2025, 4, 1))
+    assert [(m.mes, m.lecturas) for m in rango] == [("2025-01", 1), ("2025-02", 1)]
+    assert repo.monthly_summary(2) == []
+
+
+def test_monthly_rollup_follows_inserts_updates_and_deletes(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    repo.save_many([
+        Reading(id=None, user_id=1, lectura_actual=Decimal("10"), lectura_anterior=Decimal("0"),
+                consumo=Decimal("10"), costo=Decimal("3.30"), fecha=datetime(2025, 3, d))
+        for d in (1, 2, 3)
+    ])
+    ultima, _, primera = repo.get_page(1, limit=3)
+
+    conn.execute("UPDATE lecturas SET fecha = '2025-04-01 00:00:00', costo = 5 WHERE id = ?", (primera.id,))
+    conn.commit()
+    repo.delete(ultima.id)
+
+    assert [(m.mes, m.consumo, m.costo, m.lecturas) for m in repo.monthly_summary(1)] == [
+        ("2025-03", Decimal("10.000"), Decimal("3.30"), 1),
+        ("2025-04", Decimal("10.000"), Decimal("5.00"), 1),
+    ]
+    assert [m.mes for m in repo.monthly_summary(1, desde=datetime(2025, 4, 1))] == ["2025-04"]
+    assert repo.check_monthly_rollup() == []
+
+
+def test_monthly_rollup_check_and_rebuild(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    repo.save_many([
+        Reading(id=None, user_id=1, lectura_actual=Decimal("10"), lectura_anterior=Decimal("0"),
+                consumo=Decimal("10"), costo=Decimal("3.30"), fecha=datetime(2025, m, 1))
+        for m in (1, 2)
+    ])
+    conn.execute("UPDATE lecturas_mensuales SET lecturas = 5 WHERE mes = '2025-01'")
+    conn.execute("DELETE FROM lecturas_mensuales WHERE mes = '2025-02'")
+    conn.commit()
+
+    assert [(u, mes, lecturas) for u, mes, _, _, lecturas in repo.check_monthly_rollup()] == [
+        (1, "2025-01", -4), (1, "2025-02", 1),
+    ]
+    assert repo.rebuild_monthly_rollup() == 2
+    assert repo.check_monthly_rollup() == []
+
+
+def _seed_hourly(repo: ReadingRepository, horas: int, pico: int) -> None:
+    inicio = datetime(2024, 1, 1)
+    repo.save_many([
+        replace(_reading(str(100 if h == pico else 1 + h % 3), "0"), fecha=inicio + timedelta(hours=h))
+        for h in range(horas)
+    ])
+
+
+def test_consumption_series_returns_raw_points_when_they_fit(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    _seed_hourly(repo, 48, pico=10)
+
+    puntos = repo.consumption_series(1, datetime(2024, 1, 1, 6), datetime(2024, 1, 1, 12), 100)
+
+    assert [fecha.hour for fecha, _ in puntos] == [6, 7, 8, 9, 10, 11]
+    assert dict(puntos)[datetime(2024, 1, 1, 10)] == 100.0
+    assert repo.date_range(1) == (datetime(2024, 1, 1), datetime(2024, 1, 2, 23))
+    assert repo.date_range(2) is None
+
+
+def test_consumption_series_downsamples_with_min_max_buckets(conn: sqlite3.Connection) -> None:
+    repo = ReadingRepository(conn)
+    _seed_hourly(repo, 24 * 365, pico=5000)
+
+    puntos = repo.consumption_series(1, datetime(2024, 1, 1), datetime(2025, 1, 1), 200)
+
+    assert 100 < len(puntos) <= 200
+    assert [fecha for fecha, _ in puntos] == sorted(fecha for fecha, _ in puntos)
+    # La decimación min/max conserva el pico y el mínimo de todo el rango
+    assert max(c for _, c in puntos) == 100.0
+    assert min(c for _, c in puntos) == 1.0
+
+
+def test_legacy_repositories_share_one_pooled_connection(tmp_path, monkeypatch) -> None:
+    from infrastructure.database import pool
+    from infrastructure.repositories.sqlite_reading_repository import SQLiteReadingRepository
+    from infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+    abiertas = []
+    original = pool.get_db_connection
+    monkeypatch.setattr(pool, "get_db_connection", lambda *a, **k: abiertas.append(k) or original(*a, **k))
+
+    users = SQLiteUserRepository(str(tmp_path / "app.db"))
+    users.create_tables()
+    user = users.add_user("Ana", "ana", "x")
+    readings = SQLiteReadingRepository(str(tmp_path / "app.db"))
+    for i in range(20):
+        readings.add_reading(user.id, Decimal(10 * i + 10), Decimal(10 * i), Decimal(10), Decimal("3.30"))
+        assert users.get_by_username("ana").id == user.id
+    assert len(readings.get_by_user(user.id)) == 20
+
+    # Un escritor y un lector por repositorio, no una conexión por llamada
+    assert len(abiertas) == 4
+    users.close()
+    readings.close()
+
+
+def test_legacy_user_repository_builds_valid_users() -> None:
+    from infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+    repo = SQLiteUserRepository(connection=sqlite3.connect(":memory:"))
+    repo.create_tables()
+
+    user = repo.add_user("Ana", "ana", "x", role="admin")
+
+    assert (user.nombre, user.rol, user.activo) == ("Ana", "admin", True)
+    assert user.fecha_creacion is not None
+    assert repo.get_by_username("ana") == user
+    with pytest.raises(ValueError):
+        repo.add_user("Otra", "ana", "y")
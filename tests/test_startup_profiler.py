@@ -0,0 +1,83 @@
+import builtins
+import subprocess
+import sys
+from pathlib import Path
+
+from infrastructure.diagnostics.startup_profiler import StartupProfiler
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class _Reloj:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_phases_and_marks_are_reported_in_order() -> None:
+    reloj = _Reloj()
+    profiler = StartupProfiler(reloj=reloj)
+    with profiler.phase("init_db"):
+        reloj.t = 0.25
+    profiler.mark("login visible")
+
+    informe = profiler.report()
+
+    assert "init_db" in informe and "250.0" in informe
+    assert informe.index("init_db") < informe.index("login visible")
+
+
+def test_imports_are_measured_with_self_time(tmp_path, monkeypatch) -> None:
+    (tmp_path / "perfil_padre.py").write_text("import perfil_hijo\n")
+    (tmp_path / "perfil_hijo.py").write_text("VALOR = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    original = builtins.__import__
+
+    profiler = StartupProfiler()
+    profiler.start()
+    try:
+        import perfil_padre  # noqa: F401
+        import perfil_padre  # noqa: F401,F811  (ya cargado: no se vuelve a medir)
+    finally:
+        profiler.stop()
+        sys.modules.pop("perfil_padre", None)
+        sys.modules.pop("perfil_hijo", None)
+
+    assert builtins.__import__ is original
+    medidos = {modulo: (acumulado, propio) for modulo, acumulado, propio in profiler.imports()}
+    assert set(medidos) == {"perfil_padre", "perfil_hijo"}
+    acumulado, propio = medidos["perfil_padre"]
+    assert acumulado >= medidos["perfil_hijo"][0]
+    assert propio == acumulado - medidos["perfil_hijo"][0]
+    assert "perfil_padre" in profiler.report()
+
+
+def test_disabled_profiler_is_a_noop(tmp_path) -> None:
+    original = builtins.__import__
+    profiler = StartupProfiler(enabled=False)
+    profiler.start()
+    with profiler.phase("fase"):
+        pass
+    profiler.mark("marca")
+
+    assert builtins.__import__ is original
+    assert "fase" not in profiler.report()
+    profiler.stop()
+
+
+def test_login_does_not_import_heavy_modules() -> None:
+    codigo = (
+        "import sys, main\n"
+        "from infrastructure.auth.auth_service import AuthService\n"
+        "from presentation.views.login_view import LoginView\n"
+        "from presentation.views.main_window import MainWindow\n"
+        "print(sorted(m for m in ('matplotlib', 'bcrypt', 'numpy',"
+        " 'presentation.views.graph_view') if m in sys.modules))\n"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert salida.strip() == "[]"
@@ -0,0 +1,66 @@
+import random
+from decimal import Decimal
+
+import pytest
+from application.services.tariff_calculator import TariffCalculator
+
+np = pytest.importorskip("numpy")  # skip tests if numpy not installed
+
+
+def test_batch_matches_scalar_on_random_inputs() -> None:
+    rng = random.Random(20251018)
+    consumos = [
+        Decimal(rng.randint(0, 2_000_000)) / Decimal(10 ** rng.randint(0, 3))
+        for _ in range(5000)
+    ]
+
+    costos = TariffCalculator.calcular_costos(consumos)
+
+    assert costos.dtype == np.int64
+    for consumo, centavos in zip(consumos, costos):
+        assert TariffCalculator.calcular_costo(consumo) == Decimal(int(centavos)).scaleb(-2)
+
+
+def test_batch_matches_scalar_on_tier_boundaries() -> None:
+    consumos = [Decimal(v) for v in (
+        "0", "0.005", "0.125", "100", "100.999", "101", "150", "151",
+        "200.5", "500", "501", "501.001", "12345.678",
+    )]
+
+    costos = TariffCalculator.calcular_costos(consumos)
+
+    esperados = [TariffCalculator.calcular_costo(c) for c in consumos]
+    assert [Decimal(int(c)).scaleb(-2) for c in costos] == esperados
+
+
+def test_batch_accepts_floats_and_clamps_non_positive() -> None:
+    costos = TariffCalculator.calcular_costos([50.0, 150.3, -10, 0])
+
+    assert costos.tolist() == [2000, 10449, 0, 0]
+
+
+def test_batch_rejects_excess_decimals() -> None:
+    with pytest.raises(ValueError):
+        TariffCalculator.calcular_costos([Decimal("1.2345")])
+
+
+def test_batch_scales_large_consumptions_exactly() -> None:
+    # En float64, 123456789012.345 * 1000 no es entero y el lote lo rechazaba
+    consumos = [Decimal("123456789012.345"), Decimal("900719925474.993")]
+
+    costos = TariffCalculator.calcular_costos(consumos)
+
+    assert [Decimal(int(c)).scaleb(-2) for c in costos] == [
+        TariffCalculator.calcular_costo(c) for c in consumos
+    ]
+
+
+@pytest.mark.parametrize("consumo", [Decimal("Infinity"), float("nan")])
+def test_batch_rejects_non_finite(consumo) -> None:
+    with pytest.raises(ValueError):
+        TariffCalculator.calcular_costos([consumo])
+
+
+def test_batch_rejects_consumptions_that_overflow_int64() -> None:
+    with pytest.raises(ValueError, match="demasiado grande"):
+        TariffCalculator.calcular_costos([Decimal("9007199254740.993")])
@@ -0,0 +1,75 @@
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from infrastructure.database.connection import apply_schema
+from infrastructure.database.repositories.tariff_repository import TariffRepository
+from application.services.tariff_calculator import TariffCalculator
+from application.services.tariff_schedule_service import TariffScheduleService
+
+TRAMOS_2026 = [
+    (Decimal("0"), Decimal("99"), Decimal("0.50")),
+    (Decimal("100"), Decimal("Infinity"), Decimal("2.00")),
+]
+TRAMOS_2027 = [(Decimal("0"), Decimal("Infinity"), Decimal("3.00"))]
+
+
+def _service() -> TariffScheduleService:
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    service = TariffScheduleService(TariffRepository(conn))
+    service.add_schedule("Tarifa 2027", date(2027, 1, 1), TRAMOS_2027)
+    service.add_schedule("Tarifa 2026", date(2026, 1, 1), TRAMOS_2026)
+    return service
+
+
+def test_schedules_round_trip_in_effective_date_order() -> None:
+    service = _service()
+
+    schedules = service.get_schedules()
+
+    assert [s.nombre for s in schedules] == ["Tarifa 2026", "Tarifa 2027"]
+    assert schedules[0].tramos == TRAMOS_2026
+
+
+def test_schedule_is_selected_by_reading_date() -> None:
+    service = _service()
+    consumo = Decimal("150")
+
+    assert service.calcular_costo(consumo, date(2025, 12, 31)) == TariffCalculator.calcular_costo(consumo)
+    assert service.calcular_costo(consumo, datetime(2026, 1, 1, 0, 0)) == Decimal("150.00")
+    assert service.calcular_costo(consumo, date(2027, 6, 1)) == Decimal("450.00")
+
+
+def test_compiled_tables_are_cached_until_a_schedule_is_added() -> None:
+    service = _service()
+    antes = service.tabla_para(date(2026, 5, 1))
+
+    assert service.tabla_para(date(2026, 6, 1)) is antes
+
+    service.add_schedule("Tarifa 2026b", date(2026, 3, 1), TRAMOS_2027)
+    assert service.tabla_para(date(2026, 5, 1)) is not antes
+
+
+def test_invalid_schedules_are_rejected() -> None:
+    service = _service()
+
+    with pytest.raises(ValueError):
+        service.add_schedule("Sin tope", date(2028, 1, 1), [(Decimal("0"), Decimal("10"), Decimal("1"))])
+    with pytest.raises(ValueError):
+        service.add_schedule("Repetida", date(2027, 1, 1), TRAMOS_2027)
+
+
+def test_bulk_repricing_matches_scalar_per_date() -> None:
+    pytest.importorskip("numpy")
+    service = _service()
+    rng = random.Random(3)
+    fechas = [datetime(2025, 6, 1) + timedelta(days=rng.randint(0, 900)) for _ in range(2000)]
+    consumos = [Decimal(rng.randint(0, 80000)) / 100 for _ in fechas]
+
+    costos = service.calcular_costos(consumos, fechas)
+
+    for consumo, fecha, centavos in zip(consumos, fechas, costos):
+        assert service.calcular_costo(consumo, fecha) == Decimal(int(centavos)).scaleb(-2)
@@ -0,0 +1,66 @@
+import random
+from decimal import Decimal
+from application.services.tariff_calculator import TablaTarifaria, TariffCalculator
+
+
+def _costo_por_recorrido(consumo_kwh: Decimal) -> Decimal:
+    """Algoritmo original (recorrido de tramos), usado como referencia."""
+    if consumo_kwh <= 0:
+        return Decimal("0.00")
+    costo_total = Decimal("0.00")
+    consumo_restante = consumo_kwh
+    for tramo_min, tramo_max, tarifa in TariffCalculator.TRAMOS:
+        if consumo_restante <= 0:
+            break
+        if tramo_max == Decimal("Infinity"):
+            consumo_en_tramo = consumo_restante
+        else:
+            consumo_en_tramo = min(consumo_restante, tramo_max - tramo_min + 1)
+        costo_total += consumo_en_tramo * tarifa
+        consumo_restante -= consumo_en_tramo
+    return costo_total.quantize(Decimal("0.01"))
+
+
+def test_cumulative_table_matches_tier_walk() -> None:
+    rng = random.Random(7)
+    consumos = [Decimal(rng.randint(-100, 1_500_000)) / Decimal(10 ** rng.randint(0, 4))
+                for _ in range(5000)]
+    consumos += [Decimal(v) for v in ("100", "101", "150", "151", "500", "501", "100.5")]
+
+    for consumo in consumos:
+        assert TariffCalculator.calcular_costo(consumo) == _costo_por_recorrido(consumo)
+
+
+def test_table_accumulates_cost_at_tier_starts() -> None:
+    tabla = TablaTarifaria(TariffCalculator.TRAMOS)
+
+    assert tabla.limites[:3] == [Decimal("0"), Decimal("101"), Decimal("151")]
+    assert tabla.acumulados[:3] == [Decimal("0.00"), Decimal("40.40"), Decimal("105.40")]
+    assert tabla.anchos[-1] is None
+    assert tabla.indice_tramo(Decimal("101")) == 1
+
+
+def test_table_is_compiled_once() -> None:
+    assert TariffCalculator.tabla() is TariffCalculator.tabla()
+
+
+def test_breakdown_adds_up_to_total() -> None:
+    consumo = Decimal("160.5")
+
+    desglose = TariffCalculator.desglose(consumo)
+
+    assert [d.consumo for d in desglose] == [Decimal("101"), Decimal("50"), Decimal("9.5")]
+    assert [d.costo for d in desglose] == [Decimal("40.40"), Decimal("65.00"), Decimal("16.625")]
+    assert sum(d.costo for d in desglose).quantize(Decimal("0.01")) == TariffCalculator.calcular_costo(consumo)
+    assert TariffCalculator.desglose(Decimal("0")) == ()
+
+
+def test_breakdown_is_memoized() -> None:
+    tabla = TablaTarifaria(TariffCalculator.TRAMOS)
+
+    primero = tabla.desglose(Decimal("230"))
+    segundo = tabla.desglose(Decimal("230"))
+
+    assert primero is segundo
+    info = tabla.desglose_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+pytest.importorskip("PyQt6")
+from pytestqt.qtbot import QtBot
+
+from application.services.reading_service import ReadingService
+from infrastructure.database.connection import init_db
+from infrastructure.database.pool import ConnectionPool
+from infrastructure.logging.activity_logger import ActivityLogger
+from presentation.workers.task_runner import TaskRunner
+
+
+def test_results_are_delivered_on_the_gui_thread(qtbot: QtBot) -> None:
+    runner = TaskRunner(max_threads=2)
+    results = []
+
+    runner.submit(
+        lambda: threading.get_ident(),
+        on_result=lambda worker: results.append((worker, threading.get_ident())),
+    )
+
+    qtbot.waitUntil(lambda: bool(results), timeout=2000)
+    worker, receiver = results[0]
+    assert worker != receiver == threading.get_ident()
+
+
+def test_superseded_requests_are_skipped_or_discarded(qtbot: QtBot) -> None:
+    runner = TaskRunner(max_threads=1)
+    release = threading.Event()
+    ran, delivered = [], []
+
+    def work(name):
+        ran.append(name)
+        if name == "en curso":
+            release.wait(2)
+        return name
+
+    runner.submit(work, "en curso", key="k", on_result=delivered.append)
+    qtbot.waitUntil(lambda: bool(ran), timeout=2000)
+    runner.submit(work, "en cola", key="k", on_result=delivered.append)
+    runner.submit(work, "última", key="k", on_result=delivered.append)
+    release.set()
+
+    assert runner.wait_for_done(2000)
+    qtbot.waitUntil(lambda: bool(delivered), timeout=2000)
+    qtbot.wait(50)
+    assert ran == ["en curso", "última"]
+    assert delivered == ["última"]
+    assert runner.stale == 2
+
+
+def test_errors_go_to_the_error_callback(qtbot: QtBot) -> None:
+    runner = TaskRunner()
+    errors = []
+
+    def fail():
+        raise ValueError("lectura inválida")
+
+    runner.submit(fail, on_result=pytest.fail, on_error=errors.append)
+
+    qtbot.waitUntil(lambda: bool(errors), timeout=2000)
+    assert str(errors[0]) == "lectura inválida"
+
+
+def test_reading_viewmodel_saves_in_the_background(qtbot: QtBot, tmp_path) -> None:
+    from presentation.viewmodels.reading_viewmodel import ReadingViewModel
+
+    db_path = str(tmp_path / "app.db")
+    init_db(db_path)
+    pool = ConnectionPool(db_path)
+    with pool.writer() as conn:
+        conn.execute(
+            "INSERT INTO usuarios (nombre, username, password_hash, rol) VALUES ('A', 'a', 'x', 'usuario')"
+        )
+    service = ReadingService(pool, ActivityLogger(str(tmp_path / "logs.csv")))
+    writers = []
+    service.subscribe(lambda change: writers.append(threading.get_ident()))
+    vm = ReadingViewModel(1, service, TaskRunner(max_threads=2))
+
+    with qtbot.waitSignal(vm.reading_saved, timeout=2000) as saved:
+        vm.save_reading(100.0, 150.5)
+    with qtbot.waitSignal(vm.last_reading_loaded, timeout=2000) as last:
+        vm.load_last_reading()
+    with qtbot.waitSignal(vm.error_occurred, timeout=2000) as error:
+        vm.save_reading(200.0, 200.0)
+
+    assert saved.args[0].consumo == 50.5
+    assert last.args == [150.5]
+    assert writers and writers[0] != threading.get_ident()
+    assert "mayor" in error.args[0]
+    vm.runner.wait_for_done()
+    pool.close()